@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 """Backfill historical RA events for training.
 
-Wipes raw_events and events tables, then scrapes RA from 60 days ago
-plus all other sources (upcoming only), deduplicates everything together,
-and stores canonical events.
+Wipes raw_events and events tables, then scrapes RA from 60 days ago in
+date shards (stored as each shard lands), plus all other sources (upcoming
+only), and stores deduplicated canonical events.
+
+Progress is checkpointed per shard; if the run crashes, rerunning this
+script resumes from the last completed shard, over the date range the
+checkpoint was started with, without wiping the tables. A checkpoint that
+can't be resumed stops the script rather than being wiped over; pass
+--fresh to discard it and start again.
+
+    uv run python scripts/backfill_ra.py [--fresh]
 """
 
 import asyncio
@@ -14,48 +22,78 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from src import db
+from src.scrapers.backfill import DEFAULT_CHECKPOINT, Checkpoint, backfill_ra
 from src.scrapers.ra import RAScraper
-from src.scrapers.runner import deduplicate_and_store, run_all_scrapers
-
-
-async def main():
-    # Step 1: Wipe existing data
-    print("Clearing tables...")
-    client = db.get_client()
-    client.table("recommendations").delete().gte("created_at", "2000-01-01").execute()
-    client.table("events").delete().gte("created_at", "2000-01-01").execute()
-    client.table("raw_events").delete().gte("created_at", "2000-01-01").execute()
-    print("Cleared.")
-
-    # Step 2: Scrape RA with historical date range
-    from_date = date.today() - timedelta(days=60)
-    print(f"Scraping RA from {from_date}...")
-    scraper = RAScraper()
+from src.scrapers.runner import (
+    ALL_SCRAPERS,
+    deduplicate_and_store,
+    run_all_scrapers,
+    shutdown_dedup_executor,
+)
+from src.scrapers.transport import close_transport
+
+DAYS_BACK = 60
+SHARD_DAYS = 7
+SHARD_CONCURRENCY = 3
+
+
+async def main(fresh: bool = False):
+    if fresh:
+        DEFAULT_CHECKPOINT.unlink(missing_ok=True)
+    saved = Checkpoint.saved_range(DEFAULT_CHECKPOINT)
+    if saved:
+        from_date, to_date = saved
+    else:
+        from_date = date.today() - timedelta(days=DAYS_BACK)
+        to_date = date.today() + timedelta(days=14)
+    checkpoint = Checkpoint(DEFAULT_CHECKPOINT, from_date, to_date, SHARD_DAYS)
+    if checkpoint.mismatched:
+        sys.exit(
+            f"Checkpoint {DEFAULT_CHECKPOINT} can't be resumed; rerun with --fresh "
+            "to wipe the tables and start over."
+        )
+
+    # Step 1: Wipe existing data (only on a fresh run — never mid-backfill)
+    if checkpoint.has_progress():
+        print(f"Resuming: {len(checkpoint.completed)} shards already stored.")
+    else:
+        print("Clearing tables...")
+        db.clear_event_tables()
+        print("Cleared.")
+
     try:
-        ra_historical = await scraper.scrape(from_date=from_date)
-    finally:
-        await scraper.close()
-    print(f"Got {len(ra_historical)} RA events (historical + upcoming)")
+        # Step 2: Scrape RA shard by shard, storing each one as it completes
+        print(f"Scraping RA from {from_date} to {to_date} in {SHARD_DAYS}-day shards...")
+        await backfill_ra(
+            from_date,
+            to_date,
+            shard_days=SHARD_DAYS,
+            concurrency=SHARD_CONCURRENCY,
+            checkpoint=checkpoint,
+        )
+        print(f"RA done: {checkpoint.stored} canonical events stored.")
 
-    # Step 3: Scrape all other sources (upcoming only)
-    print("Scraping all sources (upcoming)...")
-    all_events = await run_all_scrapers()
+        # Step 3: Scrape all other sources (upcoming only) and dedup against RA
+        print("Scraping other sources (upcoming)...")
+        others = [cls for cls in ALL_SCRAPERS if cls is not RAScraper]
+        all_events = await run_all_scrapers(others)
+    finally:
+        await close_transport()
+        shutdown_dedup_executor()
 
-    # Replace RA's upcoming-only results with our historical+upcoming set
-    all_events["ra"] = ra_historical
     total = sum(len(v) for v in all_events.values())
     print(f"Total scraped: {total} events from {len(all_events)} sources")
 
-    # Step 4: Deduplicate and store everything as canonical events
     print("Deduplicating and storing...")
-    new_count = deduplicate_and_store(all_events)
-    print(f"Done! {new_count} canonical events stored.")
+    new_count = await asyncio.to_thread(deduplicate_and_store, all_events)
+    print(f"Done! {checkpoint.stored + new_count} canonical events stored.")
+    checkpoint.clear()
 
     # Verify
-    past = db.get_past_events(days_back=60)
-    upcoming = db.get_upcoming_events()
+    past = await asyncio.to_thread(db.get_past_events, days_back=DAYS_BACK, profile="id-only")
+    upcoming = await asyncio.to_thread(db.get_upcoming_events, profile="id-only")
     print(f"\nResult: {len(past)} past events, {len(upcoming)} upcoming events")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(fresh="--fresh" in sys.argv[1:]))
@@ -0,0 +1,57 @@
+"""Synthetic NYC event data shared by the benchmark scripts.
+
+Artist and venue names come from bandcamp_artists.csv and venues.csv at
+the repo root. The spelling variants are the ones real scrapers disagree
+on, so dedup and normalization see the same kind of input they do in
+production.
+"""
+
+import csv
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_csv(name: str, column: str) -> list[str]:
+    with open(ROOT / name, newline="", encoding="utf-8") as f:
+        return [r[column].strip() for r in csv.DictReader(f) if r[column].strip()]
+
+
+ARTISTS = load_csv("bandcamp_artists.csv", "artist")
+VENUES = load_csv("venues.csv", "venue")
+
+
+def title_variants(headliner: str, venue: str) -> list[str]:
+    return [
+        headliner,
+        f"{headliner} at {venue}",
+        f"{headliner}: All Night Long",
+        f"{headliner} All Night Long",
+        f"{venue} presents {headliner}",
+        headliner.upper(),
+    ]
+
+
+def venue_variants(venue: str) -> list[str]:
+    return [
+        venue,
+        f"The {venue}",
+        f"{venue} Brooklyn",
+        f"{venue} NYC",
+        f"{venue} - Room 2",
+        venue.replace(" and ", " & "),
+    ]
+
+
+def artist_variants(artist: str) -> list[str]:
+    return [artist, f"{artist} (Live)", f"{artist} (DJ Set)", artist.upper()]
+
+
+def random_night(
+    rng: random.Random, start: date, days: int, max_artists: int = 4
+) -> tuple[date, str, list[str]]:
+    """A night's date, venue and lineup, picked from the CSV names."""
+    day = start + timedelta(days=rng.randrange(days))
+    return day, rng.choice(VENUES), rng.sample(ARTISTS, rng.randint(1, max_artists))
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Per-row cost of turning events rows into Event objects.
+
+"pydantic" is the loop the db readers used to copy-paste: parse
+date/time/source_urls by hand, then Event(**row) with full validation.
+"RowDecoder" is db.decode_event: a column plan worked out once, then
+model_validate. The two should cost about the same; this guards against
+the shared decoder getting slower than the loops it replaced. Rows are
+PostgREST-shaped (jsonb already decoded), from bench_projection's
+generator, with start times filled in. Both sides run interleaved with
+gc off; the best of REPEAT runs counts.
+
+    uv run python scripts/bench_decode.py [rows]
+"""
+
+import gc
+import json
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.bench_projection import make_rows
+from src import db
+from src.models import Event
+
+REPEAT = 15
+
+
+def _parse_date(v):
+    if not v:
+        return None
+    try:
+        return date.fromisoformat(v)
+    except (ValueError, TypeError):
+        return None
+
+
+def legacy_decode(rows: list[dict]) -> list[Event]:
+    events = []
+    for row in rows:
+        row["event_date"] = _parse_date(row.get("event_date"))
+        row["start_time"] = db._parse_time(row.get("start_time"))
+        row["end_time"] = db._parse_time(row.get("end_time"))
+        if isinstance(row.get("source_urls"), str):
+            row["source_urls"] = json.loads(row["source_urls"])
+        events.append(Event(**row))
+    return events
+
+
+def timed(fn, rows: list[dict]) -> tuple[float, list[Event]]:
+    batch = [dict(r) for r in rows]  # the legacy path mutates rows
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        out = fn(batch)
+        return time.perf_counter() - start, out
+    finally:
+        gc.enable()
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rows = make_rows(n)
+    for i, row in enumerate(rows):
+        row["start_time"] = f"{20 + i % 4}:00:00"
+
+    # Interleaved so a noisy neighbour slows both sides alike
+    legacy_t = fast_t = float("inf")
+    for _ in range(REPEAT):
+        t, legacy = timed(legacy_decode, rows)
+        legacy_t = min(legacy_t, t)
+        t, fast = timed(db.decode_event.many, rows)
+        fast_t = min(fast_t, t)
+    assert fast == legacy, "decoders disagree"
+
+    print(f"{n} rows, best of {REPEAT}\n")
+    for label, t in (("pydantic", legacy_t), ("RowDecoder", fast_t)):
+        print(f"{label:<11} {t * 1000:8.1f} ms  {t / n * 1e6:6.2f} us/row")
+    print(f"\nspeedup {legacy_t / fast_t:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Dedup benchmark on a synthetic NYC event set.
+
+Generates "true" nights from venues.csv and bandcamp_artists.csv, then has
+several sources report each one the way real scrapers disagree: reworded
+titles ("X at Venue", "X: All Night Long", "Venue presents X"), "(Live)" /
+"(DJ Set)" qualifiers, b2b lineups, and venue spellings ("The ...", "& vs
+and", borough and room suffixes). Part of the set is already canonical.
+
+Runs deduplicate_and_store against an in-memory stand-in for src/db.py and
+reports wall time, fuzzy comparisons, and peak traced memory (a second,
+tracemalloc-instrumented run, so the timing isn't skewed). "truth" is the
+number of distinct nights generated; "canonical" is what dedup produced.
+With --sqlite the real src/db.py functions run against a throwaway SQLite
+database instead, so the numbers include storage.
+
+    LOG_LEVEL=WARNING uv run python scripts/bench_dedup.py [--sqlite] [sizes...]
+"""
+
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.bench_data import random_night, title_variants, venue_variants
+from src import db as real_db
+from src import db_sqlite
+from src.config import settings
+from src.event_cache import reset_event_cache
+from src.models import Event, ScrapedEvent, Source
+from src.scrapers import runner
+
+EVENTS_PER_DAY = 150  # busy NYC night across all sources
+EXISTING_FRACTION = 0.3  # share of true nights already canonical
+SOURCES = [Source.RA, Source.DICE, Source.PARTIFUL, Source.BASEMENT, Source.NYC_NOISE]
+
+
+class MemoryDB:
+    """The parts of src/db.py that deduplicate_and_store calls."""
+
+    def __init__(self, canonical: list[Event]) -> None:
+        self.canonical: dict[str, Event] = {e.id: e for e in canonical}
+        self.raw = 0
+
+    def upsert_raw_events(self, events: list[ScrapedEvent]) -> int:
+        self.raw += len(events)
+        return len(events)
+
+    def get_canonical_events_in_range(self, from_date: date, to_date: date) -> dict[date, list[Event]]:
+        by_date: dict[date, list[Event]] = {}
+        for e in self.canonical.values():
+            if from_date <= e.event_date <= to_date:
+                by_date.setdefault(e.event_date, []).append(e)
+        return by_date
+
+    def upsert_canonical_events(self, events: list[Event]) -> int:
+        for e in events:
+            self.canonical[e.id] = e
+        return len(events)
+
+
+def _lineup_variant(rng: random.Random, lineup: list[str]) -> list[str]:
+    out = []
+    for a in lineup:
+        q = rng.random()
+        out.append(f"{a} (Live)" if q < 0.2 else f"{a} (DJ Set)" if q < 0.3 else a)
+    if len(out) >= 2 and rng.random() < 0.3:
+        out = [f"{out[0]} b2b {out[1]}", *out[2:]]
+    return out
+
+
+def generate(n: int, seed: int = 0) -> tuple[dict[str, list[ScrapedEvent]], list[Event], int]:
+    """~n scraped events, the pre-existing canonical set, and the true night count."""
+    rng = random.Random(seed)
+    days = max(1, n // EVENTS_PER_DAY)
+    start = date(2026, 3, 1)
+    scraped: dict[str, list[ScrapedEvent]] = {}
+    existing: list[Event] = []
+    truths = 0
+    count = 0
+    while count < n:
+        truths += 1
+        day, venue, lineup = random_night(rng, start, days)
+        if rng.random() < EXISTING_FRACTION:
+            existing.append(
+                Event(
+                    id=f"existing-{truths}",
+                    title=rng.choice(title_variants(lineup[0], venue)),
+                    event_date=day,
+                    venue_name=venue,
+                    artists=list(lineup),
+                    sources=["ra"],
+                )
+            )
+        for source in rng.sample(SOURCES, rng.randint(1, 3)):
+            scraped.setdefault(source.value, []).append(
+                ScrapedEvent(
+                    source=source,
+                    source_id=f"{source.value}-{count}",
+                    title=rng.choice(title_variants(lineup[0], venue)),
+                    event_date=day,
+                    venue_name=rng.choice(venue_variants(venue)) if rng.random() < 0.9 else None,
+                    artists=_lineup_variant(rng, lineup) if rng.random() < 0.85 else [],
+                )
+            )
+            count += 1
+    return scraped, existing, truths
+
+
+_plan_canonical_writes = runner.plan_canonical_writes
+
+
+def _sqlite_db(existing: list[Event], tmp: str):
+    """src.db on a fresh SQLite file seeded with the existing canonical set."""
+    db_sqlite.close_sqlite_storage()
+    reset_event_cache()
+    settings.storage_backend = "sqlite"
+    settings.sqlite_path = str(Path(tmp) / f"bench-{time.monotonic_ns()}.db")
+    real_db.upsert_canonical_events(existing)
+    return real_db
+
+
+def _canonical_count(db) -> int:
+    if isinstance(db, MemoryDB):
+        return len(db.canonical)
+    return db_sqlite.get_sqlite_storage()._query("select count(*) from events")[0][0]
+
+
+def run_once(scraped, existing, tmp: str | None = None) -> tuple[float, runner.DedupPlan, int]:
+    db = _sqlite_db(existing, tmp) if tmp else MemoryDB(existing)
+    plans: list[runner.DedupPlan] = []
+
+    def recording_plan(*args):
+        plans.append(_plan_canonical_writes(*args))
+        return plans[-1]
+
+    runner.db = db
+    runner.plan_canonical_writes = recording_plan
+    start = time.perf_counter()
+    runner.deduplicate_and_store(scraped)
+    elapsed = time.perf_counter() - start
+    return elapsed, plans[0], _canonical_count(db)
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    tmp = tempfile.mkdtemp() if "--sqlite" in args else None
+    sizes = [int(a) for a in args if a != "--sqlite"] or [1_000, 10_000, 100_000]
+    print(
+        f"{'events':>8} {'truth':>7} {'canonical':>9} {'time':>9} "
+        f"{'compared':>10} {'skipped':>11} {'peak mem':>9}"
+    )
+    for n in sizes:
+        scraped, existing, truths = generate(n)
+        elapsed, plan, canonical = run_once(scraped, existing, tmp)
+
+        tracemalloc.start()
+        run_once(scraped, existing, tmp)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{n:>8} {truths:>7} {canonical:>9} {elapsed:>8.2f}s "
+            f"{plan.comparisons:>10} {plan.skipped:>11} "
+            f"{peak / 2**20:>7.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
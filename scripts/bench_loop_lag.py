@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Event-loop lag while a scrape batch is deduplicated: inline vs worker.
+
+"before" is the old behaviour: synchronous deduplicate_and_store on the
+loop. The other rows use deduplicate_and_store_async with each
+settings.dedup_worker value. Events and the in-memory Supabase stand-in
+come from bench_dedup; the stand-in gets a small per-call delay, so the
+numbers reflect dedup CPU, not the network.
+
+    LOG_LEVEL=WARNING uv run python scripts/bench_loop_lag.py [events]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.bench_dedup import MemoryDB, generate
+from src.config import settings
+from src.loop_lag import LoopLagMonitor
+from src.models import Event, ScrapedEvent
+from src.scrapers import runner
+
+DB_LATENCY = 0.02  # seconds per simulated Supabase call
+
+
+class SlowMemoryDB(MemoryDB):
+    """bench_dedup's stand-in, blocking on every call like the real sync client."""
+
+    def upsert_raw_events(self, events: list[ScrapedEvent]) -> int:
+        time.sleep(DB_LATENCY)
+        return super().upsert_raw_events(events)
+
+    def get_canonical_events_in_range(self, from_date, to_date):
+        time.sleep(DB_LATENCY)
+        return super().get_canonical_events_in_range(from_date, to_date)
+
+    def upsert_canonical_events(self, events: list[Event]) -> int:
+        time.sleep(DB_LATENCY)
+        return super().upsert_canonical_events(events)
+
+
+async def measure(
+    label: str, mode: str, events: dict[str, list[ScrapedEvent]], existing: list[Event]
+) -> None:
+    runner.db = SlowMemoryDB(existing)  # every mode starts from the same canonical set
+    lag = LoopLagMonitor(interval=0.01)
+    lag.start()
+    await asyncio.sleep(0.05)  # let the probe take its first samples
+    start = time.perf_counter()
+    if mode == "blocking":
+        runner.deduplicate_and_store(events)
+    else:
+        settings.dedup_worker = mode
+        await runner.deduplicate_and_store_async(events)
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.05)  # let the probe record a stall that just ended
+    stats = await lag.stop()
+    print(
+        f"{label:<16} {elapsed * 1000:8.0f} ms total   "
+        f"lag max {stats['max_ms']:7.1f} ms   p99 {stats['p99_ms']:7.1f} ms"
+    )
+
+
+async def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    events, existing, _ = generate(n)
+    print(f"{n} scraped events, {len(existing)} already canonical\n")
+    try:
+        await measure("before (sync)", "blocking", events, existing)
+        await measure("inline", "inline", events, existing)
+        await measure("thread", "thread", events, existing)
+        runner.shutdown_dedup_executor()
+        await measure("process (cold)", "process", events, existing)
+        await measure("process (warm)", "process", events, existing)
+    finally:
+        runner.shutdown_dedup_executor()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
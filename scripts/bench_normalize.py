@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: legacy regex normalization vs translate-table vs memoized.
+
+Builds a corpus from bandcamp_artists.csv and venues.csv (plus the
+cross-source variants dedup sees: "(Live)", "b2b", "The ...", room and
+borough suffixes) and normalizes it repeatedly, the way a scrape run and
+the heuristic scorer do.
+
+    uv run python scripts/bench_normalize.py [passes]
+"""
+
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.bench_data import ARTISTS, VENUES, artist_variants, venue_variants
+from src import normalize as norm
+
+
+# --- Pre-memoization implementations, kept verbatim for comparison ---
+
+
+def legacy_normalize(s: str) -> str:
+    s = unicodedata.normalize("NFKD", s.lower())
+    s = re.sub(r"[^\w\s]", "", s)
+    return re.sub(r"\s+", " ", s).strip()
+
+
+def legacy_normalize_venue(s: str) -> str:
+    s = s.replace("&", "and")
+    s = re.sub(r"\s*[-–—]\s*(zone\s+\w+|room\s+\w+|hall|studio|stage)\b.*$", "", s, flags=re.IGNORECASE)
+    s = legacy_normalize(s)
+    s = re.sub(r"^the\s+", "", s)
+    s = re.sub(r"\s+(ny|nyc|brooklyn|bk|manhattan|queens|bushwick|williamsburg|ridgewood)$", "", s)
+    return s.strip()
+
+
+def legacy_normalize_artist(s: str) -> str:
+    s = norm._ARTIST_QUALIFIERS.sub(" ", s)
+    s = norm._ARTIST_SUFFIX.sub("", s)
+    s = norm._PRESENTS_PREFIX.sub("", s)
+    return legacy_normalize(s)
+
+
+def load_corpus() -> tuple[list[str], list[str]]:
+    artists = []
+    for i, a in enumerate(ARTISTS):
+        artists += artist_variants(a)
+        artists.append(f"{a} b2b {ARTISTS[(i + 1) % len(ARTISTS)]}")
+    venues = [v for venue in VENUES for v in venue_variants(venue)]
+    return artists, venues
+
+
+def bench(label: str, fn_artist, fn_venue, fn_title, artists, venues, passes: int) -> float:
+    start = time.perf_counter()
+    for _ in range(passes):
+        for a in artists:
+            fn_artist(a)
+            fn_title(a)
+        for v in venues:
+            fn_venue(v)
+    elapsed = time.perf_counter() - start
+    calls = passes * (2 * len(artists) + len(venues))
+    print(f"{label:<28} {elapsed * 1000:9.1f} ms   {elapsed / calls * 1e9:7.0f} ns/call")
+    return elapsed
+
+
+def main() -> None:
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    artists, venues = load_corpus()
+    print(f"corpus: {len(artists)} artist strings, {len(venues)} venue strings, {passes} passes\n")
+
+    # Base normalize() alone, no caching either side: regex vs translate table
+    base_legacy = bench(
+        "normalize: chained re.sub",
+        legacy_normalize, legacy_normalize, legacy_normalize,
+        artists, venues, passes,
+    )
+    base_single = bench(
+        "normalize: translate table",
+        norm.normalize.__wrapped__, norm.normalize.__wrapped__, norm.normalize.__wrapped__,
+        artists, venues, passes,
+    )
+    print()
+
+    # Full artist/venue/title mix: legacy vs memoized engine
+    full_legacy = bench(
+        "all: legacy",
+        legacy_normalize_artist, legacy_normalize_venue, legacy_normalize,
+        artists, venues, passes,
+    )
+    norm.clear_caches()
+    full_cached = bench(
+        "all: translate + LRU",
+        norm.normalize_artist, norm.normalize_venue, norm.normalize,
+        artists, venues, passes,
+    )
+
+    print(
+        f"\nspeedup: single-pass normalize {base_legacy / base_single:.1f}x, "
+        f"memoized engine {full_legacy / full_cached:.1f}x"
+    )
+    print("\ncache stats:")
+    for name, s in norm.cache_stats().items():
+        print(f"  {name:<20} hits={s['hits']:<8} misses={s['misses']:<6} hit_rate={s['hit_rate']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
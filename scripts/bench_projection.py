@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Payload bytes per events projection profile (see db.EVENT_PROFILES).
+
+Builds PostgREST-shaped events rows from bench_data's artists and
+venues, with realistic field sizes (RA-style descriptions of a few
+hundred to a few thousand characters, CDN image URLs, one to three
+source links) and reports the JSON bytes an upcoming-events read and a
+week-recommendations read would transfer under each profile. With
+--live it runs the real selects against Supabase instead.
+
+    uv run python scripts/bench_projection.py [--live] [events]
+"""
+
+import json
+import random
+import sys
+import uuid
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.bench_data import random_night
+from src import db
+from src.models import Event
+
+WORDS = (
+    "warehouse techno house disco ambient live set all night long sound system "
+    "resident guest debut records label bass dub jungle garage vinyl b2b room "
+    "doors late open air rooftop brooklyn queens lineup tickets limited"
+).split()
+SOURCES = ["ra", "dice", "partiful", "basement", "nycnoise"]
+
+
+def make_rows(n: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).isoformat()
+    today = date.today()
+    rows = []
+    for i in range(n):
+        day, venue, lineup = random_night(rng, today, 14, max_artists=5)
+        sources = rng.sample(SOURCES, rng.randint(1, 3))
+        e = Event(
+            title=f"{lineup[0]} {' '.join(rng.choices(WORDS, k=2)).title()} {i}",
+            event_date=day,
+            venue_name=venue,
+            venue_address=f"{rng.randint(1, 999)} Meserole St, Brooklyn, NY",
+            artists=lineup,
+            cost_display=f"${rng.randint(10, 40)}",
+            price_min_cents=rng.randint(1000, 2500),
+            price_max_cents=rng.randint(2500, 4000),
+            source_urls={s: f"https://{s}.example/events/{rng.randrange(10**7)}" for s in sources},
+            sources=sources,
+            attending_count=rng.randint(0, 800),
+            description=" ".join(rng.choices(WORDS, k=rng.randint(60, 400))),
+            image_url=f"https://images.example-cdn.net/w_1200/{uuid.UUID(int=rng.getrandbits(128))}.jpg",
+        )
+        row = {"id": str(uuid.UUID(int=rng.getrandbits(128))), **db._serialize_canonical(e)}
+        row["source_urls"] = json.loads(row["source_urls"])
+        rows.append({**row, "created_at": now, "updated_at": now})
+    return rows
+
+
+def project(row: dict, profile: str) -> dict:
+    columns = db.event_columns(profile)
+    if columns == "*":
+        return row
+    return {c: row[c] for c in columns.split(",")}
+
+
+def synthetic(n: int) -> None:
+    rows = make_rows(n)
+    recs = [
+        {
+            "id": str(uuid.uuid4()),
+            "event_id": r["id"],
+            "score": 72.5,
+            "reasoning": "Strong match with your favourite artists and venue.",
+            "telegram_message_id": None,
+            "feedback": None,
+            "created_at": r["created_at"],
+        }
+        for r in rows[:100]
+    ]
+    print(f"{n} synthetic upcoming events, 100 recommendations\n")
+    print(f"{'profile':<9} {'events read':>14} {'per row':>9} {'week recs':>12}")
+    for profile in db.EVENT_PROFILES:
+        events_bytes = len(json.dumps([project(r, profile) for r in rows]))
+        recs_bytes = len(
+            json.dumps([{**rec, "events": project(r, profile)} for rec, r in zip(recs, rows)])
+        )
+        print(
+            f"{profile:<9} {events_bytes / 1024:>11.1f} KB {events_bytes / n:>7.0f} B "
+            f"{recs_bytes / 1024:>9.1f} KB"
+        )
+
+
+def live() -> None:
+    today = date.today().isoformat()
+    print(f"{'profile':<9} {'rows':>6} {'events read':>14}")
+    for profile in db.EVENT_PROFILES:
+        rows = db.read_rows(
+            lambda **kw: db.get_client()
+            .table("events")
+            .select(db.event_columns(profile), **kw)
+            .gte("event_date", today)
+            .order("event_date")
+            .order("id")
+        )
+        print(f"{profile:<9} {len(rows):>6} {len(json.dumps(rows)) / 1024:>11.1f} KB")
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if "--live" in args:
+        live()
+    else:
+        synthetic(int(args[0]) if args else 2000)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,14 +14,14 @@ from src.recommend.taste import TasteProfile
 
 async def main():
     print("Loading upcoming events...")
-    events = db.get_upcoming_events()
+    events = await asyncio.to_thread(db.get_upcoming_events, profile="scoring")
     print(f"Found {len(events)} upcoming events.")
 
     if not events:
         print("No events to score. Run scrape_once.py first.")
         return
 
-    taste = TasteProfile()
+    taste = TasteProfile(await asyncio.to_thread(db.get_taste_profile))
     print(f"Taste profile:\n{taste.to_prompt_text()}\n")
 
     print("Ranking events...")
@@ -8,13 +8,23 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from src.scrapers.runner import run_scrape_pipeline
+from src.scrapers.runner import run_scrape_pipeline, shutdown_dedup_executor
+from src.scrapers.transport import close_transport, get_transport
 
 
 async def main():
     print("Starting one-shot scrape...")
-    new_count = await run_scrape_pipeline()
+    try:
+        new_count = await run_scrape_pipeline()
+        stats = get_transport().stats()
+    finally:
+        await close_transport()
+        shutdown_dedup_executor()
     print(f"Done! {new_count} new canonical events stored.")
+    print(
+        f"HTTP: {stats['requests']} requests, "
+        f"{stats['connections_opened']} connections opened, {stats['reused']} reused"
+    )
 
 
 if __name__ == "__main__":
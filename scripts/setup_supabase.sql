@@ -24,11 +24,15 @@ create table if not exists raw_events (
     description text,
     image_url text,
     extra jsonb,
+    content_hash text,  -- sha256 of the scraped fields; unchanged rows aren't re-sent
     created_at timestamptz default now(),
     updated_at timestamptz default now(),
     unique(source, source_id)
 );
 
+-- Existing deployments: add the content hash column
+alter table raw_events add column if not exists content_hash text;
+
 create index if not exists idx_raw_events_date on raw_events(event_date);
 create index if not exists idx_raw_events_source on raw_events(source);
 
@@ -56,6 +60,7 @@ create table if not exists events (
 
 create index if not exists idx_events_date on events(event_date);
 create index if not exists idx_events_venue on events(venue_name);
+create index if not exists idx_events_updated on events(updated_at, id);  -- delta sync
 
 -- 3. Taste profile
 create table if not exists taste_profile (
@@ -91,9 +96,15 @@ create table if not exists scrape_logs (
     event_count integer default 0,
     duration_seconds real default 0,
     error text,
+    cache_hits integer default 0,     -- 304s served from the HTTP validator cache
+    cache_misses integer default 0,   -- full-body downloads
     created_at timestamptz default now()
 );
 
+-- Existing deployments: add the HTTP cache counters
+alter table scrape_logs add column if not exists cache_hits integer default 0;
+alter table scrape_logs add column if not exists cache_misses integer default 0;
+
 create index if not exists idx_scrape_logs_source on scrape_logs(source, created_at);
 
 -- 6. Alert log (for rate-limiting alerts)
@@ -106,6 +117,15 @@ create table if not exists alert_log (
 
 create index if not exists idx_alert_log_source on alert_log(source, created_at);
 
+-- 7. Event tombstones (deleted canonical events, for delta sync)
+create table if not exists event_tombstones (
+    id uuid primary key,
+    event_date date,
+    deleted_at timestamptz default now()
+);
+
+create index if not exists idx_event_tombstones_deleted on event_tombstones(deleted_at, id);
+
 -- Auto-update updated_at timestamps
 create or replace function update_updated_at()
 returns trigger as $$
@@ -126,3 +146,17 @@ create trigger tr_events_updated
 create trigger tr_taste_profile_updated
     before update on taste_profile
     for each row execute function update_updated_at();
+
+-- Record a tombstone for every deleted canonical event
+create or replace function record_event_tombstone()
+returns trigger as $$
+begin
+    insert into event_tombstones (id, event_date) values (old.id, old.event_date)
+    on conflict (id) do update set deleted_at = now();
+    return old;
+end;
+$$ language plpgsql;
+
+create trigger tr_events_tombstone
+    after delete on events
+    for each row execute function record_event_tombstone();
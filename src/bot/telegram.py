@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import functools
 from datetime import date, timedelta
 from typing import Callable
@@ -16,6 +17,7 @@ from telegram.ext import (
 
 from src import db
 from src.config import settings
+from src.event_cache import get_event_cache
 from src.log import get_logger
 from src.models import Event, Recommendation, TasteEntry, WeeklyScript
 from src.recommend.ranker import run_recommendation_pipeline, run_training_pipeline
@@ -103,7 +105,11 @@ async def cmd_upcoming(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         await update.message.reply_text("No recommendations yet. Try again after a scrape runs.")
         return
 
-    events_map = {e.id: e for e in db.get_upcoming_events() if e.event_date <= week_cutoff}
+    events_map = {
+        e.id: e
+        for e in await asyncio.to_thread(db.get_upcoming_events, profile="card")
+        if e.event_date <= week_cutoff
+    }
 
     sent = 0
     for r in recs:
@@ -142,7 +148,7 @@ async def cmd_upcoming(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 @_command_error_handler
 async def cmd_taste(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    entries = db.get_taste_profile()
+    entries = await asyncio.to_thread(db.get_taste_profile)
     if not entries:
         await update.message.reply_text(
             "No taste profile set. Use /add_artist and /add_venue to get started."
@@ -194,25 +200,27 @@ async def cmd_add_venue(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 @_command_error_handler
 async def cmd_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     # Recent scrape logs
-    result = (
-        db.get_client()
-        .table("scrape_logs")
-        .select("*")
-        .order("created_at", desc=True)
-        .limit(12)
-        .execute()
-    )
     lines = ["<b>Recent Scrapes:</b>"]
-    for row in result.data:
+    for row in db.get_recent_scrape_logs(limit=12):
         status_emoji = "ok" if row["status"] == "success" else "ERR"
         lines.append(
             f"  [{status_emoji}] {row['source']}: {row['event_count']} events "
             f"({row['duration_seconds']:.1f}s)"
         )
 
-    event_count = len(db.get_upcoming_events())
+    event_count = len(await asyncio.to_thread(db.get_upcoming_events, profile="id-only"))
     lines.append(f"\n<b>Upcoming events:</b> {event_count}")
 
+    cache = get_event_cache()
+    stats = cache.stats() if cache else None
+    if stats and stats["age_seconds"] is not None:
+        lines.append(
+            f"<b>Event cache:</b> {stats['size']} events, synced "
+            f"{stats['age_seconds']:.0f}s ago ({stats['last_delta_rows']} rows), "
+            f"{stats['hits']} hits / {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%})"
+        )
+
     await update.message.reply_text("\n".join(lines), parse_mode="HTML")
 
 
@@ -235,7 +243,7 @@ async def cmd_train(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         await status_msg.edit_text("No past events to score (all may already be rated).")
         return
 
-    events_map = {e.id: e for e in db.get_past_events()}
+    events_map = {e.id: e for e in await asyncio.to_thread(db.get_past_events)}
 
     sent = 0
     for rec in recs:
@@ -592,7 +600,9 @@ async def send_daily_recommendations(top_n: int = 10) -> None:
     app = get_app()
     bot = app.bot
 
-    events_map = {e.id: e for e in db.get_upcoming_events()}
+    events_map = {
+        e.id: e for e in await asyncio.to_thread(db.get_upcoming_events, profile="card")
+    }
 
     for rec in recs:
         event = events_map.get(rec.event_id)
@@ -628,7 +638,9 @@ async def send_weekend_preview() -> None:
     friday = today + timedelta(days=days_until_friday)
     sunday = friday + timedelta(days=2)
 
-    all_events = db.get_upcoming_events(from_date=friday)
+    all_events = await asyncio.to_thread(
+        db.get_upcoming_events, from_date=friday, profile="card"
+    )
     weekend = [e for e in all_events if e.event_date <= sunday]
 
     if not weekend:
@@ -12,6 +12,14 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("SUPABASE_KEY", "SUPABASE_SECRET_KEY"),
     )
 
+    # Storage backend: "supabase", or "sqlite" for offline runs and benchmarks
+    storage_backend: str = "supabase"
+    sqlite_path: str = ".cache/ra-killer.db"
+    db_read_concurrency: int = 4  # Range requests in flight per paginated read
+    event_cache_enabled: bool = True  # in-process events replica; first read loads the table
+    event_cache_sync_seconds: float = 30.0  # min gap between delta syncs
+    event_tombstone_days: int = 7
+
     # Anthropic
     anthropic_api_key: str = ""
 
@@ -24,6 +32,29 @@ class Settings(BaseSettings):
     twilio_auth_token: str = ""
     twilio_phone_number: str = ""
 
+    # Scrapers (shared HTTP transport)
+    scraper_http2: bool = True
+    scraper_max_connections: int = 20
+    scraper_per_host_limit: int = 4
+    scraper_keepalive_seconds: float = 300.0
+    ra_max_pages: int = 10
+    ra_page_concurrency: int = 3
+    lightandsound_per_host_limit: int = 4
+    lightandsound_enrich_deadline: float = 90.0
+
+    # Dedup
+    canonical_write_chunk_size: int = 500
+    dedup_score_workers: int = -1  # rapidfuzz cdist threads; -1 = all cores
+    dedup_worker: str = "thread"  # where dedup runs: "thread", "process" or "inline"
+
+    # Local on-disk caches
+    cache_dir: str = ".cache"
+    http_cache_enabled: bool = True
+    http_cache_max_entries: int = 512
+    parse_cache_enabled: bool = True
+    parse_cache_max_entries: int = 256
+    lightandsound_detail_cache_enabled: bool = True
+
     # App
     base_url: str = "http://localhost:8000"
     log_level: str = "INFO"
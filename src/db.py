@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
+from collections.abc import AsyncIterator, Callable, Iterable
 from datetime import date, datetime, time, timedelta
+from types import UnionType
+from typing import Union, get_args, get_origin
 
+from pydantic import BaseModel
 from supabase import create_client
 
 from src.config import settings
+from src.event_cache import get_event_cache
 from src.models import Event, Recommendation, ScrapedEvent, TasteEntry, WeeklyScript
 from src.normalize import normalize_artist, normalize_venue
 
@@ -19,6 +26,63 @@ def get_client():
     return _client
 
 
+def _routed(fn):
+    """Send the call to the SQLite backend when settings.storage_backend says so.
+
+    Callers keep using `from src import db`; the Supabase body below is the
+    default implementation and src/db_sqlite.py has a method of the same
+    name and signature for every routed function.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if settings.storage_backend == "sqlite":
+            from src.db_sqlite import get_sqlite_storage
+
+            return getattr(get_sqlite_storage(), fn.__name__)(*args, **kwargs)
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def _from_replica(read):
+    """Answer an events read from the in-process replica when it's enabled.
+
+    The replica is delta-synced first (see src/event_cache.py), then
+    read(cache, *args, **kwargs) gives the answer the query would have.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache = get_event_cache()
+            if cache is None:
+                return fn(*args, **kwargs)
+            cache.sync(get_events_changed_since, get_event_tombstones_since)
+            return read(cache, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _updates_cache(apply):
+    """After a successful events write, mirror it with apply(cache, result, *args)."""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            result = fn(*args, **kwargs)
+            cache = get_event_cache()
+            if cache is not None:
+                apply(cache, result, *args, **kwargs)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 def _serialize_event(e: ScrapedEvent) -> dict:
     """Convert ScrapedEvent to a dict suitable for Supabase insert."""
     d = e.model_dump()
@@ -52,29 +116,244 @@ def _parse_time(v: str | None) -> time | None:
         return None
 
 
-def _parse_date(v: str | None) -> date | None:
-    if not v:
-        return None
+# --- Row decoding ---
+
+
+def _column_plan(model: type[BaseModel]) -> tuple[tuple[str, Callable | None, bool], ...]:
+    """(field, converter from str, nullable) for fields pydantic can't take as stored.
+
+    pydantic parses ISO dates and timestamps itself, so only two kinds of
+    column need help. Times go through the lenient _parse_time, which turns
+    a malformed value into None instead of an error. Lists and dicts stored
+    as JSON text (SQLite) are decoded; PostgREST already hands jsonb over
+    decoded. Non-nullable columns are listed too, so a NULL can fall back to
+    the field default.
+    """
+    plan = []
+    for name, field in model.model_fields.items():
+        ann = field.annotation
+        members = get_args(ann) if get_origin(ann) in (Union, UnionType) else (ann,)
+        convert = None
+        for m in members:
+            origin = get_origin(m) or m
+            if origin is time:
+                convert = _parse_time
+            elif origin in (list, dict):
+                convert = json.loads
+        nullable = type(None) in members
+        if convert or not nullable:
+            plan.append((name, convert, nullable))
+    return tuple(plan)
+
+
+class RowDecoder:
+    """Builds models from database rows with one shared, precompiled plan.
+
+    Replaces the per-reader loops that parsed dates, times and JSON by hand
+    before Model(**row). The plan is worked out once from the model's
+    fields, and a row only gets copied when one of its columns needs a fix.
+    The result goes through model_validate, which parses the ISO strings
+    natively and drops columns the model doesn't know. Columns a projection
+    didn't select keep their defaults.
+    """
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self._validate = model.model_validate
+        self._plan = _column_plan(model)
+
+    def __call__(self, row: dict):
+        fixed = None
+        for name, convert, nullable in self._plan:
+            v = row.get(name)
+            if v is None:
+                if not nullable and name in row:
+                    if fixed is None:
+                        fixed = dict(row)
+                    del fixed[name]
+            elif convert is not None and type(v) is str:
+                if fixed is None:
+                    fixed = dict(row)
+                fixed[name] = convert(v)
+        return self._validate(row if fixed is None else fixed)
+
+    def many(self, rows: Iterable[dict]) -> list:
+        return [self(row) for row in rows]
+
+
+decode_event = RowDecoder(Event)
+decode_weekly_script = RowDecoder(WeeklyScript)
+
+
+# --- Projections ---
+
+# Named column sets for events reads, so long descriptions and image URLs
+# only cross the wire for callers that use them. Every profile includes
+# the fields Event requires. An Event read with a partial profile is
+# read-only: upserts send every field, so writing one back would null out
+# the columns it never fetched.
+_CARD = (
+    "id,title,event_date,start_time,end_time,venue_name,artists,"
+    "cost_display,attending_count,source_urls,sources"
+)
+EVENT_PROFILES: dict[str, str] = {
+    "id-only": "id,title,event_date",
+    "card": _CARD,  # what the bot and IVR show
+    "scoring": _CARD + ",description,price_min_cents,price_max_cents",  # ranker prompt
+    "dedup": _CARD + ",venue_address,price_min_cents,price_max_cents,description,image_url",
+    "full": "*",
+}
+
+
+def event_columns(profile: str) -> str:
+    """Column list for a projection profile name (see EVENT_PROFILES)."""
     try:
-        return date.fromisoformat(v)
-    except (ValueError, TypeError):
-        return None
+        return EVENT_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"unknown projection profile {profile!r}; expected one of {sorted(EVENT_PROFILES)}"
+        ) from None
+
+
+# --- Paginated reads ---
+
+
+PAGE_SIZE = 1000  # PostgREST's default max-rows cap
+
+
+async def iter_rows(
+    build: Callable[..., object],
+    page_size: int | None = None,
+    concurrency: int | None = None,
+) -> AsyncIterator[dict]:
+    """Stream every row of a PostgREST select, in order, one page at a time.
+
+    build(**select_kwargs) returns a fresh, fully ordered query (order by a
+    unique key last, or pages can overlap). The first page also asks for
+    the exact row count. The remaining pages are then requested with
+    Range headers, at most `concurrency` in flight, and yielded in order
+    as each one lands. If the server's max-rows cap turns out smaller than
+    page_size, pages shrink to match instead of silently dropping rows.
+    """
+    page_size = page_size or PAGE_SIZE
+    limit = asyncio.Semaphore(concurrency or settings.db_read_concurrency)
+
+    def fetch(start: int, end: int, **kwargs):
+        return build(**kwargs).range(start, end).execute()
+
+    first = await asyncio.to_thread(fetch, 0, page_size - 1, count="exact")
+    for row in first.data:
+        yield row
+    step = len(first.data)
+    total = first.count if isinstance(first.count, int) else None
+    if total is None:
+        # No count from the server: walk on sequentially until a short page
+        offset, last = step, step
+        while last == page_size:
+            result = await asyncio.to_thread(fetch, offset, offset + page_size - 1)
+            for row in result.data:
+                yield row
+            last = len(result.data)
+            offset += last
+        return
+    if step == 0:
+        return
+
+    async def page(start: int):
+        async with limit:
+            return await asyncio.to_thread(fetch, start, start + step - 1)
+
+    tasks = [asyncio.ensure_future(page(start)) for start in range(step, total, step)]
+    try:
+        for task in tasks:
+            for row in (await task).data:
+                yield row
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def read_rows(
+    build: Callable[..., object],
+    page_size: int | None = None,
+    concurrency: int | None = None,
+) -> list[dict]:
+    """Blocking iter_rows for the synchronous db functions.
+
+    Only for threads without a running event loop. Coroutines iterate
+    iter_rows themselves, or call the db function through asyncio.to_thread
+    so the loop keeps serving while the pages come in.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "read_rows() would block the running event loop; "
+            "use iter_rows() or asyncio.to_thread()"
+        )
+
+    async def collect() -> list[dict]:
+        return [row async for row in iter_rows(build, page_size, concurrency)]
+
+    return asyncio.run(collect())
 
 
 # --- Raw events ---
 
 
+HASH_LOOKUP_CHUNK = 200  # source_ids per IN (...) filter, keeps the URL short
+
+
+def _stored_raw_hashes(source: str, source_ids: list[str]) -> dict[str, str]:
+    """Fetch {source_id: content_hash} for rows already in raw_events."""
+    hashes: dict[str, str] = {}
+    for i in range(0, len(source_ids), HASH_LOOKUP_CHUNK):
+        result = (
+            get_client()
+            .table("raw_events")
+            .select("source_id,content_hash")
+            .eq("source", source)
+            .in_("source_id", source_ids[i : i + HASH_LOOKUP_CHUNK])
+            .execute()
+        )
+        for row in result.data:
+            if row.get("content_hash"):
+                hashes[row["source_id"]] = row["content_hash"]
+    return hashes
+
+
+@_routed
 def upsert_raw_events(events: list[ScrapedEvent]) -> int:
-    """Upsert scraped events into raw_events. Returns count upserted."""
+    """Upsert new or changed scraped events into raw_events. Returns count upserted.
+
+    Rows whose content_hash matches what's already stored are not re-sent.
+    """
     if not events:
         return 0
-    rows = [_serialize_event(e) for e in events]
+    rows = []
+    for e in events:
+        row = _serialize_event(e)
+        row["content_hash"] = e.content_hash()
+        rows.append(row)
     # Deduplicate within the batch — Postgres ON CONFLICT can't handle
     # the same (source, source_id) appearing twice in one INSERT.
     seen: dict[tuple[str, str], dict] = {}
     for r in rows:
         seen[(r["source"], r["source_id"])] = r
+
+    by_source: dict[str, list[str]] = {}
+    for source, source_id in seen:
+        by_source.setdefault(source, []).append(source_id)
+    for source, source_ids in by_source.items():
+        stored = _stored_raw_hashes(source, source_ids)
+        for source_id in source_ids:
+            if stored.get(source_id) == seen[(source, source_id)]["content_hash"]:
+                del seen[(source, source_id)]
+
     rows = list(seen.values())
+    if not rows:
+        return 0
     result = (
         get_client()
         .table("raw_events")
@@ -87,6 +366,10 @@ def upsert_raw_events(events: list[ScrapedEvent]) -> int:
 # --- Canonical events ---
 
 
+@_updates_cache(
+    lambda cache, event_id, event: cache.put([event.model_copy(update={"id": event_id})])
+)
+@_routed
 def upsert_canonical_event(event: Event) -> str:
     """Upsert a canonical event. Returns the event id."""
     row = _serialize_canonical(event)
@@ -102,85 +385,163 @@ def upsert_canonical_event(event: Event) -> str:
     return result.data[0]["id"]
 
 
-def get_upcoming_events(from_date: date | None = None) -> list[Event]:
-    """Get all canonical events from from_date onwards."""
-    if from_date is None:
-        from_date = date.today()
+@_updates_cache(lambda cache, _, events: cache.put(events))
+@_routed
+def upsert_canonical_events(events: list[Event]) -> int:
+    """Bulk upsert canonical events that already carry ids. Returns rows written."""
+    if not events:
+        return 0
+    rows = [{**_serialize_canonical(e), "id": e.id} for e in events]
     result = (
         get_client()
         .table("events")
-        .select("*")
+        .upsert(rows, on_conflict="id")
+        .execute()
+    )
+    return len(result.data)
+
+
+@_from_replica(
+    lambda cache, from_date=None, profile="full": cache.upcoming(from_date or date.today())
+)
+@_routed
+def get_upcoming_events(from_date: date | None = None, profile: str = "full") -> list[Event]:
+    """Get all canonical events from from_date onwards, with `profile`'s columns."""
+    if from_date is None:
+        from_date = date.today()
+    rows = read_rows(
+        lambda **kw: get_client()
+        .table("events")
+        .select(event_columns(profile), **kw)
         .gte("event_date", from_date.isoformat())
         .order("event_date")
-        .execute()
+        .order("id")
     )
-    events = []
-    for row in result.data:
-        row["event_date"] = _parse_date(row.get("event_date"))
-        row["start_time"] = _parse_time(row.get("start_time"))
-        row["end_time"] = _parse_time(row.get("end_time"))
-        if isinstance(row.get("source_urls"), str):
-            row["source_urls"] = json.loads(row["source_urls"])
-        events.append(Event(**row))
-    return events
+    return decode_event.many(rows)
 
 
-def get_past_events(days_back: int = 60) -> list[Event]:
+@_from_replica(
+    lambda cache, days_back=60, profile="full": cache.past(
+        date.today(), date.today() - timedelta(days=days_back)
+    )
+)
+@_routed
+def get_past_events(days_back: int = 60, profile: str = "full") -> list[Event]:
     """Get canonical events from past N days (for training)."""
     today = date.today()
     since = today - timedelta(days=days_back)
-    result = (
-        get_client()
+    rows = read_rows(
+        lambda **kw: get_client()
         .table("events")
-        .select("*")
+        .select(event_columns(profile), **kw)
         .lt("event_date", today.isoformat())
         .gte("event_date", since.isoformat())
         .order("event_date", desc=True)
-        .execute()
+        .order("id")
     )
-    events = []
-    for row in result.data:
-        row["event_date"] = _parse_date(row.get("event_date"))
-        row["start_time"] = _parse_time(row.get("start_time"))
-        row["end_time"] = _parse_time(row.get("end_time"))
-        if isinstance(row.get("source_urls"), str):
-            row["source_urls"] = json.loads(row["source_urls"])
-        events.append(Event(**row))
-    return events
+    return decode_event.many(rows)
 
 
+@_routed
 def get_canonical_events_by_date_venue(
-    event_date: date, venue_name: str | None
+    event_date: date, venue_name: str | None, profile: str = "dedup"
 ) -> list[Event]:
     """Fetch canonical events for a given date + venue (for dedup)."""
     q = (
         get_client()
         .table("events")
-        .select("*")
+        .select(event_columns(profile))
         .eq("event_date", event_date.isoformat())
     )
     if venue_name:
         q = q.eq("venue_name", venue_name)
-    result = q.execute()
-    events = []
-    for row in result.data:
-        row["event_date"] = _parse_date(row.get("event_date"))
-        row["start_time"] = _parse_time(row.get("start_time"))
-        row["end_time"] = _parse_time(row.get("end_time"))
-        if isinstance(row.get("source_urls"), str):
-            row["source_urls"] = json.loads(row["source_urls"])
-        events.append(Event(**row))
+    return decode_event.many(q.execute().data)
+
+
+@_from_replica(lambda cache, start, end, profile="dedup": cache.in_range(start, end))
+@_routed
+def get_canonical_events_in_range(
+    start: date, end: date, profile: str = "dedup"
+) -> dict[date, list[Event]]:
+    """Fetch all canonical events with start <= event_date <= end, grouped by date.
+
+    One paginated query for the whole scrape window, so dedup can run
+    against an in-memory map instead of one round trip per date.
+    """
+    rows = read_rows(
+        lambda **kw: get_client()
+        .table("events")
+        .select(event_columns(profile), **kw)
+        .gte("event_date", start.isoformat())
+        .lte("event_date", end.isoformat())
+        .order("event_date")
+        .order("id")
+    )
+    by_date: dict[date, list[Event]] = {}
+    for event in decode_event.many(rows):
+        by_date.setdefault(event.event_date, []).append(event)
+    return by_date
+
+
+@_routed
+def get_events_changed_since(since: datetime | None) -> list[Event]:
+    """Canonical events with updated_at > since (every row when since is None).
+
+    Keyset-paginated on (updated_at, id) rather than by offset: one bulk
+    upsert stamps hundreds of rows with the same updated_at, and an offset
+    shifts under rows that change while we page.
+    """
+    events: list[Event] = []
+    cursor: tuple[str, str] | None = None
+    while True:
+        q = get_client().table("events").select("*")
+        if cursor is not None:
+            ts, last_id = cursor
+            q = q.or_(f'updated_at.gt."{ts}",and(updated_at.eq."{ts}",id.gt.{last_id})')
+        elif since is not None:
+            q = q.gt("updated_at", since.isoformat())
+        result = q.order("updated_at").order("id").limit(PAGE_SIZE).execute()
+        if not result.data:
+            break
+        cursor = (result.data[-1]["updated_at"], result.data[-1]["id"])
+        events.extend(decode_event.many(result.data))
+        if len(result.data) < PAGE_SIZE:
+            break
     return events
 
 
+@_routed
+def get_event_tombstones_since(since: datetime) -> list[dict]:
+    """{id, deleted_at} for canonical events deleted after `since`."""
+    rows: list[dict] = []
+    cursor: tuple[str, str] | None = None
+    while True:
+        q = get_client().table("event_tombstones").select("id,deleted_at")
+        if cursor is not None:
+            ts, last_id = cursor
+            q = q.or_(f'deleted_at.gt."{ts}",and(deleted_at.eq."{ts}",id.gt.{last_id})')
+        else:
+            q = q.gt("deleted_at", since.isoformat())
+        result = q.order("deleted_at").order("id").limit(PAGE_SIZE).execute()
+        rows.extend(result.data)
+        if len(result.data) < PAGE_SIZE:
+            break
+        cursor = (result.data[-1]["deleted_at"], result.data[-1]["id"])
+    return rows
+
+
 # --- Taste profile ---
 
 
+@_routed
 def get_taste_profile() -> list[TasteEntry]:
-    result = get_client().table("taste_profile").select("*").execute()
-    return [TasteEntry(**row) for row in result.data]
+    rows = read_rows(
+        lambda **kw: get_client().table("taste_profile").select("*", **kw).order("id")
+    )
+    return [TasteEntry(**row) for row in rows]
 
 
+@_routed
 def upsert_taste_entry(entry: TasteEntry) -> None:
     row = entry.model_dump(exclude={"id"})
     if entry.category == "artist":
@@ -192,6 +553,7 @@ def upsert_taste_entry(entry: TasteEntry) -> None:
     ).execute()
 
 
+@_routed
 def update_taste_weight(category: str, name: str, delta: float) -> None:
     """Adjust a taste entry's weight by delta, clamped to [-1, 3]."""
     if category == "artist":
@@ -230,51 +592,57 @@ def update_taste_weight(category: str, name: str, delta: float) -> None:
 # --- Recommendations ---
 
 
+@_routed
 def save_recommendation(rec: Recommendation) -> str:
     row = rec.model_dump(exclude={"id", "created_at"})
     result = get_client().table("recommendations").insert(row).execute()
     return result.data[0]["id"]
 
 
+@_routed
 def update_recommendation_feedback(rec_id: str, feedback: str) -> None:
     get_client().table("recommendations").update({"feedback": feedback}).eq(
         "id", rec_id
     ).execute()
 
 
+@_routed
 def update_recommendation_message_id(rec_id: str, message_id: int) -> None:
     get_client().table("recommendations").update(
         {"telegram_message_id": message_id}
     ).eq("id", rec_id).execute()
 
 
+@_routed
 def get_recommended_event_ids() -> set[str]:
     """Get event IDs that already have recommendations."""
-    result = (
-        get_client()
+    rows = read_rows(
+        lambda **kw: get_client()
         .table("recommendations")
-        .select("event_id")
-        .execute()
+        .select("id,event_id", **kw)
+        .order("id")
     )
-    return {row["event_id"] for row in result.data}
+    return {row["event_id"] for row in rows}
 
 
-def get_recommendation_by_message_id(message_id: int) -> dict | None:
+@_routed
+def get_recommendation_by_message_id(message_id: int, profile: str = "card") -> dict | None:
     result = (
         get_client()
         .table("recommendations")
-        .select("*, events(*)")
+        .select(f"*, events({event_columns(profile)})")
         .eq("telegram_message_id", message_id)
         .execute()
     )
     return result.data[0] if result.data else None
 
 
-def get_recent_recommendations(limit: int = 50) -> list[dict]:
+@_routed
+def get_recent_recommendations(limit: int = 50, profile: str = "card") -> list[dict]:
     result = (
         get_client()
         .table("recommendations")
-        .select("*, events(*)")
+        .select(f"*, events({event_columns(profile)})")
         .order("created_at", desc=True)
         .limit(limit)
         .execute()
@@ -282,14 +650,19 @@ def get_recent_recommendations(limit: int = 50) -> list[dict]:
     return result.data
 
 
-def get_week_recommendations() -> list[dict]:
-    """Get recommendations for events this week (for Twilio IVR)."""
+@_routed
+def get_week_recommendations(profile: str = "id-only") -> list[dict]:
+    """Get recommendations for events this week (for Twilio IVR).
+
+    Callers look events up by event_id; the embed is only needed for the
+    date filter, so it defaults to the id-only profile.
+    """
     today = date.today()
     week_end = today + timedelta(days=7)
     result = (
         get_client()
         .table("recommendations")
-        .select("*, events(*)")
+        .select(f"*, events({event_columns(profile)})")
         .order("score", desc=True)
         .limit(100)
         .execute()
@@ -310,6 +683,7 @@ def get_week_recommendations() -> list[dict]:
 # --- Weekly scripts ---
 
 
+@_routed
 def save_weekly_script(script: WeeklyScript) -> str:
     """Insert a draft weekly script. Returns the script id."""
     row = {
@@ -322,6 +696,7 @@ def save_weekly_script(script: WeeklyScript) -> str:
     return result.data[0]["id"]
 
 
+@_routed
 def get_latest_approved_script(week_start: date) -> WeeklyScript | None:
     """Get the latest approved (not yet published) script for a given week."""
     result = (
@@ -336,11 +711,10 @@ def get_latest_approved_script(week_start: date) -> WeeklyScript | None:
     )
     if not result.data:
         return None
-    row = result.data[0]
-    row["week_start"] = _parse_date(row.get("week_start"))
-    return WeeklyScript(**row)
+    return decode_weekly_script(result.data[0])
 
 
+@_routed
 def get_published_script(week_start: date) -> WeeklyScript | None:
     """Get the published (live on IVR) script for a given week."""
     result = (
@@ -355,11 +729,10 @@ def get_published_script(week_start: date) -> WeeklyScript | None:
     )
     if not result.data:
         return None
-    row = result.data[0]
-    row["week_start"] = _parse_date(row.get("week_start"))
-    return WeeklyScript(**row)
+    return decode_weekly_script(result.data[0])
 
 
+@_routed
 def publish_weekly_script(script_id: str) -> None:
     """Mark an approved script as published (live on IVR)."""
     result = (
@@ -394,6 +767,7 @@ def publish_weekly_script(script_id: str) -> None:
     )
 
 
+@_routed
 def get_draft_script_by_message_id(message_id: int) -> WeeklyScript | None:
     """Find a draft script by its Telegram message ID (for reply detection)."""
     result = (
@@ -406,11 +780,10 @@ def get_draft_script_by_message_id(message_id: int) -> WeeklyScript | None:
     )
     if not result.data:
         return None
-    row = result.data[0]
-    row["week_start"] = _parse_date(row.get("week_start"))
-    return WeeklyScript(**row)
+    return decode_weekly_script(result.data[0])
 
 
+@_routed
 def approve_weekly_script(script_id: str) -> None:
     """Mark a script as approved and supersede any previous approved scripts for the same week."""
     # Get the script to find its week_start
@@ -446,6 +819,7 @@ def approve_weekly_script(script_id: str) -> None:
     )
 
 
+@_routed
 def update_weekly_script_text(script_id: str, new_text: str) -> None:
     """Update the script text (for edits via Telegram reply)."""
     (
@@ -457,6 +831,7 @@ def update_weekly_script_text(script_id: str, new_text: str) -> None:
     )
 
 
+@_routed
 def update_weekly_script_message_id(script_id: str, message_id: int) -> None:
     """Link a weekly script to its Telegram message."""
     (
@@ -471,12 +846,15 @@ def update_weekly_script_message_id(script_id: str, message_id: int) -> None:
 # --- Scrape logs ---
 
 
+@_routed
 def log_scrape(
     source: str,
     status: str,
     event_count: int,
     duration_seconds: float,
     error: str | None = None,
+    cache_hits: int = 0,
+    cache_misses: int = 0,
 ) -> None:
     get_client().table("scrape_logs").insert(
         {
@@ -485,13 +863,30 @@ def log_scrape(
             "event_count": event_count,
             "duration_seconds": duration_seconds,
             "error": error,
+            "cache_hits": cache_hits,
+            "cache_misses": cache_misses,
         }
     ).execute()
 
 
+@_routed
+def get_recent_scrape_logs(limit: int = 12) -> list[dict]:
+    """Most recent scrape_logs rows, newest first (for /status)."""
+    result = (
+        get_client()
+        .table("scrape_logs")
+        .select("*")
+        .order("created_at", desc=True)
+        .limit(limit)
+        .execute()
+    )
+    return result.data
+
+
 # --- Alert log ---
 
 
+@_routed
 def should_alert(source: str) -> bool:
     """Check if we should send an alert (rate limit: 1 per source per hour)."""
     result = (
@@ -509,6 +904,7 @@ def should_alert(source: str) -> bool:
     return (datetime.now(last.tzinfo) - last).total_seconds() > 3600
 
 
+@_routed
 def log_alert(source: str, message: str) -> None:
     get_client().table("alert_log").insert(
         {"source": source, "message": message}
@@ -518,6 +914,8 @@ def log_alert(source: str, message: str) -> None:
 # --- Cleanup ---
 
 
+@_updates_cache(lambda cache, _, before_date: cache.evict_before(before_date))
+@_routed
 def delete_past_events(before_date: date) -> int:
     """Delete events before a given date. Returns count deleted."""
     result = (
@@ -530,6 +928,7 @@ def delete_past_events(before_date: date) -> int:
     return len(result.data)
 
 
+@_routed
 def delete_old_raw_events(days: int = 7) -> int:
     """Delete raw_events with event_date older than N days ago."""
     cutoff = (date.today() - timedelta(days=days)).isoformat()
@@ -543,6 +942,7 @@ def delete_old_raw_events(days: int = 7) -> int:
     return len(result.data)
 
 
+@_routed
 def delete_old_recommendations(days: int = 30) -> int:
     """Delete recommendations older than N days."""
     cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
@@ -556,6 +956,7 @@ def delete_old_recommendations(days: int = 30) -> int:
     return len(result.data)
 
 
+@_routed
 def delete_old_logs(days: int = 30) -> int:
     """Delete old scrape_logs and alert_log entries. Returns total deleted."""
     cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
@@ -574,3 +975,26 @@ def delete_old_logs(days: int = 30) -> int:
         .execute()
     )
     return len(r1.data) + len(r2.data)
+
+
+@_routed
+def delete_old_tombstones(days: int = 7) -> int:
+    """Delete event_tombstones older than N days (replicas that far behind reload)."""
+    cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+    result = (
+        get_client()
+        .table("event_tombstones")
+        .delete()
+        .lt("deleted_at", cutoff)
+        .execute()
+    )
+    return len(result.data)
+
+
+@_updates_cache(lambda cache, _: cache.invalidate())
+@_routed
+def clear_event_tables() -> None:
+    """Wipe recommendations, events and raw_events (fresh backfill)."""
+    client = get_client()
+    for table in ("recommendations", "events", "raw_events"):
+        client.table(table).delete().gte("created_at", "2000-01-01").execute()
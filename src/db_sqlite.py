@@ -0,0 +1,640 @@
+"""Local SQLite storage backend with the same API as src/db.py.
+
+Selected with settings.storage_backend = "sqlite"; every public function in
+src/db.py then routes to the method of the same name here. Tables mirror
+scripts/setup_supabase.sql. Arrays and jsonb columns are stored as JSON
+text, and rows are handed back in the shapes PostgREST returns, so
+callers can't tell the backends apart. The database runs in WAL mode so
+the bot can read while a scrape is writing.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from src.config import settings
+from src.models import Event, Recommendation, ScrapedEvent, TasteEntry, WeeklyScript
+from src.normalize import normalize_artist, normalize_venue
+
+_SCHEMA = """
+create table if not exists raw_events (
+    id text primary key,
+    source text not null,
+    source_id text not null,
+    title text not null,
+    event_date text not null,
+    start_time text,
+    end_time text,
+    venue_name text,
+    venue_address text,
+    artists text default '[]',
+    cost_display text,
+    price_min_cents integer,
+    price_max_cents integer,
+    source_url text,
+    attending_count integer,
+    description text,
+    image_url text,
+    extra text,
+    content_hash text,
+    created_at text,
+    updated_at text,
+    unique(source, source_id)
+);
+create index if not exists idx_raw_events_date on raw_events(event_date);
+
+create table if not exists events (
+    id text primary key,
+    title text not null,
+    event_date text not null,
+    start_time text,
+    end_time text,
+    venue_name text,
+    venue_address text,
+    artists text default '[]',
+    cost_display text,
+    price_min_cents integer,
+    price_max_cents integer,
+    source_urls text default '{}',
+    sources text default '[]',
+    attending_count integer,
+    description text,
+    image_url text,
+    created_at text,
+    updated_at text
+);
+create index if not exists idx_events_date on events(event_date);
+create index if not exists idx_events_updated on events(updated_at, id);
+
+create table if not exists event_tombstones (
+    id text primary key,
+    event_date text,
+    deleted_at text
+);
+create index if not exists idx_event_tombstones_deleted on event_tombstones(deleted_at, id);
+
+create trigger if not exists tr_events_tombstone after delete on events
+begin
+    insert into event_tombstones (id, event_date, deleted_at)
+    values (old.id, old.event_date, utc_now())
+    on conflict(id) do update set deleted_at = excluded.deleted_at;
+end;
+
+create table if not exists taste_profile (
+    id text primary key,
+    category text not null,
+    name text not null,
+    weight real default 1.0,
+    source text default 'manual',
+    created_at text,
+    updated_at text,
+    unique(category, name)
+);
+
+create table if not exists recommendations (
+    id text primary key,
+    event_id text references events(id) on delete cascade,
+    score real not null,
+    reasoning text default '',
+    telegram_message_id integer,
+    feedback text,
+    created_at text
+);
+create index if not exists idx_recs_message on recommendations(telegram_message_id);
+
+create table if not exists weekly_scripts (
+    id text primary key,
+    week_start text not null,
+    status text default 'draft',
+    script_text text default '',
+    source_event_ids text default '[]',
+    telegram_message_id integer,
+    created_at text,
+    approved_at text
+);
+
+create table if not exists scrape_logs (
+    id text primary key,
+    source text not null,
+    status text not null,
+    event_count integer default 0,
+    duration_seconds real default 0,
+    error text,
+    cache_hits integer default 0,
+    cache_misses integer default 0,
+    created_at text
+);
+create index if not exists idx_scrape_logs_created on scrape_logs(created_at);
+
+create table if not exists alert_log (
+    id text primary key,
+    source text not null,
+    message text,
+    created_at text
+);
+create index if not exists idx_alert_log_source on alert_log(source, created_at);
+"""
+
+_EVENT_JSON = ("artists", "sources", "source_urls")
+_EVENT_COLUMNS = (
+    "title", "event_date", "start_time", "end_time", "venue_name", "venue_address",
+    "artists", "cost_display", "price_min_cents", "price_max_cents", "source_urls",
+    "sources", "attending_count", "description", "image_url",
+)
+_RAW_COLUMNS = (
+    "source", "source_id", "title", "event_date", "start_time", "end_time",
+    "venue_name", "venue_address", "artists", "cost_display", "price_min_cents",
+    "price_max_cents", "source_url", "attending_count", "description", "image_url",
+    "extra", "content_hash",
+)
+
+
+def _iso(dt: datetime) -> str:
+    """Fixed-width UTC timestamp, so string comparison orders correctly."""
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
+
+
+def _now() -> str:
+    return _iso(datetime.now(timezone.utc))
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def _event_row(row: sqlite3.Row) -> dict:
+    """An events row as PostgREST returns it (JSON columns decoded)."""
+    d = dict(row)
+    for col in _EVENT_JSON:
+        if d.get(col) is not None:
+            d[col] = json.loads(d[col])
+    return d
+
+
+def _columns(profile: str) -> str:
+    from src.db import event_columns
+
+    return event_columns(profile)
+
+
+def _event(row: sqlite3.Row) -> Event:
+    from src.db import decode_event
+
+    return decode_event(dict(row))
+
+
+def _script(row: sqlite3.Row) -> WeeklyScript:
+    from src.db import decode_weekly_script
+
+    return decode_weekly_script(dict(row))
+
+
+class SQLiteStorage:
+    """One shared connection; calls are serialized with a lock.
+
+    The connection is used from the event loop and from the dedup worker
+    thread, so it is opened with check_same_thread=False.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.create_function("utc_now", 0, _now)  # tombstone trigger
+        self._conn.execute("pragma journal_mode=wal")
+        self._conn.execute("pragma synchronous=normal")
+        self._conn.execute("pragma foreign_keys=on")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.RLock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql: str, params: tuple | list = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _write(self, sql: str, params: tuple | list = ()) -> int:
+        with self._lock, self._conn:
+            return self._conn.execute(sql, params).rowcount
+
+    def _write_many(self, sql: str, rows: list[tuple]) -> int:
+        with self._lock, self._conn:
+            self._conn.executemany(sql, rows)
+        return len(rows)
+
+    # --- Raw events ---
+
+    def _stored_raw_hashes(self, source: str, source_ids: list[str]) -> dict[str, str]:
+        from src.db import HASH_LOOKUP_CHUNK
+
+        hashes: dict[str, str] = {}
+        for i in range(0, len(source_ids), HASH_LOOKUP_CHUNK):
+            chunk = source_ids[i : i + HASH_LOOKUP_CHUNK]
+            for r in self._query(
+                "select source_id, content_hash from raw_events "
+                f"where source = ? and source_id in ({', '.join('?' * len(chunk))})",
+                (source, *chunk),
+            ):
+                hashes[r["source_id"]] = r["content_hash"]
+        return hashes
+
+    def upsert_raw_events(self, events: list[ScrapedEvent]) -> int:
+        from src.db import _serialize_event
+
+        if not events:
+            return 0
+        seen: dict[tuple[str, str], dict] = {}
+        for e in events:
+            row = _serialize_event(e)
+            row["artists"] = json.dumps(row["artists"])
+            row["content_hash"] = e.content_hash()
+            seen[(row["source"], row["source_id"])] = row
+
+        by_source: dict[str, list[str]] = {}
+        for source, source_id in seen:
+            by_source.setdefault(source, []).append(source_id)
+        for source, source_ids in by_source.items():
+            stored = self._stored_raw_hashes(source, source_ids)
+            for source_id in source_ids:
+                if stored.get(source_id) == seen[(source, source_id)]["content_hash"]:
+                    del seen[(source, source_id)]
+        rows = list(seen.values())
+        if not rows:
+            return 0
+
+        now = _now()
+        cols = ", ".join(_RAW_COLUMNS)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in _RAW_COLUMNS[2:])
+        return self._write_many(
+            f"insert into raw_events (id, {cols}, created_at, updated_at) "
+            f"values (?, {', '.join('?' * len(_RAW_COLUMNS))}, ?, ?) "
+            f"on conflict(source, source_id) do update set {updates}, "
+            f"updated_at = excluded.updated_at",
+            [(_new_id(), *(r[c] for c in _RAW_COLUMNS), now, now) for r in rows],
+        )
+
+    # --- Canonical events ---
+
+    def _upsert_events(self, events: list[Event]) -> list[str]:
+        from src.db import _serialize_canonical
+
+        now = _now()
+        ids = []
+        params = []
+        for e in events:
+            row = _serialize_canonical(e)
+            row["artists"] = json.dumps(row["artists"])
+            row["sources"] = json.dumps(row["sources"])
+            event_id = e.id or _new_id()
+            ids.append(event_id)
+            params.append((event_id, *(row[c] for c in _EVENT_COLUMNS), now, now))
+        cols = ", ".join(_EVENT_COLUMNS)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in _EVENT_COLUMNS)
+        self._write_many(
+            f"insert into events (id, {cols}, created_at, updated_at) "
+            f"values (?, {', '.join('?' * len(_EVENT_COLUMNS))}, ?, ?) "
+            f"on conflict(id) do update set {updates}, updated_at = excluded.updated_at",
+            params,
+        )
+        return ids
+
+    def upsert_canonical_event(self, event: Event) -> str:
+        return self._upsert_events([event])[0]
+
+    def upsert_canonical_events(self, events: list[Event]) -> int:
+        if not events:
+            return 0
+        return len(self._upsert_events(events))
+
+    def get_upcoming_events(
+        self, from_date: date | None = None, profile: str = "full"
+    ) -> list[Event]:
+        from_date = from_date or date.today()
+        rows = self._query(
+            f"select {_columns(profile)} from events where event_date >= ? order by event_date",
+            (from_date.isoformat(),),
+        )
+        return [_event(r) for r in rows]
+
+    def get_past_events(self, days_back: int = 60, profile: str = "full") -> list[Event]:
+        today = date.today()
+        rows = self._query(
+            f"select {_columns(profile)} from events where event_date < ? and event_date >= ? "
+            "order by event_date desc",
+            (today.isoformat(), (today - timedelta(days=days_back)).isoformat()),
+        )
+        return [_event(r) for r in rows]
+
+    def get_canonical_events_by_date_venue(
+        self, event_date: date, venue_name: str | None, profile: str = "dedup"
+    ) -> list[Event]:
+        sql = f"select {_columns(profile)} from events where event_date = ?"
+        params: list = [event_date.isoformat()]
+        if venue_name:
+            sql += " and venue_name = ?"
+            params.append(venue_name)
+        return [_event(r) for r in self._query(sql, params)]
+
+    def get_canonical_events_in_range(
+        self, start: date, end: date, profile: str = "dedup"
+    ) -> dict[date, list[Event]]:
+        rows = self._query(
+            f"select {_columns(profile)} from events where event_date >= ? and event_date <= ? "
+            "order by event_date, id",
+            (start.isoformat(), end.isoformat()),
+        )
+        by_date: dict[date, list[Event]] = {}
+        for r in rows:
+            event = _event(r)
+            by_date.setdefault(event.event_date, []).append(event)
+        return by_date
+
+    def get_events_changed_since(self, since: datetime | None) -> list[Event]:
+        if since is None:
+            rows = self._query("select * from events order by updated_at, id")
+        else:
+            rows = self._query(
+                "select * from events where updated_at > ? order by updated_at, id",
+                (_iso(since),),
+            )
+        return [_event(r) for r in rows]
+
+    def get_event_tombstones_since(self, since: datetime) -> list[dict]:
+        rows = self._query(
+            "select id, deleted_at from event_tombstones where deleted_at > ? "
+            "order by deleted_at, id",
+            (_iso(since),),
+        )
+        return [dict(r) for r in rows]
+
+    # --- Taste profile ---
+
+    def get_taste_profile(self) -> list[TasteEntry]:
+        rows = self._query("select id, category, name, weight, source from taste_profile")
+        return [TasteEntry(**dict(r)) for r in rows]
+
+    def upsert_taste_entry(self, entry: TasteEntry) -> None:
+        name = entry.name
+        if entry.category == "artist":
+            name = normalize_artist(name)
+        elif entry.category == "venue":
+            name = normalize_venue(name)
+        now = _now()
+        self._write(
+            "insert into taste_profile (id, category, name, weight, source, created_at, updated_at) "
+            "values (?, ?, ?, ?, ?, ?, ?) on conflict(category, name) do update set "
+            "weight = excluded.weight, source = excluded.source, updated_at = excluded.updated_at",
+            (_new_id(), entry.category, name, entry.weight, entry.source, now, now),
+        )
+
+    def update_taste_weight(self, category: str, name: str, delta: float) -> None:
+        if category == "artist":
+            name = normalize_artist(name)
+        elif category == "venue":
+            name = normalize_venue(name)
+        rows = self._query(
+            "select id, weight from taste_profile where category = ? and name = ?",
+            (category, name),
+        )
+        if rows:
+            new_weight = max(-1.0, min(3.0, rows[0]["weight"] + delta))
+            self._write(
+                "update taste_profile set weight = ?, updated_at = ? where id = ?",
+                (new_weight, _now(), rows[0]["id"]),
+            )
+        else:
+            self.upsert_taste_entry(
+                TasteEntry(
+                    category=category,
+                    name=name,
+                    weight=max(-1.0, min(3.0, delta)),
+                    source="learned",
+                )
+            )
+
+    # --- Recommendations ---
+
+    def save_recommendation(self, rec: Recommendation) -> str:
+        rec_id = _new_id()
+        self._write(
+            "insert into recommendations "
+            "(id, event_id, score, reasoning, telegram_message_id, feedback, created_at) "
+            "values (?, ?, ?, ?, ?, ?, ?)",
+            (rec_id, rec.event_id, rec.score, rec.reasoning, rec.telegram_message_id,
+             rec.feedback, _now()),
+        )
+        return rec_id
+
+    def update_recommendation_feedback(self, rec_id: str, feedback: str) -> None:
+        self._write("update recommendations set feedback = ? where id = ?", (feedback, rec_id))
+
+    def update_recommendation_message_id(self, rec_id: str, message_id: int) -> None:
+        self._write(
+            "update recommendations set telegram_message_id = ? where id = ?",
+            (message_id, rec_id),
+        )
+
+    def get_recommended_event_ids(self) -> set[str]:
+        return {r["event_id"] for r in self._query("select event_id from recommendations")}
+
+    def _recs_with_events(
+        self, profile: str, where: str = "", params: tuple = (), tail: str = ""
+    ) -> list[dict]:
+        """recommendations rows with the event embedded, like select("*, events(...)")."""
+        recs = [dict(r) for r in self._query(f"select * from recommendations {where} {tail}", params)]
+        ids = list({r["event_id"] for r in recs if r["event_id"]})
+        events = {}
+        if ids:
+            rows = self._query(
+                f"select {_columns(profile)} from events "
+                f"where id in ({', '.join('?' * len(ids))})",
+                ids,
+            )
+            events = {r["id"]: _event_row(r) for r in rows}
+        for r in recs:
+            r["events"] = events.get(r["event_id"])
+        return recs
+
+    def get_recommendation_by_message_id(
+        self, message_id: int, profile: str = "card"
+    ) -> dict | None:
+        recs = self._recs_with_events(profile, "where telegram_message_id = ?", (message_id,))
+        return recs[0] if recs else None
+
+    def get_recent_recommendations(self, limit: int = 50, profile: str = "card") -> list[dict]:
+        return self._recs_with_events(
+            profile, tail=f"order by created_at desc limit {int(limit)}"
+        )
+
+    def get_week_recommendations(self, profile: str = "id-only") -> list[dict]:
+        today = date.today()
+        week_end = today + timedelta(days=7)
+        recs = []
+        for r in self._recs_with_events(profile, tail="order by score desc limit 100"):
+            ev = r.get("events")
+            if ev and today.isoformat() <= ev.get("event_date", "") <= week_end.isoformat():
+                recs.append(r)
+        return recs[:20]
+
+    # --- Weekly scripts ---
+
+    def save_weekly_script(self, script: WeeklyScript) -> str:
+        script_id = _new_id()
+        self._write(
+            "insert into weekly_scripts "
+            "(id, week_start, status, script_text, source_event_ids, created_at) "
+            "values (?, ?, ?, ?, ?, ?)",
+            (script_id, script.week_start.isoformat(), script.status, script.script_text,
+             json.dumps(script.source_event_ids), _now()),
+        )
+        return script_id
+
+    def _script_with_status(self, week_start: date, status: str) -> WeeklyScript | None:
+        rows = self._query(
+            "select * from weekly_scripts where week_start = ? and status = ? "
+            "order by approved_at desc limit 1",
+            (week_start.isoformat(), status),
+        )
+        return _script(rows[0]) if rows else None
+
+    def get_latest_approved_script(self, week_start: date) -> WeeklyScript | None:
+        return self._script_with_status(week_start, "approved")
+
+    def get_published_script(self, week_start: date) -> WeeklyScript | None:
+        return self._script_with_status(week_start, "published")
+
+    def _set_status(self, script_id: str, status: str, supersede: str, **extra) -> None:
+        rows = self._query("select week_start from weekly_scripts where id = ?", (script_id,))
+        if not rows:
+            return
+        sets = ", ".join(["status = ?", *(f"{k} = ?" for k in extra)])
+        with self._lock, self._conn:
+            self._conn.execute(
+                "update weekly_scripts set status = 'superseded' "
+                "where week_start = ? and status = ?",
+                (rows[0]["week_start"], supersede),
+            )
+            self._conn.execute(
+                f"update weekly_scripts set {sets} where id = ?",
+                (status, *extra.values(), script_id),
+            )
+
+    def publish_weekly_script(self, script_id: str) -> None:
+        self._set_status(script_id, "published", supersede="published")
+
+    def approve_weekly_script(self, script_id: str) -> None:
+        self._set_status(script_id, "approved", supersede="approved", approved_at=_now())
+
+    def get_draft_script_by_message_id(self, message_id: int) -> WeeklyScript | None:
+        rows = self._query(
+            "select * from weekly_scripts where telegram_message_id = ? and status = 'draft'",
+            (message_id,),
+        )
+        return _script(rows[0]) if rows else None
+
+    def update_weekly_script_text(self, script_id: str, new_text: str) -> None:
+        self._write("update weekly_scripts set script_text = ? where id = ?", (new_text, script_id))
+
+    def update_weekly_script_message_id(self, script_id: str, message_id: int) -> None:
+        self._write(
+            "update weekly_scripts set telegram_message_id = ? where id = ?",
+            (message_id, script_id),
+        )
+
+    # --- Scrape logs ---
+
+    def log_scrape(
+        self,
+        source: str,
+        status: str,
+        event_count: int,
+        duration_seconds: float,
+        error: str | None = None,
+        cache_hits: int = 0,
+        cache_misses: int = 0,
+    ) -> None:
+        self._write(
+            "insert into scrape_logs (id, source, status, event_count, duration_seconds, "
+            "error, cache_hits, cache_misses, created_at) values (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (_new_id(), source, status, event_count, duration_seconds, error,
+             cache_hits, cache_misses, _now()),
+        )
+
+    def get_recent_scrape_logs(self, limit: int = 12) -> list[dict]:
+        rows = self._query(
+            "select * from scrape_logs order by created_at desc limit ?", (limit,)
+        )
+        return [dict(r) for r in rows]
+
+    # --- Alert log ---
+
+    def should_alert(self, source: str) -> bool:
+        rows = self._query(
+            "select created_at from alert_log where source = ? order by created_at desc limit 1",
+            (source,),
+        )
+        if not rows:
+            return True
+        last = datetime.fromisoformat(rows[0]["created_at"].replace("Z", "+00:00"))
+        return (datetime.now(last.tzinfo) - last).total_seconds() > 3600
+
+    def log_alert(self, source: str, message: str) -> None:
+        self._write(
+            "insert into alert_log (id, source, message, created_at) values (?, ?, ?, ?)",
+            (_new_id(), source, message, _now()),
+        )
+
+    # --- Cleanup ---
+
+    def delete_past_events(self, before_date: date) -> int:
+        return self._write("delete from events where event_date < ?", (before_date.isoformat(),))
+
+    def delete_old_raw_events(self, days: int = 7) -> int:
+        cutoff = (date.today() - timedelta(days=days)).isoformat()
+        return self._write("delete from raw_events where event_date < ?", (cutoff,))
+
+    def delete_old_recommendations(self, days: int = 30) -> int:
+        cutoff = _iso(datetime.now(timezone.utc) - timedelta(days=days))
+        return self._write("delete from recommendations where created_at < ?", (cutoff,))
+
+    def delete_old_logs(self, days: int = 30) -> int:
+        cutoff = _iso(datetime.now(timezone.utc) - timedelta(days=days))
+        return self._write("delete from scrape_logs where created_at < ?", (cutoff,)) + self._write(
+            "delete from alert_log where created_at < ?", (cutoff,)
+        )
+
+    def delete_old_tombstones(self, days: int = 7) -> int:
+        cutoff = _iso(datetime.now(timezone.utc) - timedelta(days=days))
+        return self._write("delete from event_tombstones where deleted_at < ?", (cutoff,))
+
+    def clear_event_tables(self) -> None:
+        with self._lock, self._conn:
+            for table in ("recommendations", "events", "raw_events"):
+                self._conn.execute(f"delete from {table}")
+
+
+_storage: SQLiteStorage | None = None
+
+
+def get_sqlite_storage() -> SQLiteStorage:
+    """Process-wide SQLite backend at settings.sqlite_path."""
+    global _storage
+    if _storage is None:
+        _storage = SQLiteStorage(settings.sqlite_path)
+    return _storage
+
+
+def close_sqlite_storage() -> None:
+    global _storage
+    if _storage is not None:
+        _storage.close()
+        _storage = None
@@ -0,0 +1,271 @@
+"""In-process replica of the canonical events table, kept current by delta sync.
+
+db.get_upcoming_events(), get_past_events() and the dedup prefetch
+(get_canonical_events_in_range) read from here instead of selecting their
+whole window every time. The first read loads the table once. After that,
+a read that comes more than settings.event_cache_sync_seconds after the
+last sync fetches only the rows whose updated_at moved past the watermark,
+plus tombstones for rows deleted since (event_tombstones, filled by a
+delete trigger). Writes made by this process are applied straight away
+by the hooks in src/db.py, so it sees its own writes without a sync.
+
+updated_at is stamped when a transaction starts, not when it commits, so
+a row can become visible with a timestamp just behind the watermark. For
+the first SETTLE after a change, the sync therefore looks back that far,
+and re-applying a row is harmless. Tombstones are pruned after
+settings.event_tombstone_days, so a replica that hasn't synced for close
+to that long reloads in full.
+
+Cost: the full load is a `select *` of the whole events table (the
+replica answers "full" profile reads, so it needs every column), paged
+through get_events_changed_since. The table only holds the backfill
+window, since delete_past_events prunes it, but that is still a few
+thousand rows with descriptions on the first read after start-up. Set
+event_cache_enabled=False for short-lived scripts that read once. The
+replica is tied to the database it was loaded from. get_event_cache()
+starts a new one when storage_backend, sqlite_path or supabase_url
+changes.
+
+Events are shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timedelta, timezone
+
+from src.config import settings
+from src.log import get_logger
+from src.models import Event
+
+logger = get_logger("event_cache")
+
+SETTLE = timedelta(seconds=10)
+
+ChangesFn = Callable[[datetime | None], list[Event]]
+TombstonesFn = Callable[[datetime], list[dict]]
+
+
+def _parse_ts(v: str | datetime) -> datetime:
+    if isinstance(v, datetime):
+        return v
+    return datetime.fromisoformat(v.replace("Z", "+00:00"))
+
+
+def _older(a: Event, b: Event) -> bool:
+    return bool(a.updated_at and b.updated_at and a.updated_at < b.updated_at)
+
+
+def _newer_than(e: Event, ts: datetime) -> bool:
+    return bool(e.updated_at and e.updated_at > ts)
+
+
+class EventCache:
+    """Every canonical event, keyed by id and grouped by date in load order."""
+
+    def __init__(self, sync_seconds: float = 30.0, tombstone_days: int = 7) -> None:
+        self.sync_seconds = sync_seconds
+        self.tombstone_days = tombstone_days
+        self._by_date: dict[date, dict[str, Event]] = {}
+        self._dates: dict[str, date] = {}  # id -> date slot it lives in
+        self._events_mark: datetime | None = None
+        self._tombstones_mark: datetime | None = None
+        self._synced_at: float | None = None
+        self._lock = threading.Lock()
+        self._last_delta_rows = 0
+        self._counters = dict.fromkeys(
+            (
+                "hits", "misses", "syncs", "full_loads", "rows_fetched", "tombstones_applied",
+                "updates", "evictions", "invalidations",
+            ),
+            0,
+        )
+
+    # --- Sync ---
+
+    def sync(self, changes: ChangesFn, tombstones: TombstonesFn, force: bool = False) -> None:
+        """Bring the replica up to date: a full load the first time, deltas after."""
+        with self._lock:
+            if self._synced_at is None or self._age() > (self.tombstone_days - 1) * 86400:
+                self._full_load(changes)
+            elif force or self._age() >= self.sync_seconds:
+                self._delta(changes, tombstones)
+            else:
+                self._counters["hits"] += 1
+                return
+            # The read had to go to the database (full reload or delta)
+            self._counters["misses"] += 1
+            self._synced_at = time.monotonic()
+
+    def _full_load(self, changes: ChangesFn) -> None:
+        started = datetime.now(timezone.utc)
+        events = changes(None)
+        self._by_date.clear()
+        self._dates.clear()
+        for e in events:
+            self._insert(e)
+        self._events_mark = max((e.updated_at for e in events if e.updated_at), default=None)
+        self._tombstones_mark = started - SETTLE
+        self._counters["full_loads"] += 1
+        self._counters["rows_fetched"] += len(events)
+        self._last_delta_rows = len(events)
+        logger.debug("event_cache_loaded", count=len(events))
+
+    def _delta(self, changes: ChangesFn, tombstones: TombstonesFn) -> None:
+        settled = datetime.now(timezone.utc) - SETTLE
+        since = min(self._events_mark, settled) if self._events_mark else None
+        rows = changes(since)
+        dead = tombstones(min(self._tombstones_mark, settled))
+
+        for e in rows:
+            current = self._get(e.id)
+            if current is None or not _older(e, current):
+                self._remove(e.id)
+                self._insert(e)
+        for t in dead:
+            deleted_at = _parse_ts(t["deleted_at"])
+            current = self._get(t["id"])
+            # A row re-created after its tombstone stays
+            if current is not None and not _newer_than(current, deleted_at):
+                self._remove(t["id"])
+                self._counters["tombstones_applied"] += 1
+            self._tombstones_mark = max(self._tombstones_mark, deleted_at)
+
+        marks = [e.updated_at for e in rows if e.updated_at]
+        if self._events_mark:
+            marks.append(self._events_mark)
+        self._events_mark = max(marks, default=None)
+        self._counters["syncs"] += 1
+        self._counters["rows_fetched"] += len(rows) + len(dead)
+        self._last_delta_rows = len(rows) + len(dead)
+        logger.debug("event_cache_synced", rows=len(rows), tombstones=len(dead))
+
+    # --- Reads (call sync first) ---
+
+    def upcoming(self, from_date: date) -> list[Event]:
+        """event_date >= from_date, ordered by date."""
+        with self._lock:
+            return [
+                e
+                for d in sorted(self._by_date)
+                if d >= from_date
+                for e in self._by_date[d].values()
+            ]
+
+    def past(self, before: date, since: date) -> list[Event]:
+        """since <= event_date < before, newest date first."""
+        with self._lock:
+            return [
+                e
+                for d in sorted(self._by_date, reverse=True)
+                if since <= d < before
+                for e in self._by_date[d].values()
+            ]
+
+    def in_range(self, start: date, end: date) -> dict[date, list[Event]]:
+        """start <= event_date <= end, grouped by date, ordered by id within a date."""
+        with self._lock:
+            return {
+                d: sorted(self._by_date[d].values(), key=lambda e: e.id)
+                for d in sorted(self._by_date)
+                if start <= d <= end
+            }
+
+    # --- Local writes ---
+
+    def put(self, events: Iterable[Event]) -> None:
+        """Apply events this process just wrote (insert, or move to the new date)."""
+        with self._lock:
+            if self._synced_at is None:
+                return
+            for e in events:
+                if not e.id:
+                    continue
+                self._remove(e.id)
+                self._insert(e)
+                self._counters["updates"] += 1
+
+    def evict_before(self, before_date: date) -> None:
+        """Drop every event dated before `before_date` (mirrors delete_past_events)."""
+        with self._lock:
+            for d in [d for d in self._by_date if d < before_date]:
+                for event_id in self._by_date.pop(d):
+                    del self._dates[event_id]
+                    self._counters["evictions"] += 1
+
+    def invalidate(self) -> None:
+        """Forget everything; the next read does a full load."""
+        with self._lock:
+            self._by_date.clear()
+            self._dates.clear()
+            self._events_mark = None
+            self._tombstones_mark = None
+            self._synced_at = None
+            self._counters["invalidations"] += 1
+
+    def stats(self) -> dict:
+        """Hit/miss counters, replica size, watermark, and how long since the last sync."""
+        with self._lock:
+            total = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": round(self._counters["hits"] / total, 3) if total else 0.0,
+                "last_delta_rows": self._last_delta_rows,
+                "size": len(self._dates),
+                "watermark": self._events_mark.isoformat() if self._events_mark else None,
+                "age_seconds": round(self._age(), 1) if self._synced_at is not None else None,
+                "sync_seconds": self.sync_seconds,
+            }
+
+    def _age(self) -> float:
+        return time.monotonic() - self._synced_at
+
+    def _get(self, event_id: str) -> Event | None:
+        d = self._dates.get(event_id)
+        return None if d is None else self._by_date[d][event_id]
+
+    def _insert(self, e: Event) -> None:
+        self._by_date.setdefault(e.event_date, {})[e.id] = e
+        self._dates[e.id] = e.event_date
+
+    def _remove(self, event_id: str) -> None:
+        d = self._dates.pop(event_id, None)
+        if d is None:
+            return
+        slot = self._by_date[d]
+        del slot[event_id]
+        if not slot:
+            del self._by_date[d]
+
+
+_cache: EventCache | None = None
+_cache_target: tuple[str, str] | None = None
+
+
+def _target() -> tuple[str, str]:
+    """The database the replica mirrors."""
+    if settings.storage_backend == "sqlite":
+        return "sqlite", settings.sqlite_path
+    return "supabase", settings.supabase_url
+
+
+def get_event_cache() -> EventCache | None:
+    """Process-wide events replica, or None when disabled in settings."""
+    global _cache, _cache_target
+    if not settings.event_cache_enabled:
+        return None
+    if _cache is None or _cache_target != _target():
+        _cache_target = _target()
+        _cache = EventCache(
+            sync_seconds=settings.event_cache_sync_seconds,
+            tombstone_days=settings.event_tombstone_days,
+        )
+    return _cache
+
+
+def reset_event_cache() -> None:
+    """Drop the replica and its counters (tests, or after switching backends)."""
+    global _cache, _cache_target
+    _cache = _cache_target = None
@@ -0,0 +1,54 @@
+"""Event-loop lag probe.
+
+A background task sleeps for a fixed interval and records how late it wakes
+up. Anything that blocks the loop (synchronous DB calls, CPU-bound dedup)
+shows up directly as lag, which is what Telegram polling and the Twilio
+webhooks feel as stalls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class LoopLagMonitor:
+    """Samples how late asyncio.sleep(interval) returns on the running loop."""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self._samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._probe())
+
+    async def stop(self) -> dict:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        return self.snapshot()
+
+    async def _probe(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self._samples.append(max(0.0, time.perf_counter() - start - self.interval))
+
+    def snapshot(self) -> dict:
+        """max / p99 / mean lag in milliseconds over the samples so far."""
+        if not self._samples:
+            return {"samples": 0, "max_ms": 0.0, "p99_ms": 0.0, "mean_ms": 0.0}
+        ordered = sorted(self._samples)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return {
+            "samples": len(ordered),
+            "max_ms": round(ordered[-1] * 1000, 1),
+            "p99_ms": round(p99 * 1000, 1),
+            "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+        }
@@ -11,6 +11,8 @@ from src.bot.twilio_ivr import router as twilio_router
 from src.config import settings
 from src.log import get_logger
 from src.scheduler import create_scheduler
+from src.scrapers.runner import shutdown_dedup_executor
+from src.scrapers.transport import close_transport
 
 logger = get_logger("main")
 
@@ -45,6 +47,8 @@ async def lifespan(app: FastAPI):
         await tg_app.stop()
         await tg_app.shutdown()
     scheduler.shutdown()
+    await close_transport()
+    shutdown_dedup_executor()
     logger.info("shutdown_complete")
 
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import date, datetime, time
 from enum import Enum
 from typing import Any
@@ -37,6 +39,11 @@ class ScrapedEvent(BaseModel):
     image_url: str | None = None
     extra: dict[str, Any] = Field(default_factory=dict)
 
+    def content_hash(self) -> str:
+        """Stable hash of every field, used to skip re-sending unchanged rows."""
+        payload = json.dumps(self.model_dump(mode="json"), sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
 
 class Event(BaseModel):
     """Canonical deduplicated event stored in DB."""
@@ -2,12 +2,19 @@
 
 Centralizes all normalization so dedup, taste matching, and display
 use the same canonical forms.
+
+The same few thousand artist/venue/title strings are normalized over and
+over (dedup keys, fuzzy matching, taste weights), so the public functions
+are memoized with bounded LRU caches; see cache_stats().
 """
 
 from __future__ import annotations
 
 import re
 import unicodedata
+from functools import lru_cache
+
+_CACHE_SIZE = 16384
 
 # ── Performance qualifiers stripped from artist names ──────────────
 _ARTIST_QUALIFIERS = re.compile(
@@ -34,14 +41,47 @@ _PRESENTS_PREFIX = re.compile(
 # b2b / B2B splitting pattern
 _B2B_SPLIT = re.compile(r"\s+[Bb]2[Bb]\s+")
 
+# Venue room/zone qualifiers, leading "the", trailing borough/neighborhood
+_VENUE_ROOM = re.compile(
+    r"\s*[-–—]\s*(zone\s+\w+|room\s+\w+|hall|studio|stage)\b.*$", re.IGNORECASE
+)
+_VENUE_THE = re.compile(r"^the\s+")
+_VENUE_BOROUGH = re.compile(
+    r"\s+(ny|nyc|brooklyn|bk|manhattan|queens|bushwick|williamsburg|ridgewood)$"
+)
+
+
+class _PunctTable(dict):
+    """str.translate table that deletes everything `[^\\w\\s]` would.
+
+    Keeps word characters (str.isalnum() or "_") and whitespace, drops the
+    rest. Latin-1 is prebuilt; other code points are classified on first
+    sight and remembered.
+    """
+
+    def __missing__(self, cp: int) -> int | None:
+        c = chr(cp)
+        keep = c.isalnum() or c == "_" or c.isspace()
+        self[cp] = cp if keep else None
+        return self[cp]
+
+
+_PUNCT = _PunctTable()
+for _cp in range(256):
+    _PUNCT.__missing__(_cp)
+del _cp
+
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def normalize(s: str) -> str:
     """Normalize string for comparison: lowercase, strip accents/punctuation, collapse whitespace."""
     s = unicodedata.normalize("NFKD", s.lower())
-    s = re.sub(r"[^\w\s]", "", s)
-    return re.sub(r"\s+", " ", s).strip()
+    # One translate pass replaces re.sub(r"[^\w\s]", ""), and split/join
+    # collapses + strips whitespace exactly like re.sub(r"\s+", " ").strip().
+    return " ".join(s.translate(_PUNCT).split())
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def normalize_venue(s: str) -> str:
     """Normalize a venue name for comparison.
 
@@ -54,15 +94,16 @@ def normalize_venue(s: str) -> str:
     # Replace & with 'and' before base normalize strips it
     s = s.replace("&", "and")
     # Strip room/zone qualifiers (e.g. "Elsewhere - Zone One")
-    s = re.sub(r"\s*[-–—]\s*(zone\s+\w+|room\s+\w+|hall|studio|stage)\b.*$", "", s, flags=re.IGNORECASE)
+    s = _VENUE_ROOM.sub("", s)
     s = normalize(s)
     # Strip leading "the"
-    s = re.sub(r"^the\s+", "", s)
+    s = _VENUE_THE.sub("", s)
     # Strip trailing borough/city qualifiers
-    s = re.sub(r"\s+(ny|nyc|brooklyn|bk|manhattan|queens|bushwick|williamsburg|ridgewood)$", "", s)
+    s = _VENUE_BOROUGH.sub("", s)
     return s.strip()
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def normalize_artist(s: str) -> str:
     """Normalize an artist name for comparison.
 
@@ -84,17 +125,50 @@ def split_artist_entry(s: str) -> list[str]:
     Handles: "Artist1 b2b Artist2", "Artist1 B2B Artist2"
     Returns list of individual normalized artist names.
     """
+    return list(_split_artist_entry(s))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _split_artist_entry(s: str) -> tuple[str, ...]:
     parts = _B2B_SPLIT.split(s)
     if len(parts) > 1:
-        return [normalize_artist(p) for p in parts if p.strip()]
-    return [normalize_artist(s)]
+        return tuple(normalize_artist(p) for p in parts if p.strip())
+    return (normalize_artist(s),)
 
 
 def normalize_artist_list(artists: list[str]) -> set[str]:
     """Normalize and flatten an artist list, splitting b2b entries."""
     result: set[str] = set()
     for a in artists:
-        for name in split_artist_entry(a):
+        for name in _split_artist_entry(a):
             if name:
                 result.add(name)
     return result
+
+
+_CACHED = {
+    "normalize": normalize,
+    "normalize_venue": normalize_venue,
+    "normalize_artist": normalize_artist,
+    "split_artist_entry": _split_artist_entry,
+}
+
+
+def cache_stats() -> dict[str, dict[str, float]]:
+    """Hit/miss counts and hit rate for each memoized normalizer."""
+    stats = {}
+    for name, fn in _CACHED.items():
+        info = fn.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+        }
+    return stats
+
+
+def clear_caches() -> None:
+    for fn in _CACHED.values():
+        fn.cache_clear()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 
 from src import db
@@ -15,13 +17,12 @@ async def send_alert(source: str, message: str) -> None:
         logger.warning("alert_skipped_no_telegram", source=source, message=message)
         return
 
-    if not db.should_alert(source):
-        logger.debug("alert_rate_limited", source=source)
-        return
-
     text = f"[clubstack alert] {source}: {message}"
 
     try:
+        if not await asyncio.to_thread(db.should_alert, source):
+            logger.debug("alert_rate_limited", source=source)
+            return
         async with httpx.AsyncClient() as client:
             await client.post(
                 f"https://api.telegram.org/bot{settings.telegram_bot_token}/sendMessage",
@@ -30,7 +31,7 @@ async def send_alert(source: str, message: str) -> None:
                     "text": text,
                 },
             )
-        db.log_alert(source, message)
+        await asyncio.to_thread(db.log_alert, source, message)
         logger.info("alert_sent", source=source)
     except Exception as e:
         logger.error("alert_send_failed", source=source, error=str(e))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from src import db
 from src.log import get_logger
 from src.models import Event, Recommendation
@@ -20,7 +22,7 @@ async def rank_events(
     Returns list of Recommendation objects (not yet saved to DB).
     """
     if taste is None:
-        taste = TasteProfile()
+        taste = TasteProfile(await asyncio.to_thread(db.get_taste_profile))
 
     # Phase 1: Heuristic pre-filter
     scored_events, discovery_events = heuristic_prefilter(events, taste)
@@ -108,19 +110,19 @@ async def run_training_pipeline(
     exclude_recommended: bool = True,
 ) -> list[Recommendation]:
     """Score past events for training — lets the user give feedback to refine taste."""
-    events = db.get_past_events(days_back)
+    events = await asyncio.to_thread(db.get_past_events, days_back, profile="scoring")
     if not events:
         logger.warning("no_past_events", msg="No past events found for training")
         return []
 
     if exclude_recommended:
-        already = db.get_recommended_event_ids()
+        already = await asyncio.to_thread(db.get_recommended_event_ids)
         events = [e for e in events if e.id not in already]
         if not events:
             logger.info("all_past_events_already_recommended")
             return []
 
-    taste = TasteProfile()
+    taste = TasteProfile(await asyncio.to_thread(db.get_taste_profile))
     recs = await rank_events(events, taste, top_n=top_n)
 
     for rec in recs:
@@ -137,18 +139,18 @@ async def run_recommendation_pipeline(top_n: int = 10) -> list[Recommendation]:
     Skips events that already have recommendations so daily runs accumulate
     rather than duplicate scores for the same events.
     """
-    events = db.get_upcoming_events()
+    events = await asyncio.to_thread(db.get_upcoming_events, profile="scoring")
     if not events:
         logger.warning("no_events", msg="No upcoming events to rank")
         return []
 
-    already = db.get_recommended_event_ids()
+    already = await asyncio.to_thread(db.get_recommended_event_ids)
     events = [e for e in events if e.id not in already]
     if not events:
         logger.info("all_upcoming_events_already_recommended")
         return []
 
-    taste = TasteProfile()
+    taste = TasteProfile(await asyncio.to_thread(db.get_taste_profile))
     recs = await rank_events(events, taste, top_n=top_n)
 
     # Save to DB
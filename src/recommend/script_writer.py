@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import date, timedelta
 
@@ -28,7 +29,7 @@ def _gather_events_for_script() -> tuple[list[tuple[Event, str]], list[tuple[Eve
     going: list[tuple[Event, str]] = []
     top_recs: list[tuple[Event, str]] = []
 
-    events_map = {e.id: e for e in db.get_upcoming_events()}
+    events_map = {e.id: e for e in db.get_upcoming_events(profile="card")}
 
     for r in recs:
         ev = events_map.get(r.get("event_id"))
@@ -74,7 +75,7 @@ async def generate_weekly_script(
     Returns a WeeklyScript (draft, not yet saved).
     """
     if going is None or top_recs is None:
-        going, top_recs = _gather_events_for_script()
+        going, top_recs = await asyncio.to_thread(_gather_events_for_script)
 
     all_events = going + top_recs
     source_ids = [e.id for e, _ in all_events if e.id]
@@ -7,6 +7,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from src import db
 from src.bot.telegram import send_daily_recommendations, send_weekend_preview, send_weekly_script_draft
+from src.config import settings
 from src.log import get_logger
 from src.notify.alerts import send_alert
 from src.scrapers.runner import run_scrape_pipeline
@@ -67,12 +68,14 @@ async def job_cleanup() -> None:
         raw_deleted = db.delete_old_raw_events(days=7)
         recs_deleted = db.delete_old_recommendations(days=30)
         logs_deleted = db.delete_old_logs(days=30)
+        tombstones_deleted = db.delete_old_tombstones(days=settings.event_tombstone_days)
         logger.info(
             "job_cleanup_done",
             events_deleted=events_deleted,
             raw_deleted=raw_deleted,
             recs_deleted=recs_deleted,
             logs_deleted=logs_deleted,
+            tombstones_deleted=tombstones_deleted,
         )
     except Exception as e:
         logger.error("job_cleanup_failed", error=str(e))
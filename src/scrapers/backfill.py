@@ -0,0 +1,159 @@
+"""Resumable, date-sharded RA backfill.
+
+Splits a listingDate range into shards (per-day or per-week), scrapes them
+concurrently, and stores each shard through deduplicate_and_store as soon as
+it lands. Completed shards are recorded in a checkpoint file so a crashed
+run picks up where it stopped instead of starting over.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from datetime import date, timedelta
+from pathlib import Path
+
+from src.config import settings
+from src.log import get_logger
+from src.scrapers.ra import RAScraper
+from src.scrapers.runner import deduplicate_and_store_async
+from src.scrapers.transport import get_transport
+
+logger = get_logger("backfill")
+
+DEFAULT_CHECKPOINT = Path(settings.cache_dir) / "backfill_ra.json"
+
+
+def make_shards(from_date: date, to_date: date, shard_days: int = 7) -> list[tuple[date, date]]:
+    """Split [from_date, to_date] into inclusive ranges of at most shard_days."""
+    shards = []
+    start = from_date
+    while start <= to_date:
+        end = min(start + timedelta(days=shard_days - 1), to_date)
+        shards.append((start, end))
+        start = end + timedelta(days=1)
+    return shards
+
+
+class Checkpoint:
+    """Set of completed shard start dates, persisted as JSON after every shard.
+
+    The from/to range is saved alongside, so a resume on a later day can
+    pick up the original range (saved_range) rather than one recomputed
+    from today. `mismatched` is set when a checkpoint file exists but
+    belongs to different params or can't be read.
+    """
+
+    def __init__(self, path: Path, from_date: date, to_date: date, shard_days: int) -> None:
+        self.path = path
+        self.params = {
+            "from_date": from_date.isoformat(),
+            "to_date": to_date.isoformat(),
+            "shard_days": shard_days,
+        }
+        self.completed: set[str] = set()
+        self.stored = 0
+        self.mismatched = False
+        self._load()
+
+    @staticmethod
+    def saved_range(path: Path) -> tuple[date, date] | None:
+        """The (from_date, to_date) a checkpoint file was written for, if readable."""
+        try:
+            params = json.loads(path.read_text())["params"]
+            return date.fromisoformat(params["from_date"]), date.fromisoformat(params["to_date"])
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return None
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return
+        except json.JSONDecodeError:
+            data = {}
+        # A checkpoint for a different range/shard size can't be reused.
+        if data.get("params") != self.params:
+            logger.warning("backfill_checkpoint_mismatch", path=str(self.path))
+            self.mismatched = True
+            return
+        self.completed = set(data.get("completed", []))
+        self.stored = data.get("stored", 0)
+
+    def has_progress(self) -> bool:
+        return bool(self.completed)
+
+    def is_done(self, shard: tuple[date, date]) -> bool:
+        return shard[0].isoformat() in self.completed
+
+    def mark_done(self, shard: tuple[date, date], stored: int) -> None:
+        self.completed.add(shard[0].isoformat())
+        self.stored += stored
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "params": self.params,
+                    "completed": sorted(self.completed),
+                    "stored": self.stored,
+                }
+            )
+        )
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+async def backfill_ra(
+    from_date: date,
+    to_date: date,
+    shard_days: int = 7,
+    concurrency: int = 3,
+    checkpoint: Checkpoint | None = None,
+) -> int:
+    """Scrape RA over [from_date, to_date] shard by shard. Returns new canonical events."""
+    if checkpoint is None:
+        checkpoint = Checkpoint(DEFAULT_CHECKPOINT, from_date, to_date, shard_days)
+
+    shards = [s for s in make_shards(from_date, to_date, shard_days) if not checkpoint.is_done(s)]
+    logger.info(
+        "backfill_start",
+        pending=len(shards),
+        completed=len(checkpoint.completed),
+        shard_days=shard_days,
+    )
+
+    scraper = RAScraper(client=get_transport().client)
+    sem = asyncio.Semaphore(concurrency)
+
+    async def scrape_shard(shard: tuple[date, date]):
+        async with sem:
+            events = await scraper.scrape(from_date=shard[0], to_date=shard[1])
+            return shard, events
+
+    tasks = [asyncio.ensure_future(scrape_shard(s)) for s in shards]
+    new_total = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            shard, events = await next_done
+            # Shards are stored one at a time even though they are scraped in
+            # parallel; the dedup itself runs off the event loop.
+            stored = await deduplicate_and_store_async({"ra": events}) if events else 0
+            checkpoint.mark_done(shard, stored)
+            new_total += stored
+            logger.info(
+                "backfill_shard_done",
+                start=shard[0].isoformat(),
+                end=shard[1].isoformat(),
+                scraped=len(events),
+                new_events=stored,
+            )
+    finally:
+        for task in tasks:
+            task.cancel()
+        await scraper.close()
+
+    return new_total
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import abc
 import time as time_mod
+from typing import Callable
 
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.log import get_logger
 from src.models import ScrapedEvent
+from src.scrapers.http_cache import HTTPCache
+from src.scrapers.parse_cache import ParseCache
 
 logger = get_logger("scraper")
 
@@ -22,15 +25,28 @@ class BaseScraper(abc.ABC):
 
     name: str = "base"
 
-    def __init__(self) -> None:
-        self.client = httpx.AsyncClient(
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        http_cache: HTTPCache | None = None,
+        parse_cache: ParseCache | None = None,
+    ) -> None:
+        # A shared client (from the transport manager) outlives this scraper,
+        # so only close the client if we built it ourselves.
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
             timeout=30,
             headers={"User-Agent": BROWSER_UA},
             follow_redirects=True,
         )
+        self.http_cache = http_cache
+        self.cache_stats = {"hits": 0, "misses": 0}
+        self.parse_cache = parse_cache
+        self.parse_stats = {"hits": 0, "misses": 0}
 
     async def close(self) -> None:
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
 
     @abc.abstractmethod
     async def scrape(self) -> list[ScrapedEvent]:
@@ -39,16 +55,59 @@ class BaseScraper(abc.ABC):
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=15))
     async def fetch(self, url: str, **kwargs) -> httpx.Response:
-        resp = await self.client.get(url, **kwargs)
-        resp.raise_for_status()
-        return resp
+        return await self._request("GET", url, **kwargs)
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=15))
     async def post(self, url: str, **kwargs) -> httpx.Response:
-        resp = await self.client.post(url, **kwargs)
+        return await self._request("POST", url, **kwargs)
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, revalidating GETs against the HTTP cache when enabled."""
+        request = self.client.build_request(method, url, **kwargs)
+        if self.http_cache is None or not self.http_cache.cacheable(request):
+            resp = await self.client.send(request)
+            resp.raise_for_status()
+            return resp
+
+        key = self.http_cache.key(request)
+        request.headers.update(self.http_cache.validators(key))
+        resp = await self.client.send(request)
+
+        if resp.status_code == 304:
+            cached = self.http_cache.replay(key, request)
+            if cached is not None:
+                self.cache_stats["hits"] += 1
+                return cached
+            # Validators outlived their body — refetch unconditionally.
+            request = self.client.build_request(method, url, **kwargs)
+            resp = await self.client.send(request)
+
         resp.raise_for_status()
+        self.cache_stats["misses"] += 1
+        self.http_cache.store(key, resp)
         return resp
 
+    def parse_cached(
+        self,
+        resp: httpx.Response,
+        parse: Callable[[str], list[ScrapedEvent]],
+        stage: str = "page",
+    ) -> list[ScrapedEvent]:
+        """Run `parse(resp.text)`, reusing the stored result for an identical body."""
+        if self.parse_cache is None:
+            return parse(resp.text)
+
+        key = self.parse_cache.key(self.name, stage, resp.content)
+        cached = self.parse_cache.get(key)
+        if cached is not None:
+            self.parse_stats["hits"] += 1
+            return cached
+
+        self.parse_stats["misses"] += 1
+        events = parse(resp.text)
+        self.parse_cache.put(key, events)
+        return events
+
     async def run(self) -> tuple[list[ScrapedEvent], float, str | None]:
         """Run the scraper with timing and error handling."""
         start = time_mod.monotonic()
@@ -56,7 +115,12 @@ class BaseScraper(abc.ABC):
         events = []
         try:
             events = await self.scrape()
-            logger.info("scrape_complete", source=self.name, count=len(events))
+            logger.info(
+                "scrape_complete",
+                source=self.name,
+                count=len(events),
+                parse_cache_hits=self.parse_stats["hits"],
+            )
         except Exception as e:
             error = str(e)
             logger.error("scrape_failed", source=self.name, error=error)
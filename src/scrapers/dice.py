@@ -18,7 +18,7 @@ class DICEScraper(BaseScraper):
         for cat in CATEGORIES:
             url = f"{BASE_URL}/{cat}"
             resp = await self.fetch(url)
-            page_events = self._parse_page(resp.text)
+            page_events = self.parse_cached(resp, self._parse_page, stage=cat)
             for ev in page_events:
                 if ev.source_id not in seen_ids:
                     seen_ids.add(ev.source_id)
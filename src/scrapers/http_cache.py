@@ -0,0 +1,147 @@
+"""On-disk HTTP validator cache for conditional GETs.
+
+Stores the last body seen for a GET together with its ETag /
+Last-Modified validators. The next request for the same URL sends
+If-None-Match / If-Modified-Since, and a 304 is answered from disk.
+Entries are bounded and evicted least-recently-used (the meta file's
+mtime is bumped on every revalidation). The entry count is kept in
+memory, so the directory is only listed when it overflows, and then
+trimmed by a tenth at once.
+
+Only GETs are cached. On a POST a matching If-None-Match means 412, not
+304, so the RA GraphQL queries always go out in full.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import httpx
+
+from src.config import settings
+from src.log import get_logger
+
+logger = get_logger("http_cache")
+
+# Response headers worth replaying on a 304 (parsers look at content-type
+# for encoding; everything else is irrelevant to scrapers).
+_KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+
+class HTTPCache:
+    """Bounded validator cache keyed by method + URL + request body."""
+
+    def __init__(self, directory: str | Path, max_entries: int = 512) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._count = sum(1 for _ in self.directory.glob("*.json"))
+
+    @staticmethod
+    def cacheable(request: httpx.Request) -> bool:
+        return request.method == "GET"
+
+    @staticmethod
+    def key(request: httpx.Request) -> str:
+        h = hashlib.sha256()
+        h.update(request.method.encode())
+        h.update(str(request.url).encode())
+        h.update(request.content or b"")
+        return h.hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def validators(self, key: str) -> dict[str, str]:
+        """Conditional request headers for a cached entry (empty if none)."""
+        meta = self._load_meta(key)
+        if meta is None:
+            return {}
+        os.utime(self._paths(key)[0])  # mark as recently used
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def replay(self, key: str, request: httpx.Request) -> httpx.Response | None:
+        """Rebuild the stored 200 response for a 304 answer."""
+        meta = self._load_meta(key)
+        meta_path, body_path = self._paths(key)
+        if meta is None or not body_path.exists():
+            return None
+        return httpx.Response(
+            200,
+            headers=meta.get("headers", {}),
+            content=body_path.read_bytes(),
+            request=request,
+        )
+
+    def store(self, key: str, response: httpx.Response) -> bool:
+        """Persist a 200 response if it carries validators. Returns True if stored."""
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not etag and not last_modified:
+            return False
+        meta = {
+            "url": str(response.request.url),
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {k: response.headers[k] for k in _KEPT_HEADERS if k in response.headers},
+        }
+        meta_path, body_path = self._paths(key)
+        if not meta_path.exists():
+            self._count += 1
+        _atomic_write(body_path, response.content)
+        _atomic_write(meta_path, json.dumps(meta).encode())
+        if self._count > self.max_entries:
+            self._evict()
+        return True
+
+    def _evict(self) -> None:
+        entries = list(self.directory.glob("*.json"))
+        keep = self.max_entries - self.max_entries // 10
+        excess = len(entries) - keep
+        if excess > 0:
+            entries.sort(key=lambda p: p.stat().st_mtime)
+            for meta_path in entries[:excess]:
+                meta_path.unlink(missing_ok=True)
+                meta_path.with_suffix(".body").unlink(missing_ok=True)
+            logger.debug("http_cache_evicted", count=excess)
+        self._count = len(entries) - max(excess, 0)
+
+    def _load_meta(self, key: str) -> dict | None:
+        meta_path, _ = self._paths(key)
+        try:
+            return json.loads(meta_path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            logger.warning("http_cache_corrupt", key=key)
+            return None
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+_cache: HTTPCache | None = None
+
+
+def get_http_cache() -> HTTPCache | None:
+    """Process-wide validator cache, or None when disabled in settings."""
+    global _cache
+    if not settings.http_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = HTTPCache(
+            Path(settings.cache_dir) / "http",
+            max_entries=settings.http_cache_max_entries,
+        )
+    return _cache
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import re
-from datetime import date, datetime, time
-from urllib.parse import urljoin
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
 
 from bs4 import BeautifulSoup
 
+from src.config import settings
 from src.log import get_logger
 from src.models import ScrapedEvent, Source
 from src.scrapers.base import BaseScraper
@@ -14,24 +18,158 @@ from src.scrapers.base import BaseScraper
 logger = get_logger("lightandsound")
 
 BASE_URL = "https://lightandsound.design"
+MAX_DETAIL_TTL = timedelta(days=3)
+
+
+def detail_ttl(event_date: date, today: date | None = None) -> timedelta:
+    """How long cached detail-page fields stay fresh.
+
+    Details rarely change once posted, but last-minute edits (set times,
+    venue reveals) cluster right before the night, so the TTL shrinks as
+    the event approaches.
+    """
+    days_out = (event_date - (today or date.today())).days
+    if days_out > 14:
+        return MAX_DETAIL_TTL
+    if days_out > 3:
+        return timedelta(days=1)
+    if days_out > 0:
+        return timedelta(hours=6)
+    return timedelta(hours=1)
+
+
+class DetailCache:
+    """Persistent source_url -> enrichment fields, with a date-aware TTL.
+
+    Entries for nights that have passed are dropped on load and on save,
+    so the file only ever holds upcoming events.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+        try:
+            self._entries = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError):
+            logger.warning("detail_cache_corrupt", path=str(self.path))
+        self._prune()
+
+    def get(self, url: str, event_date: date) -> dict | None:
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        fetched_at = datetime.fromisoformat(entry["fetched_at"])
+        if datetime.now(timezone.utc) - fetched_at > detail_ttl(event_date):
+            return None
+        return entry["fields"]
+
+    def put(self, url: str, fields: dict, event_date: date | None = None) -> None:
+        self._entries[url] = {
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "event_date": event_date.isoformat() if event_date else None,
+            "fields": fields,
+        }
+        self._dirty = True
+
+    def _prune(self) -> None:
+        """Drop past events, and undated entries older than the longest TTL."""
+        today = date.today()
+        stale_before = datetime.now(timezone.utc) - MAX_DETAIL_TTL
+
+        def expired(entry: dict) -> bool:
+            if entry.get("event_date"):
+                return date.fromisoformat(entry["event_date"]) < today
+            return datetime.fromisoformat(entry["fetched_at"]) < stale_before
+
+        dead = [url for url, entry in self._entries.items() if expired(entry)]
+        for url in dead:
+            del self._entries[url]
+        if dead:
+            self._dirty = True
+            logger.debug("detail_cache_pruned", count=len(dead))
+
+    def save(self) -> None:
+        self._prune()
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._entries))
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+def get_detail_cache() -> DetailCache | None:
+    """Detail-page cache under settings.cache_dir, or None when disabled."""
+    if not settings.lightandsound_detail_cache_enabled:
+        return None
+    return DetailCache(Path(settings.cache_dir) / "lightandsound_details.json")
 
 
 class LightAndSoundScraper(BaseScraper):
     name = "lightandsound"
 
+    def __init__(self, *args, detail_cache: DetailCache | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.detail_cache = detail_cache
+
     async def scrape(self) -> list[ScrapedEvent]:
         # Phase 1: Get event listing page
         resp = await self.fetch(BASE_URL)
-        soup = BeautifulSoup(resp.text, "lxml")
-        stubs = self._parse_listing(soup)
+        stubs = self.parse_cached(
+            resp,
+            lambda html: self._parse_listing(BeautifulSoup(html, "lxml")),
+            stage="listing",
+        )
 
         # Phase 2: Fetch detail pages for ticket URLs that have Event JSON-LD
-        events = []
-        for stub in stubs:
-            enriched = await self._enrich_event(stub)
-            events.append(enriched)
+        try:
+            return await self._enrich_all(stubs)
+        finally:
+            if self.detail_cache is not None:
+                self.detail_cache.save()
+
+    async def _enrich_all(self, stubs: list[ScrapedEvent]) -> list[ScrapedEvent]:
+        """Enrich stubs concurrently, at most N in flight per host.
+
+        Each stub is taken as soon as its detail page lands (as_completed),
+        not once the whole batch is in. Waiting stops after
+        settings.lightandsound_enrich_deadline seconds so the runner's 120s
+        timeout never throws away the whole source; stubs whose detail page
+        hadn't arrived by then are returned as-is.
+        """
+        if not stubs:
+            return stubs
 
-        return events
+        slots: dict[str, asyncio.Semaphore] = {}
+
+        async def enrich(stub: ScrapedEvent) -> ScrapedEvent:
+            host = urlsplit(stub.source_url or "").hostname or ""
+            if host not in slots:
+                slots[host] = asyncio.Semaphore(settings.lightandsound_per_host_limit)
+            async with slots[host]:
+                return await self._enrich_event(stub)
+
+        tasks = [asyncio.create_task(enrich(stub)) for stub in stubs]
+        enriched = 0
+        try:
+            for next_done in asyncio.as_completed(
+                tasks, timeout=settings.lightandsound_enrich_deadline
+            ):
+                stub = await next_done
+                enriched += 1
+                logger.debug("enrich_done", source_id=stub.source_id, enriched=enriched)
+        except TimeoutError:
+            logger.warning("enrich_deadline", enriched=enriched, pending=len(tasks) - enriched)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        # _enrich_event fills stubs in place, so listing order is preserved.
+        return stubs
 
     def _parse_listing(self, soup: BeautifulSoup) -> list[ScrapedEvent]:
         """Parse the main listing page for event stubs.
@@ -84,87 +222,123 @@ class LightAndSoundScraper(BaseScraper):
         if not stub.source_url:
             return stub
 
+        if self.detail_cache is not None:
+            fields = self.detail_cache.get(stub.source_url, stub.event_date)
+            if fields is not None:
+                self._apply_enrichment(stub, fields)
+                return stub
+
         try:
             resp = await self.fetch(stub.source_url)
-            soup = BeautifulSoup(resp.text, "lxml")
+            fields = self._extract_enrichment(resp.text)
+        except Exception:
+            logger.warning("enrich_failed", source_id=stub.source_id, url=stub.source_url)
+            return stub
 
-            # Look for JSON-LD (Event schema)
-            for script in soup.select('script[type="application/ld+json"]'):
-                try:
-                    ld = json.loads(script.string)
-                except (json.JSONDecodeError, TypeError):
-                    continue
+        if self.detail_cache is not None:
+            self.detail_cache.put(stub.source_url, fields, stub.event_date)
+        self._apply_enrichment(stub, fields)
+        return stub
 
-                if isinstance(ld, list):
-                    for item in ld:
-                        if item.get("@type") == "Event":
-                            ld = item
-                            break
-                    else:
-                        continue
+    @staticmethod
+    def _extract_enrichment(html: str) -> dict:
+        """Pull enrichment fields out of a detail page's Event JSON-LD.
+
+        Returns a JSON-serializable dict (empty if the page has no Event
+        JSON-LD) so it can be cached and replayed by _apply_enrichment.
+        """
+        soup = BeautifulSoup(html, "lxml")
+        for script in soup.select('script[type="application/ld+json"]'):
+            try:
+                ld = json.loads(script.string)
+            except (json.JSONDecodeError, TypeError):
+                continue
 
-                if ld.get("@type") != "Event":
+            if isinstance(ld, list):
+                for item in ld:
+                    if item.get("@type") == "Event":
+                        ld = item
+                        break
+                else:
                     continue
 
-                # Enrich from JSON-LD
-                start = ld.get("startDate")
-                if start:
-                    try:
-                        dt = datetime.fromisoformat(start.replace("Z", "+00:00"))
-                        stub.start_time = dt.time()
-                    except (ValueError, TypeError):
-                        pass
+            if ld.get("@type") != "Event":
+                continue
 
-                end = ld.get("endDate")
-                if end:
+            fields: dict = {}
+            start = ld.get("startDate")
+            if start:
+                try:
+                    dt = datetime.fromisoformat(start.replace("Z", "+00:00"))
+                    fields["start_time"] = dt.time().isoformat()
+                except (ValueError, TypeError):
+                    pass
+
+            end = ld.get("endDate")
+            if end:
+                try:
+                    dt = datetime.fromisoformat(end.replace("Z", "+00:00"))
+                    fields["end_time"] = dt.time().isoformat()
+                except (ValueError, TypeError):
+                    pass
+
+            location = ld.get("location", {})
+            if isinstance(location, dict):
+                fields["venue_name"] = location.get("name")
+                addr = location.get("address", {})
+                if isinstance(addr, dict):
+                    fields["venue_address"] = addr.get("streetAddress")
+                elif isinstance(addr, str):
+                    fields["venue_address"] = addr
+
+            fields["description"] = ld.get("description")
+            image = ld.get("image")
+            if isinstance(image, list):
+                image = image[0] if image else None
+            fields["image_url"] = image
+
+            # Artists from performers
+            performers = ld.get("performer") or ld.get("performers") or []
+            if isinstance(performers, dict):
+                performers = [performers]
+            fields["artists"] = [
+                p["name"] for p in performers if isinstance(p, dict) and p.get("name")
+            ]
+
+            # Price from offers
+            offers = ld.get("offers", {})
+            if isinstance(offers, list):
+                offers = offers[0] if offers else {}
+            if isinstance(offers, dict):
+                price = offers.get("price")
+                if price:
                     try:
-                        dt = datetime.fromisoformat(end.replace("Z", "+00:00"))
-                        stub.end_time = dt.time()
+                        fields["price_min_cents"] = int(float(price) * 100)
+                        fields["cost_display"] = f"${float(price):.0f}"
                     except (ValueError, TypeError):
-                        pass
-
-                location = ld.get("location", {})
-                if isinstance(location, dict):
-                    stub.venue_name = location.get("name") or stub.venue_name
-                    addr = location.get("address", {})
-                    if isinstance(addr, dict):
-                        stub.venue_address = addr.get("streetAddress")
-                    elif isinstance(addr, str):
-                        stub.venue_address = addr
-
-                stub.description = ld.get("description") or stub.description
-                stub.image_url = ld.get("image") or stub.image_url
-                if isinstance(stub.image_url, list):
-                    stub.image_url = stub.image_url[0] if stub.image_url else None
-
-                # Artists from performers
-                performers = ld.get("performer") or ld.get("performers") or []
-                if isinstance(performers, dict):
-                    performers = [performers]
-                for p in performers:
-                    if isinstance(p, dict) and p.get("name"):
-                        stub.artists.append(p["name"])
-
-                # Price from offers
-                offers = ld.get("offers", {})
-                if isinstance(offers, list):
-                    offers = offers[0] if offers else {}
-                if isinstance(offers, dict):
-                    price = offers.get("price")
-                    if price:
-                        try:
-                            cents = int(float(price) * 100)
-                            stub.price_min_cents = cents
-                            stub.cost_display = f"${float(price):.0f}"
-                        except (ValueError, TypeError):
-                            stub.cost_display = str(price)
-
-                break  # Found event JSON-LD, done
+                        fields["cost_display"] = str(price)
 
-        except Exception:
-            logger.warning("enrich_failed", source_id=stub.source_id, url=stub.source_url)
+            return fields  # Found event JSON-LD, done
 
-        return stub
+        return {}
+
+    @staticmethod
+    def _apply_enrichment(stub: ScrapedEvent, fields: dict) -> None:
+        """Fill a stub from fields produced by _extract_enrichment."""
+        if fields.get("start_time"):
+            stub.start_time = time.fromisoformat(fields["start_time"])
+        if fields.get("end_time"):
+            stub.end_time = time.fromisoformat(fields["end_time"])
+        stub.venue_name = fields.get("venue_name") or stub.venue_name
+        if "venue_address" in fields:
+            stub.venue_address = fields["venue_address"]
+        stub.description = fields.get("description") or stub.description
+        stub.image_url = fields.get("image_url") or stub.image_url
+        stub.artists.extend(fields.get("artists", []))
+        if "price_min_cents" in fields:
+            stub.price_min_cents = fields["price_min_cents"]
+        if "cost_display" in fields:
+            stub.cost_display = fields["cost_display"]
 
     @staticmethod
     def _parse_date_text(text: str) -> date | None:
@@ -0,0 +1,349 @@
+"""Match features and candidate blocking for fuzzy dedup.
+
+Each event entering dedup is reduced once to a MatchFeatures record (the
+normalized, token-sorted strings thefuzz would compare plus the normalized
+artist set). Fuzzy comparison and blocking both work on these records, so
+no pair comparison re-normalizes anything. DateScores batches the title
+and venue string scoring for a whole date into rapidfuzz calls, and
+cluster_date groups a date's events transitively with union-find.
+
+is_fuzzy_match needs two of three checks (title, artists, venue) to pass,
+so any real match passes either the artist check or both the title and
+venue checks. The index exploits that to skip pairs that cannot match:
+
+- artists: Jaccard > 0.5 implies at least one shared normalized artist.
+- title / venue: token_sort_ratio > 85 implies the two processed strings
+  share a character bigram (or are identical when shorter than two chars).
+
+A candidate is any entry sharing an artist, or sharing both a title bigram
+and a venue bigram. Every pair is still confirmed with is_fuzzy_match, so
+match results are identical to comparing against every entry.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+
+import numpy as np
+from rapidfuzz import process
+from rapidfuzz.fuzz import ratio
+from thefuzz.utils import full_process
+
+from src.config import settings
+from src.models import Event, ScrapedEvent, Source
+from src.normalize import normalize, normalize_artist_list, normalize_venue
+
+
+def token_sort_key(s: str) -> str:
+    """The exact string thefuzz's token_sort_ratio compares for `s`."""
+    return " ".join(sorted(full_process(s, force_ascii=True).split()))
+
+
+def _grams(processed: str) -> set[str]:
+    if len(processed) < 2:
+        return {processed}
+    return {processed[i : i + 2] for i in range(len(processed) - 1)}
+
+
+def fuzz_grams(s: str) -> set[str]:
+    """Bigrams of the exact string thefuzz's token_sort_ratio compares."""
+    return _grams(token_sort_key(s))
+
+
+@dataclass(frozen=True, slots=True)
+class MatchFeatures:
+    """Everything is_fuzzy_match looks at, normalized once per event."""
+
+    event_date: date
+    title: str  # normalize(title)
+    title_sorted: str  # token_sort_key(title)
+    venue: str | None  # normalize_venue(venue_name); None when there is no venue
+    venue_sorted: str | None
+    artists: frozenset[str]  # normalize_artist_list(artists)
+
+    @property
+    def key(self) -> str:
+        """Exact-match key used by deduplicate_and_store."""
+        return f"{self.title}|{self.event_date}|{self.venue or ''}"
+
+
+def match_features(e: ScrapedEvent | Event) -> MatchFeatures:
+    title = normalize(e.title)
+    venue = normalize_venue(e.venue_name) if e.venue_name else None
+    return MatchFeatures(
+        event_date=e.event_date,
+        title=title,
+        title_sorted=token_sort_key(title),
+        venue=venue,
+        venue_sorted=token_sort_key(venue) if venue is not None else None,
+        artists=frozenset(normalize_artist_list(e.artists)) if e.artists else frozenset(),
+    )
+
+
+TITLE_THRESHOLD = 85
+VENUE_THRESHOLD = 90
+
+
+def _score(a: str, b: str) -> int:
+    # token_sort_ratio == round(ratio) of the token-sorted strings
+    return int(round(ratio(a, b)))
+
+
+class ScoreTable:
+    """Which (query, choice) string pairs score above a threshold.
+
+    Every query is scored against every choice up front in one
+    multi-threaded cdist call. Only cells above the threshold are kept,
+    rechecked with the same int(round()) thefuzz applies. Strings outside
+    the table fall back to scoring the pair directly.
+    """
+
+    def __init__(
+        self, queries: list[str], choices: list[str], threshold: int, workers: int = -1
+    ) -> None:
+        self.threshold = threshold
+        rows = list(dict.fromkeys(queries))
+        cols = list(dict.fromkeys(choices))
+        self._rows = {q: i for i, q in enumerate(rows)}
+        self._cols = {c: j for j, c in enumerate(cols)}
+        self._passing: set[tuple[int, int]] = set()
+        if not rows or not cols:
+            return
+
+        # score_cutoff prunes to a superset; the exact check happens below.
+        matrix = process.cdist(
+            rows, cols, scorer=ratio, dtype=np.float64,
+            workers=workers, score_cutoff=threshold,
+        )
+        cells = zip(*np.nonzero(matrix), strict=True)
+        hits = ((int(i), int(j), float(matrix[i, j])) for i, j in cells)
+        self._passing = {(i, j) for i, j, score in hits if int(round(score)) > threshold}
+
+    def passes(self, query: str, choice: str) -> bool:
+        i = self._rows.get(query)
+        j = self._cols.get(choice)
+        if i is None or j is None:
+            return _score(query, choice) > self.threshold
+        return (i, j) in self._passing
+
+
+class DateScores:
+    """Batched title/venue scores between one date's scraped and known events.
+
+    `choices` should cover every entry the scraped events may be compared
+    with, including the scraped events themselves (they become entries as
+    new events).
+    """
+
+    def __init__(
+        self,
+        scraped: list[MatchFeatures],
+        choices: list[MatchFeatures],
+        workers: int | None = None,
+    ) -> None:
+        workers = settings.dedup_score_workers if workers is None else workers
+        self.title = ScoreTable(
+            [f.title_sorted for f in scraped],
+            [f.title_sorted for f in choices],
+            TITLE_THRESHOLD,
+            workers,
+        )
+        self.venue = ScoreTable(
+            [f.venue_sorted for f in scraped if f.venue_sorted is not None],
+            [f.venue_sorted for f in choices if f.venue_sorted is not None],
+            VENUE_THRESHOLD,
+            workers,
+        )
+
+
+def features_match(a: MatchFeatures, b: MatchFeatures, scores: DateScores | None = None) -> bool:
+    """is_fuzzy_match on precomputed features: two of three must pass.
+
+    With `scores`, title and venue checks are looked up in the batched
+    tables (a is the scraped side) instead of scored pair by pair.
+    """
+    if a.event_date != b.event_date:
+        return False
+
+    checks = 0
+    if scores is not None:
+        title_ok = scores.title.passes(a.title_sorted, b.title_sorted)
+    else:
+        title_ok = _score(a.title_sorted, b.title_sorted) > TITLE_THRESHOLD
+    if title_ok:
+        checks += 1
+
+    if a.artists and b.artists:
+        if len(a.artists & b.artists) / len(a.artists | b.artists) > 0.5:
+            checks += 1
+
+    if checks == 0:
+        return False  # the venue check alone can't reach two
+
+    if a.venue_sorted is not None and b.venue_sorted is not None:
+        if scores is not None:
+            venue_ok = scores.venue.passes(a.venue_sorted, b.venue_sorted)
+        else:
+            venue_ok = _score(a.venue_sorted, b.venue_sorted) > VENUE_THRESHOLD
+        if venue_ok:
+            checks += 1
+
+    return checks >= 2
+
+
+def _block_keys(f: MatchFeatures) -> tuple[frozenset[str], set[str], set[str]]:
+    title = _grams(f.title_sorted)
+    venue = _grams(f.venue_sorted) if f.venue_sorted is not None else set()
+    return f.artists, title, venue
+
+
+class BlockingIndex:
+    """Per-date inverted index from block keys to existing_map keys."""
+
+    def __init__(self) -> None:
+        self._order: dict[str, int] = {}  # existing_map key -> insertion rank
+        self._artist: dict[str, set[str]] = {}
+        self._title: dict[str, set[str]] = {}
+        self._venue: dict[str, set[str]] = {}
+        self.skipped = 0
+
+    def add(self, key: str, features: MatchFeatures) -> None:
+        """Index (or re-index after a merge) the entry stored under `key`.
+
+        Keys from an earlier version of the entry are left in place; they
+        can only add candidates, never hide one.
+        """
+        self._order.setdefault(key, len(self._order))
+        artists, title, venue = _block_keys(features)
+        for table, tokens in ((self._artist, artists), (self._title, title), (self._venue, venue)):
+            for token in tokens:
+                table.setdefault(token, set()).add(key)
+
+    def candidates(self, scraped: MatchFeatures) -> list[str]:
+        """existing_map keys that could fuzzy-match, in existing_map order."""
+        artists, title, venue = _block_keys(scraped)
+        found: set[str] = set()
+        for token in artists:
+            found |= self._artist.get(token, set())
+        if venue:
+            by_title: set[str] = set()
+            for token in title:
+                by_title |= self._title.get(token, set())
+            by_venue: set[str] = set()
+            for token in venue:
+                by_venue |= self._venue.get(token, set())
+            found |= by_title & by_venue
+        self.skipped += len(self._order) - len(found)
+        return sorted(found, key=self._order.__getitem__)
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 where each set holds at most one anchor.
+
+    Anchors are existing canonical events: two of them are never merged
+    into one cluster, so a scraped event that resembles two stored rows
+    joins only one of them.
+    """
+
+    def __init__(self, n: int, anchors: set[int]) -> None:
+        self.parent = list(range(n))
+        self.anchor: dict[int, int] = {i: i for i in anchors}  # root -> anchor node
+
+    def find(self, x: int) -> int:
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Join the sets of a and b. False if already joined or both anchored."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb or (ra in self.anchor and rb in self.anchor):
+            return False
+        if rb in self.anchor:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        return True
+
+
+_SOURCE_RANK = {s: i for i, s in enumerate(Source)}
+
+
+def _identity(e: ScrapedEvent | Event) -> tuple:
+    """Input-order-independent sort key: stored rows by id, then by source."""
+    if isinstance(e, Event):
+        return (0, e.id or "", "")
+    return (1, _SOURCE_RANK[e.source], e.source_id)
+
+
+@dataclass
+class DateClusters:
+    """cluster_date output: (existing row or None, scraped members) per cluster."""
+
+    clusters: list[tuple[Event | None, list[ScrapedEvent]]] = field(default_factory=list)
+    comparisons: int = 0
+    skipped: int = 0
+
+
+def cluster_date(existing: list[Event], scraped: list[ScrapedEvent]) -> DateClusters:
+    """Group one date's scraped events with each other and with stored rows.
+
+    Every pair with an equal exact-match key, or that features_match
+    accepts among blocking-index candidates, becomes an edge. Edges are
+    applied in a fixed order (exact before fuzzy, then by event identity),
+    so the clusters don't depend on scrape order, and matches are
+    transitive: a scraped event that only resembles another scraped event
+    still lands in that event's cluster. Members come back sorted by
+    identity, ready to be merged in one pass.
+    """
+    nodes: list[ScrapedEvent | Event] = [*existing, *scraped]
+    first_scraped = len(existing)
+    feats = [match_features(e) for e in nodes]
+    idents = [_identity(e) for e in nodes]
+    scores = DateScores(feats[first_scraped:], feats)
+    result = DateClusters()
+
+    index = BlockingIndex()
+    by_key: dict[str, list[int]] = {}
+    for i, f in enumerate(feats):
+        index.add(str(i), f)
+        by_key.setdefault(f.key, []).append(i)
+
+    def edge(kind: int, i: int, j: int) -> tuple:
+        return (kind, *sorted((idents[i], idents[j])), i, j)
+
+    edges = []
+    for group in by_key.values():
+        for a, i in enumerate(group):
+            for j in group[a + 1 :]:
+                if j >= first_scraped:  # at least one side is scraped
+                    edges.append(edge(0, i, j))
+
+    for i in range(first_scraped, len(nodes)):
+        for candidate in index.candidates(feats[i]):
+            j = int(candidate)
+            if j >= first_scraped and j <= i:
+                continue  # each scraped pair is compared once
+            if feats[j].key == feats[i].key:
+                continue  # already an exact edge
+            result.comparisons += 1
+            if features_match(feats[i], feats[j], scores):
+                edges.append(edge(1, i, j))
+    result.skipped = index.skipped
+
+    uf = UnionFind(len(nodes), anchors=set(range(first_scraped)))
+    for *_, i, j in sorted(edges):
+        uf.union(i, j)
+
+    members: dict[int, list[int]] = {}
+    for i in range(first_scraped, len(nodes)):
+        members.setdefault(uf.find(i), []).append(i)
+    for root, group in members.items():
+        anchor = uf.anchor.get(root)
+        group.sort(key=idents.__getitem__)
+        result.clusters.append(
+            (nodes[anchor] if anchor is not None else None, [nodes[i] for i in group])
+        )
+    result.clusters.sort(key=lambda c: _identity(c[1][0]))
+    return result
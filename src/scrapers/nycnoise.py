@@ -16,8 +16,9 @@ class NYCNoiseScraper(BaseScraper):
 
     async def scrape(self) -> list[ScrapedEvent]:
         resp = await self.fetch(BASE_URL)
-        soup = BeautifulSoup(resp.text, "lxml")
-        return self._parse_page(soup)
+        return self.parse_cached(
+            resp, lambda html: self._parse_page(BeautifulSoup(html, "lxml"))
+        )
 
     def _parse_page(self, soup: BeautifulSoup) -> list[ScrapedEvent]:
         events = []
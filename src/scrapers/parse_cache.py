@@ -0,0 +1,90 @@
+"""Content-addressed cache of parsed scraper output.
+
+A 200 with a byte-identical body still costs a full BeautifulSoup/JSON parse.
+This cache hashes the raw body and, on a match, rebuilds the previously
+parsed ScrapedEvents from disk instead. Entries are bounded and evicted
+least-recently-used (file mtime is bumped on every hit).
+
+Keys include the current year: listings that omit it (L&S "Mar 15") are
+resolved against date.today().year, so the same body parses differently
+once the year turns over.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import date
+from pathlib import Path
+
+from src.config import settings
+from src.log import get_logger
+from src.models import ScrapedEvent
+
+logger = get_logger("parse_cache")
+
+# Bump when a parser change should invalidate everything already on disk.
+_FORMAT_VERSION = 1
+
+
+class ParseCache:
+    """Bounded on-disk store of body hash -> parsed ScrapedEvent list."""
+
+    def __init__(self, directory: str | Path, max_entries: int = 256) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(source: str, stage: str, body: bytes, year: int | None = None) -> str:
+        year = year or date.today().year
+        h = hashlib.sha256(f"{_FORMAT_VERSION}|{year}|{source}|{stage}|".encode())
+        h.update(body)
+        return h.hexdigest()
+
+    def get(self, key: str) -> list[ScrapedEvent] | None:
+        path = self.directory / f"{key}.json"
+        try:
+            rows = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            logger.warning("parse_cache_corrupt", key=key)
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)  # mark as recently used
+        return [ScrapedEvent.model_validate(r) for r in rows]
+
+    def put(self, key: str, events: list[ScrapedEvent]) -> None:
+        path = self.directory / f"{key}.json"
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps([e.model_dump(mode="json") for e in events]))
+        os.replace(tmp, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = list(self.directory.glob("*.json"))
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[:excess]:
+            path.unlink(missing_ok=True)
+        logger.debug("parse_cache_evicted", count=excess)
+
+
+_cache: ParseCache | None = None
+
+
+def get_parse_cache() -> ParseCache | None:
+    """Process-wide parse cache, or None when disabled in settings."""
+    global _cache
+    if not settings.parse_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = ParseCache(
+            Path(settings.cache_dir) / "parsed",
+            max_entries=settings.parse_cache_max_entries,
+        )
+    return _cache
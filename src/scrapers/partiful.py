@@ -13,7 +13,7 @@ class PartifulScraper(BaseScraper):
 
     async def scrape(self) -> list[ScrapedEvent]:
         resp = await self.fetch(DISCOVER_URL)
-        return self._parse_page(resp.text)
+        return self.parse_cached(resp, self._parse_page)
 
     def _parse_page(self, html: str) -> list[ScrapedEvent]:
         import json
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import math
 from datetime import date, time, timedelta
 
+from src.config import settings
+from src.log import get_logger
 from src.models import ScrapedEvent, Source
 from src.scrapers.base import BaseScraper
 
+logger = get_logger("ra")
+
 GRAPHQL_URL = "https://ra.co/graphql"
 AREA_ID = 8  # New York
+PAGE_SIZE = 100
 
 QUERY = """
 query GET_DEFAULT_EVENTS_LISTING(
@@ -41,31 +48,48 @@ query GET_DEFAULT_EVENTS_LISTING(
 class RAScraper(BaseScraper):
     name = "ra"
 
-    async def scrape(self, from_date: date | None = None) -> list[ScrapedEvent]:
-        events: list[ScrapedEvent] = []
-        page = 1
+    async def scrape(
+        self,
+        from_date: date | None = None,
+        max_pages: int | None = None,
+        to_date: date | None = None,
+    ) -> list[ScrapedEvent]:
+        """Fetch page 1, then fan out the remaining pages concurrently.
+
+        Page 1 tells us totalResults, so the rest can be requested in parallel
+        (bounded by settings.ra_page_concurrency) and merged in page order.
+        """
         listing_from = (from_date or date.today()).isoformat()
-        listing_to = (date.today() + timedelta(days=14)).isoformat()
-        while True:
-            variables = {
-                "filters": {
-                    "areas": {"eq": AREA_ID},
-                    "listingDate": {"gte": listing_from, "lte": listing_to},
-                },
-                "pageSize": 100,
-                "page": page,
-            }
-            resp = await self.post(
-                GRAPHQL_URL,
-                json={"query": QUERY, "variables": variables},
+        listing_to = (to_date or date.today() + timedelta(days=14)).isoformat()
+        max_pages = max_pages or settings.ra_max_pages
+
+        items, total = await self._fetch_page(1, listing_from, listing_to)
+        if not items:
+            return []
+
+        page_count = math.ceil(total / PAGE_SIZE)
+        if page_count > max_pages:
+            logger.warning(
+                "ra_page_limit_reached",
+                total_results=total,
+                pages=page_count,
+                max_pages=max_pages,
+                dropped=total - max_pages * PAGE_SIZE,
             )
-            data = resp.json()
-            listings = data.get("data", {}).get("eventListings", {})
-            items = listings.get("data", [])
-            if not items:
-                break
+            page_count = max_pages
+
+        sem = asyncio.Semaphore(settings.ra_page_concurrency)
+
+        async def fetch_page(page: int) -> list[dict]:
+            async with sem:
+                page_items, _ = await self._fetch_page(page, listing_from, listing_to)
+                return page_items
+
+        rest = await asyncio.gather(*(fetch_page(p) for p in range(2, page_count + 1)))
 
-            for item in items:
+        events: list[ScrapedEvent] = []
+        for page_items in [items, *rest]:
+            for item in page_items:
                 ev = item.get("event", {})
                 if not ev:
                     continue
@@ -73,15 +97,28 @@ class RAScraper(BaseScraper):
                 if parsed:
                     events.append(parsed)
 
-            total = listings.get("totalResults", 0)
-            if page * 100 >= total:
-                break
-            page += 1
-            if page > 5:  # safety cap
-                break
-
         return events
 
+    async def _fetch_page(
+        self, page: int, listing_from: str, listing_to: str
+    ) -> tuple[list[dict], int]:
+        """Fetch one listing page. Returns (items, totalResults)."""
+        variables = {
+            "filters": {
+                "areas": {"eq": AREA_ID},
+                "listingDate": {"gte": listing_from, "lte": listing_to},
+            },
+            "pageSize": PAGE_SIZE,
+            "page": page,
+        }
+        resp = await self.post(
+            GRAPHQL_URL,
+            json={"query": QUERY, "variables": variables},
+        )
+        data = resp.json()
+        listings = (data.get("data") or {}).get("eventListings") or {}
+        return listings.get("data") or [], listings.get("totalResults") or 0
+
     def _parse_event(self, ev: dict) -> ScrapedEvent | None:
         try:
             event_date = date.fromisoformat(ev["date"][:10])
@@ -1,21 +1,32 @@
 from __future__ import annotations
 
 import asyncio
+import multiprocessing
+import time as time_mod
+import uuid
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, timedelta
 
-from thefuzz import fuzz
-
 from src import db
+from src.config import settings
 from src.log import get_logger
+from src.loop_lag import LoopLagMonitor
 from src.models import Event, ScrapedEvent
 from src.notify.alerts import send_alert
-from src.normalize import normalize, normalize_artist_list, normalize_venue
+from src.normalize import normalize_artist_list
+from src.scrapers.base import BaseScraper
 from src.scrapers.basement import BasementScraper
 from src.scrapers.dice import DICEScraper
-from src.scrapers.lightandsound import LightAndSoundScraper
+from src.scrapers.http_cache import get_http_cache
+from src.scrapers.lightandsound import LightAndSoundScraper, get_detail_cache
+from src.scrapers.matching import cluster_date, features_match, match_features
 from src.scrapers.nycnoise import NYCNoiseScraper
+from src.scrapers.parse_cache import get_parse_cache
 from src.scrapers.partiful import PartifulScraper
 from src.scrapers.ra import RAScraper
+from src.scrapers.transport import get_transport
 
 logger = get_logger("runner")
 
@@ -51,30 +62,11 @@ def is_fuzzy_match(a: ScrapedEvent, b: Event) -> bool:
     1. Title similarity > 85 (token_sort_ratio)
     2. Artist Jaccard > 0.5
     3. Venue similarity > 90
-    """
-    if a.event_date != b.event_date:
-        return False
-
-    checks = 0
-
-    # Title
-    title_score = fuzz.token_sort_ratio(normalize(a.title), normalize(b.title))
-    if title_score > 85:
-        checks += 1
-
-    # Artists
-    if artist_jaccard(a.artists, b.artists) > 0.5:
-        checks += 1
 
-    # Venue
-    if a.venue_name and b.venue_name:
-        venue_score = fuzz.token_sort_ratio(
-            normalize_venue(a.venue_name), normalize_venue(b.venue_name)
-        )
-        if venue_score > 90:
-            checks += 1
-
-    return checks >= 2
+    Dedup compares precomputed MatchFeatures directly; this is the
+    one-off form for callers holding plain events.
+    """
+    return features_match(match_features(a), match_features(b))
 
 
 def merge_into_canonical(scraped: ScrapedEvent, existing: Event | None) -> Event:
@@ -102,8 +94,14 @@ def merge_into_canonical(scraped: ScrapedEvent, existing: Event | None) -> Event
             image_url=scraped.image_url,
         )
 
-    # Merge: prefer non-null, longer descriptions, more artists
-    e = existing.model_copy()
+    # Merge: prefer non-null, longer descriptions, more artists.
+    # Copy the mutable containers too so `existing` is never modified.
+    e = existing.model_copy(
+        update={
+            "source_urls": dict(existing.source_urls),
+            "sources": list(existing.sources),
+        }
+    )
     if scraped.start_time and not e.start_time:
         e.start_time = scraped.start_time
     if scraped.end_time and not e.end_time:
@@ -138,102 +136,383 @@ def merge_into_canonical(scraped: ScrapedEvent, existing: Event | None) -> Event
     return e
 
 
-async def run_all_scrapers() -> dict[str, list[ScrapedEvent]]:
+class CanonicalWriteBuffer:
+    """Collects merged/new canonical events and writes them in bulk chunks.
+
+    Keyed by event id, so an event merged several times in one run is
+    written once, in its final state.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[str, Event] = {}
+
+    def add(self, event: Event) -> None:
+        self._pending[event.id] = event
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def flush(self, chunk_size: int | None = None) -> int:
+        """Upsert everything pending. Returns total rows written."""
+        chunk_size = chunk_size or settings.canonical_write_chunk_size
+        events = list(self._pending.values())
+        written = 0
+        for i in range(0, len(events), chunk_size):
+            chunk = events[i : i + chunk_size]
+            start = time_mod.monotonic()
+            rows = db.upsert_canonical_events(chunk)
+            written += rows
+            logger.info(
+                "canonical_flush_chunk",
+                chunk=i // chunk_size,
+                rows=rows,
+                seconds=round(time_mod.monotonic() - start, 3),
+            )
+        self._pending.clear()
+        return written
+
+
+def _build_scrapers(scraper_classes: list[type[BaseScraper]]) -> list[BaseScraper]:
+    """Instantiate scrapers on the shared transport and caches."""
+    transport = get_transport()
+    http_cache = get_http_cache()
+    parse_cache = get_parse_cache()
+    scrapers = []
+    for cls in scraper_classes:
+        kwargs = {}
+        if cls is LightAndSoundScraper:
+            kwargs["detail_cache"] = get_detail_cache()
+        scrapers.append(
+            cls(
+                client=transport.client,
+                http_cache=http_cache,
+                parse_cache=parse_cache,
+                **kwargs,
+            )
+        )
+    return scrapers
+
+
+async def _run_scraper(scraper: BaseScraper):
+    """scraper.run() under the per-source timeout; exceptions are returned."""
+    try:
+        return await asyncio.wait_for(scraper.run(), timeout=120)
+    except Exception as e:
+        return e
+
+
+def _log_transport_reuse(before: dict) -> None:
+    after = get_transport().stats()
+    logger.info(
+        "transport_reuse",
+        requests=after["requests"] - before["requests"],
+        connections_opened=after["connections_opened"] - before["connections_opened"],
+        reused=after["reused"] - before["reused"],
+    )
+
+
+async def _log_scrape(name: str, *args, **kwargs) -> None:
+    """Write a scrape_logs row off the event loop.
+
+    A failure to log is reported on its own and never raised, so the caller
+    can't mistake it for a failure of the scrape or the store it describes.
+    """
+    try:
+        await asyncio.to_thread(db.log_scrape, name, *args, **kwargs)
+    except Exception as e:  # the database being down is the usual cause
+        logger.error("scrape_log_failed", source=name, error=str(e))
+
+
+async def _record_result(scraper: BaseScraper, result, max_date: date) -> list[ScrapedEvent]:
+    """Log a scraper's outcome (scrape_logs, alerts). Returns events up to max_date."""
+    name = scraper.name
+    cache = scraper.cache_stats
+    if isinstance(result, Exception):
+        logger.error("scraper_exception", source=name, error=str(result))
+        await _log_scrape(
+            name, "error", 0, 0, str(result),
+            cache_hits=cache["hits"], cache_misses=cache["misses"],
+        )
+        await send_alert(name, f"Scraper failed: {result}")
+        return []
+
+    events, duration, error = result
+    status = "success" if error is None else "error"
+    await _log_scrape(
+        name, status, len(events), duration, error,
+        cache_hits=cache["hits"], cache_misses=cache["misses"],
+    )
+    return [e for e in events if e.event_date <= max_date]
+
+
+async def run_all_scrapers(
+    scraper_classes: list[type[BaseScraper]] | None = None,
+) -> dict[str, list[ScrapedEvent]]:
     """Run all scrapers concurrently. Returns {source_name: events}.
 
     Events beyond 14 days out are filtered to keep the DB focused.
     """
+    if scraper_classes is None:
+        scraper_classes = ALL_SCRAPERS
     max_date = date.today() + timedelta(days=14)
-    scrapers = [cls() for cls in ALL_SCRAPERS]
-    results = await asyncio.gather(
-        *(asyncio.wait_for(s.run(), timeout=120) for s in scrapers),
-        return_exceptions=True,
-    )
+    before = get_transport().stats()
+    scrapers = _build_scrapers(scraper_classes)
+    results = await asyncio.gather(*(_run_scraper(s) for s in scrapers))
+    _log_transport_reuse(before)
 
     all_events: dict[str, list[ScrapedEvent]] = {}
-    for scraper_cls, result in zip(ALL_SCRAPERS, results):
-        name = scraper_cls.name if hasattr(scraper_cls, "name") else scraper_cls.__name__
-        if isinstance(result, Exception):
-            logger.error("scraper_exception", source=name, error=str(result))
-            db.log_scrape(name, "error", 0, 0, str(result))
-            await send_alert(name, f"Scraper failed: {result}")
-            continue
-
-        events, duration, error = result
-        status = "success" if error is None else "error"
-        db.log_scrape(name, status, len(events), duration, error)
-
+    for scraper, result in zip(scrapers, results):
+        events = await _record_result(scraper, result, max_date)
         if events:
-            filtered = [e for e in events if e.event_date <= max_date]
-            if filtered:
-                all_events[name] = filtered
+            all_events[scraper.name] = events
 
     return all_events
 
 
-def deduplicate_and_store(all_events: dict[str, list[ScrapedEvent]]) -> int:
-    """Deduplicate scraped events and store canonical events. Returns count stored."""
-    # Step 1: Store all raw events
-    for source_name, events in all_events.items():
-        count = db.upsert_raw_events(events)
-        logger.info("raw_events_stored", source=source_name, count=count)
+@dataclass
+class DedupPlan:
+    """Result of the CPU-bound dedup stage: what to write, plus counters."""
 
-    # Step 2: Group all scraped events by date
+    writes: CanonicalWriteBuffer
+    new_events: int = 0
+    unchanged: int = 0
+    comparisons: int = 0
+    skipped: int = 0
+
+
+def _group_by_date(all_events: dict[str, list[ScrapedEvent]]) -> dict[date, list[ScrapedEvent]]:
     by_date: dict[date, list[ScrapedEvent]] = {}
     for events in all_events.values():
         for e in events:
             by_date.setdefault(e.event_date, []).append(e)
+    return by_date
+
 
-    # Step 3: For each date, deduplicate against existing canonical + each other
+def _store_raw(all_events: dict[str, list[ScrapedEvent]]) -> None:
+    for source_name, events in all_events.items():
+        count = db.upsert_raw_events(events)
+        # upsert_raw_events collapses repeats of a source_id within the batch
+        unique = len({(e.source, e.source_id) for e in events})
+        logger.info(
+            "raw_events_stored",
+            source=source_name,
+            count=count,
+            unchanged=unique - count,
+        )
+
+
+def plan_canonical_writes(
+    by_date: dict[date, list[ScrapedEvent]],
+    prefetched: dict[date, list[Event]],
+) -> DedupPlan:
+    """Deduplicate each date against existing canonical events + each other.
+
+    Each date is clustered (see cluster_date) and every cluster is merged
+    once, so the plan doesn't depend on the order events were scraped in.
+
+    Pure computation with no database access, so it can run in a worker
+    process; everything it needs is passed in and returned.
+    """
+    writes = CanonicalWriteBuffer()
     total_stored = 0
+    unchanged = 0
+    comparisons = 0
+    skipped = 0
     for event_date, scraped_list in by_date.items():
-        # Get existing canonical events for this date
-        existing = db.get_canonical_events_by_date_venue(event_date, None)
-        existing_map: dict[str, Event] = {}  # normalized key -> Event
-        for e in existing:
-            key = f"{normalize(e.title)}|{e.event_date}|{normalize_venue(e.venue_name or '')}"
-            existing_map[key] = e
-
-        for scraped in scraped_list:
-            key = f"{normalize(scraped.title)}|{scraped.event_date}|{normalize_venue(scraped.venue_name or '')}"
-
-            # Exact match
-            if key in existing_map:
-                merged = merge_into_canonical(scraped, existing_map[key])
-                merged.id = existing_map[key].id
-                db.upsert_canonical_event(merged)
-                existing_map[key] = merged
-                continue
-
-            # Fuzzy match against existing
-            matched = False
-            for ex_key, ex_event in existing_map.items():
-                if is_fuzzy_match(scraped, ex_event):
-                    merged = merge_into_canonical(scraped, ex_event)
-                    merged.id = ex_event.id
-                    db.upsert_canonical_event(merged)
-                    existing_map[ex_key] = merged
-                    matched = True
-                    break
-
-            if not matched:
-                # New event
-                new_event = merge_into_canonical(scraped, None)
-                event_id = db.upsert_canonical_event(new_event)
-                new_event.id = event_id
-                existing_map[key] = new_event
+        found = cluster_date(prefetched.get(event_date, []), scraped_list)
+        comparisons += found.comparisons
+        skipped += found.skipped
+
+        # One merge per cluster, folding members in identity order
+        for existing, members in found.clusters:
+            merged = existing
+            for scraped in members:
+                merged = merge_into_canonical(scraped, merged)
+            if existing is None:
+                # Client-side id so the bulk upsert inserts a new row
+                merged.id = str(uuid.uuid4())
+                writes.add(merged)
                 total_stored += 1
+            elif merged != existing:
+                writes.add(merged)
+            else:
+                unchanged += len(members)
+
+    return DedupPlan(writes, total_stored, unchanged, comparisons, skipped)
+
+
+def _finish(plan: DedupPlan, written: int) -> int:
+    logger.info(
+        "dedup_complete",
+        new_events=plan.new_events,
+        rows_written=written,
+        unchanged_skipped=plan.unchanged,
+        fuzzy_comparisons=plan.comparisons,
+        fuzzy_skipped=plan.skipped,
+    )
+    return plan.new_events
+
+
+def deduplicate_and_store(all_events: dict[str, list[ScrapedEvent]]) -> int:
+    """Deduplicate scraped events and store canonical events. Returns count stored."""
+    # Step 1: Store all raw events
+    _store_raw(all_events)
+
+    # Step 2: Group all scraped events by date
+    by_date = _group_by_date(all_events)
+    if not by_date:
+        logger.info("dedup_complete", new_events=0)
+        return 0
+
+    # Step 3: Prefetch every canonical event in the batch's date window at once
+    prefetched = db.get_canonical_events_in_range(min(by_date), max(by_date))
+
+    # Step 4: Dedup, then flush the buffered writes in bulk
+    plan = plan_canonical_writes(by_date, prefetched)
+    return _finish(plan, plan.writes.flush())
+
 
-    logger.info("dedup_complete", new_events=total_stored)
-    return total_stored
+_executor: Executor | None = None
 
 
-async def run_scrape_pipeline() -> int:
-    """Full pipeline: scrape all sources, deduplicate, store. Returns new event count."""
-    all_events = await run_all_scrapers()
-    total_scraped = sum(len(v) for v in all_events.values())
-    logger.info("scrape_pipeline_scraped", total=total_scraped, sources=len(all_events))
+def get_dedup_executor() -> Executor | None:
+    """Process-wide worker for plan_canonical_writes, or None to run inline.
 
-    new_count = deduplicate_and_store(all_events)
-    logger.info("scrape_pipeline_complete", new_events=new_count)
-    return new_count
+    settings.dedup_worker picks "thread" (one worker thread), "process" (one
+    spawned worker process, so dedup never holds the app's GIL, at the cost
+    of pickling events both ways) or "inline".
+    """
+    global _executor
+    if settings.dedup_worker == "inline":
+        return None
+    if _executor is None:
+        if settings.dedup_worker == "process":
+            _executor = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dedup")
+    return _executor
+
+
+def shutdown_dedup_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+async def deduplicate_and_store_async(all_events: dict[str, list[ScrapedEvent]]) -> int:
+    """deduplicate_and_store without blocking the event loop.
+
+    Supabase calls run in threads and the dedup/merge stage runs on
+    get_dedup_executor(), so Telegram polling and the Twilio webhooks keep
+    being served while a scrape is stored.
+    """
+    await asyncio.to_thread(_store_raw, all_events)
+
+    by_date = _group_by_date(all_events)
+    if not by_date:
+        logger.info("dedup_complete", new_events=0)
+        return 0
+
+    prefetched = await asyncio.to_thread(
+        db.get_canonical_events_in_range, min(by_date), max(by_date)
+    )
+    executor = get_dedup_executor()
+    if executor is None:
+        plan = plan_canonical_writes(by_date, prefetched)
+    else:
+        loop = asyncio.get_running_loop()
+        plan = await loop.run_in_executor(executor, plan_canonical_writes, by_date, prefetched)
+    written = await asyncio.to_thread(plan.writes.flush)
+    return _finish(plan, written)
+
+
+# Serializes dedup so two sources never read-modify-write the same dates at
+# once. One lock per event loop: an asyncio.Lock binds to the first loop that
+# waits on it, and tests and scripts call asyncio.run more than once.
+_canonical_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _canonical_lock() -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    lock = _canonical_locks.get(loop)
+    if lock is None:
+        lock = _canonical_locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def _log_store_failure(name: str, scraped: int, error: Exception) -> None:
+    logger.error("source_store_failed", source=name, error=str(error))
+    await _log_scrape(name, "error", scraped, 0, f"store failed: {error}")
+
+
+async def run_scrape_pipeline(scraper_classes: list[type[BaseScraper]] | None = None) -> int:
+    """Full pipeline: scrape all sources, deduplicate, store. Returns new event count.
+
+    Each source is stored as soon as its scraper finishes instead of
+    waiting for the slowest one. Dedup runs under _canonical_lock(), so each
+    source sees the canonical rows written by the sources before it. A
+    source that fails to store is logged as an error in scrape_logs and
+    doesn't stop the others.
+    """
+    if scraper_classes is None:
+        scraper_classes = ALL_SCRAPERS
+    max_date = date.today() + timedelta(days=14)
+    before = get_transport().stats()
+    scrapers = _build_scrapers(scraper_classes)
+    pipeline_start = time_mod.monotonic()
+    lag = LoopLagMonitor()
+    lag.start()
+
+    async def run_source(scraper: BaseScraper) -> tuple[int, int]:
+        result = await _run_scraper(scraper)
+        scraped_at = time_mod.monotonic()
+        events = await _record_result(scraper, result, max_date)
+        if not events:
+            return 0, 0
+        try:
+            async with _canonical_lock():
+                locked_at = time_mod.monotonic()
+                new_count = await deduplicate_and_store_async({scraper.name: events})
+        except Exception as e:
+            await _log_store_failure(scraper.name, len(events), e)
+            return len(events), 0
+        stored_at = time_mod.monotonic()
+        logger.info(
+            "source_stored",
+            source=scraper.name,
+            events=len(events),
+            new_events=new_count,
+            scrape_seconds=round(scraped_at - pipeline_start, 3),
+            lock_wait_seconds=round(locked_at - scraped_at, 3),
+            store_seconds=round(stored_at - locked_at, 3),
+            ready_seconds=round(stored_at - pipeline_start, 3),
+        )
+        return len(events), new_count
+
+    tasks = [asyncio.ensure_future(run_source(s)) for s in scrapers]
+    total_scraped = 0
+    new_total = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            scraped, new_count = await next_done
+            total_scraped += scraped
+            new_total += new_count
+    finally:
+        for task in tasks:
+            task.cancel()
+        lag_stats = await lag.stop()
+    _log_transport_reuse(before)
+    logger.info("event_loop_lag", worker=settings.dedup_worker, **lag_stats)
+
+    logger.info(
+        "scrape_pipeline_complete",
+        scraped=total_scraped,
+        new_events=new_total,
+        seconds=round(time_mod.monotonic() - pipeline_start, 3),
+    )
+    return new_total
@@ -0,0 +1,119 @@
+"""Process-wide pooled HTTP transport shared by all scrapers.
+
+Every scrape run used to build (and tear down) one AsyncClient per scraper,
+paying DNS + TLS again for every source. The manager here owns a single
+HTTP/2-capable client that lives for the whole process, caps concurrent
+requests per host, and counts how many requests reused a pooled connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from src.config import settings
+from src.log import get_logger
+from src.scrapers.base import BROWSER_UA
+
+logger = get_logger("transport")
+
+
+class _HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Wraps the pooled transport with a per-host semaphore and reuse counters."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, per_host: int) -> None:
+        self._inner = inner
+        self._per_host = per_host
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self.requests = 0
+        self.connections_opened = 0
+        self.by_host: dict[str, dict[str, int]] = {}
+
+    def _slot(self, host: str) -> asyncio.Semaphore:
+        if host not in self._slots:
+            self._slots[host] = asyncio.Semaphore(self._per_host)
+        return self._slots[host]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        counts = self.by_host.setdefault(host, {"requests": 0, "connections": 0})
+
+        async def trace(name: str, info: dict) -> None:
+            # Fires only when httpcore has to dial a fresh TCP connection.
+            if name == "connection.connect_tcp.complete":
+                self.connections_opened += 1
+                counts["connections"] += 1
+
+        request.extensions = {**request.extensions, "trace": trace}
+        async with self._slot(host):
+            self.requests += 1
+            counts["requests"] += 1
+            return await self._inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class TransportManager:
+    """Owns the shared AsyncClient handed to scrapers by the runner."""
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._transport: _HostLimitedTransport | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            inner = httpx.AsyncHTTPTransport(
+                http2=settings.scraper_http2,
+                limits=httpx.Limits(
+                    max_connections=settings.scraper_max_connections,
+                    max_keepalive_connections=settings.scraper_max_connections,
+                    keepalive_expiry=settings.scraper_keepalive_seconds,
+                ),
+            )
+            self._transport = _HostLimitedTransport(
+                inner, per_host=settings.scraper_per_host_limit
+            )
+            self._client = httpx.AsyncClient(
+                transport=self._transport,
+                timeout=30,
+                headers={"User-Agent": BROWSER_UA},
+                follow_redirects=True,
+            )
+            logger.info("transport_created", http2=settings.scraper_http2)
+        return self._client
+
+    def stats(self) -> dict:
+        """Connection reuse counters since the client was created."""
+        t = self._transport
+        if t is None:
+            return {"requests": 0, "connections_opened": 0, "reused": 0, "by_host": {}}
+        return {
+            "requests": t.requests,
+            "connections_opened": t.connections_opened,
+            "reused": max(0, t.requests - t.connections_opened),
+            "by_host": {h: dict(c) for h, c in t.by_host.items()},
+        }
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._transport = None
+
+
+_manager: TransportManager | None = None
+
+
+def get_transport() -> TransportManager:
+    global _manager
+    if _manager is None:
+        _manager = TransportManager()
+    return _manager
+
+
+async def close_transport() -> None:
+    if _manager is not None:
+        await _manager.close()
@@ -0,0 +1,202 @@
+"""Blocking index must never hide a pair that is_fuzzy_match would accept."""
+
+import random
+from datetime import date
+
+from thefuzz import fuzz
+
+from src.models import Event, ScrapedEvent, Source
+from src.scrapers import matching
+from src.scrapers.matching import (
+    BlockingIndex,
+    DateScores,
+    ScoreTable,
+    cluster_date,
+    features_match,
+    fuzz_grams,
+    match_features,
+)
+from src.scrapers.runner import is_fuzzy_match
+
+DAY = date(2026, 3, 15)
+
+
+def test_fuzz_grams_catch_match_without_shared_trigram():
+    # Scores 86 but the two strings share no 3-character substring
+    assert fuzz.token_sort_ratio("abxcdef", "abcdyef") > 85
+    assert fuzz_grams("abxcdef") & fuzz_grams("abcdyef")
+
+
+def test_fuzz_grams_short_strings():
+    assert fuzz_grams("") == {""}
+    assert fuzz_grams("!!!") == {""}  # punctuation-only normalizes to empty
+    assert fuzz_grams("a") == {"a"}
+
+
+def test_candidates_share_artist():
+    index = BlockingIndex()
+    index.add("k1", match_features(Event(title="Totally Different", event_date=DAY, artists=["Honey Dijon"])))
+    index.add("k2", match_features(Event(title="Other", event_date=DAY, artists=["DJ B"])))
+    scraped = ScrapedEvent(
+        source=Source.DICE, source_id="1", title="HD", event_date=DAY,
+        artists=["Honey Dijon (Live)"],
+    )
+    assert index.candidates(match_features(scraped)) == ["k1"]
+    assert index.skipped == 1
+
+
+def test_candidates_keep_insertion_order():
+    index = BlockingIndex()
+    for k in ("c", "a", "b"):
+        index.add(k, match_features(Event(title="Night", event_date=DAY, artists=["DJ A"])))
+    scraped = ScrapedEvent(source=Source.RA, source_id="1", title="x", event_date=DAY, artists=["DJ A"])
+    assert index.candidates(match_features(scraped)) == ["c", "a", "b"]
+
+
+def _random_event(rng: random.Random, cls, i: int):
+    words = ["night", "honey", "dijon", "techno", "club", "nowadays", "all", "long", "a", "b"]
+    venues = ["Nowadays", "Basement", "Basement NY", "The Lot Radio", "Good Room", "", None]
+    artists = ["DJ A", "DJ B", "Octo Octa", "Honey Dijon (Live)", "DJ A b2b DJ B"]
+    title = " ".join(rng.choice(words) for _ in range(rng.randint(0, 4)))
+    if rng.random() < 0.3:
+        # near-duplicate with a character edit
+        title = title[:-1] + rng.choice("xyz") if title else "x"
+    fields = dict(
+        title=title,
+        event_date=DAY,
+        venue_name=rng.choice(venues),
+        artists=rng.sample(artists, rng.randint(0, 2)),
+    )
+    if cls is ScrapedEvent:
+        return ScrapedEvent(source=Source.RA, source_id=str(i), **fields)
+    return Event(id=str(i), **fields)
+
+
+def test_blocking_matches_brute_force():
+    rng = random.Random(1234)
+    for trial in range(40):
+        existing = [_random_event(rng, Event, i) for i in range(30)]
+        index = BlockingIndex()
+        for i, e in enumerate(existing):
+            index.add(str(i), match_features(e))
+        for j in range(30):
+            scraped = _random_event(rng, ScrapedEvent, j)
+            brute = next((str(i) for i, e in enumerate(existing) if is_fuzzy_match(scraped, e)), None)
+            blocked = next(
+                (
+                    k
+                    for k in index.candidates(match_features(scraped))
+                    if is_fuzzy_match(scraped, existing[int(k)])
+                ),
+                None,
+            )
+            assert blocked == brute, (trial, scraped, brute, blocked)
+
+
+def _legacy_is_fuzzy_match(a, b) -> bool:
+    """is_fuzzy_match as it was before MatchFeatures, normalizing per pair."""
+    from src.normalize import normalize, normalize_venue
+    from src.scrapers.runner import artist_jaccard
+
+    if a.event_date != b.event_date:
+        return False
+    checks = 0
+    if fuzz.token_sort_ratio(normalize(a.title), normalize(b.title)) > 85:
+        checks += 1
+    if artist_jaccard(a.artists, b.artists) > 0.5:
+        checks += 1
+    if a.venue_name and b.venue_name:
+        if fuzz.token_sort_ratio(normalize_venue(a.venue_name), normalize_venue(b.venue_name)) > 90:
+            checks += 1
+    return checks >= 2
+
+
+def test_features_match_agrees_with_pairwise_normalization():
+    rng = random.Random(99)
+    for i in range(3000):
+        a = _random_event(rng, ScrapedEvent, i)
+        b = _random_event(rng, Event, i)
+        assert features_match(match_features(a), match_features(b)) == _legacy_is_fuzzy_match(a, b), (a, b)
+
+
+def test_match_features_key_and_missing_venue():
+    f = match_features(Event(title="The Night!", event_date=DAY, venue_name=None, artists=[]))
+    assert f.key == f"the night|{DAY}|"
+    assert f.venue is None and f.venue_sorted is None
+    assert f.artists == frozenset()
+
+
+def test_score_table_matches_token_sort_ratio():
+    rng = random.Random(7)
+    words = ["night", "nights", "honey", "dijon", "club", "a", "b", "ab", ""]
+    strings = [
+        matching.token_sort_key(" ".join(rng.choice(words) for _ in range(rng.randint(0, 4))))
+        for _ in range(150)
+    ]
+    table = ScoreTable(strings[:60], strings, threshold=85, workers=1)
+    for q in strings[:60]:
+        for c in strings:
+            assert table.passes(q, c) == (fuzz.token_sort_ratio(q, c) > 85), (q, c)
+    # Strings outside the table are scored directly
+    assert table.passes("unseen title", "unseen title")
+
+
+def test_date_scores_agree_with_pairwise():
+    rng = random.Random(5)
+    for _ in range(20):
+        existing = [match_features(_random_event(rng, Event, i)) for i in range(25)]
+        scraped = [match_features(_random_event(rng, ScrapedEvent, i)) for i in range(25)]
+        scores = DateScores(scraped, existing + scraped, workers=1)
+        for a in scraped:
+            for b in existing + scraped:
+                assert features_match(a, b, scores) == features_match(a, b)
+
+
+def _ev(cls, ident, title, artists, venue="Nowadays"):
+    if cls is Event:
+        return Event(id=ident, title=title, event_date=DAY, venue_name=venue, artists=artists)
+    return ScrapedEvent(
+        source=Source.RA, source_id=ident, title=title, event_date=DAY,
+        venue_name=venue, artists=artists,
+    )
+
+
+def test_cluster_date_is_transitive():
+    a = _ev(ScrapedEvent, "a", "Alpha Night", ["P"])
+    b = _ev(ScrapedEvent, "b", "Alpha Night", ["Q"])  # a~b on title + venue
+    c = _ev(ScrapedEvent, "c", "Other Thing", ["Q"])  # b~c on venue + artists
+    assert not is_fuzzy_match(a, _ev(Event, "c", "Other Thing", ["Q"]))
+
+    found = cluster_date([], [c, a, b])
+    assert [[m.source_id for m in members] for _, members in found.clusters] == [["a", "b", "c"]]
+
+
+def test_cluster_date_never_joins_two_existing_rows():
+    x1 = _ev(Event, "x1", "Alpha Night", ["P"])
+    x2 = _ev(Event, "x2", "Other Thing", ["Q"])
+    bridge = _ev(ScrapedEvent, "b", "Alpha Night", ["Q"])  # matches both
+
+    for existing in ([x1, x2], [x2, x1]):
+        found = cluster_date(existing, [bridge])
+        assert len(found.clusters) == 1
+        anchor, members = found.clusters[0]
+        assert anchor.id == "x1"  # same choice whatever the prefetch order
+        assert [m.source_id for m in members] == ["b"]
+
+
+def test_cluster_date_independent_of_scrape_order():
+    rng = random.Random(11)
+    existing = [_random_event(rng, Event, i) for i in range(15)]
+    scraped = [_random_event(rng, ScrapedEvent, i) for i in range(25)]
+
+    def shape(found):
+        return [
+            (anchor.id if anchor else None, [m.source_id for m in members])
+            for anchor, members in found.clusters
+        ]
+
+    expected = shape(cluster_date(existing, scraped))
+    for _ in range(10):
+        rng.shuffle(scraped)
+        rng.shuffle(existing)
+        assert shape(cluster_date(existing, scraped)) == expected
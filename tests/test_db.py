@@ -0,0 +1,265 @@
+"""Tests for db helpers that don't need a live Supabase."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import db
+from src.models import Event, ScrapedEvent, Source
+
+
+def _row(i: int, day: str) -> dict:
+    return {"id": f"id-{i}", "title": f"Event {i}", "event_date": day, "source_urls": "{}"}
+
+
+@patch("src.db.get_client")
+def test_get_canonical_events_in_range_paginates_and_groups(mock_get_client, monkeypatch):
+    monkeypatch.setattr(db, "PAGE_SIZE", 2)
+    monkeypatch.setattr(db.settings, "event_cache_enabled", False)
+    query = MagicMock()
+    # Every builder call returns the same query object; only execute() varies
+    for name in ("table", "select", "gte", "lte", "order", "range"):
+        getattr(query, name).return_value = query
+    query.execute.side_effect = [
+        MagicMock(data=[_row(1, "2026-03-14"), _row(2, "2026-03-14")]),
+        MagicMock(data=[_row(3, "2026-03-15")]),
+    ]
+    mock_get_client.return_value = query
+
+    by_date = db.get_canonical_events_in_range(date(2026, 3, 14), date(2026, 3, 15))
+
+    assert query.execute.call_count == 2
+    query.range.assert_any_call(0, 1)
+    query.range.assert_any_call(2, 3)
+    assert [e.id for e in by_date[date(2026, 3, 14)]] == ["id-1", "id-2"]
+    assert [e.id for e in by_date[date(2026, 3, 15)]] == ["id-3"]
+
+
+def _scraped(source_id: str, title: str = "Night") -> ScrapedEvent:
+    return ScrapedEvent(
+        source=Source.RA,
+        source_id=source_id,
+        title=title,
+        event_date=date(2026, 3, 15),
+        extra={"b": 1, "a": 2},
+    )
+
+
+def test_content_hash_is_stable_and_content_sensitive():
+    assert _scraped("1").content_hash() == _scraped("1").content_hash()
+    assert _scraped("1").content_hash() != _scraped("1", title="Other").content_hash()
+
+
+@patch("src.db.get_client")
+def test_upsert_raw_events_sends_only_new_or_changed(mock_get_client):
+    unchanged, changed, new = _scraped("1"), _scraped("2", title="Edited"), _scraped("3")
+    query = MagicMock()
+    for name in ("table", "select", "eq", "in_", "upsert"):
+        getattr(query, name).return_value = query
+    query.execute.side_effect = [
+        # stored hashes lookup
+        MagicMock(data=[
+            {"source_id": "1", "content_hash": unchanged.content_hash()},
+            {"source_id": "2", "content_hash": _scraped("2").content_hash()},
+        ]),
+        # upsert result
+        MagicMock(data=[{"id": "x"}, {"id": "y"}]),
+    ]
+    mock_get_client.return_value = query
+
+    assert db.upsert_raw_events([unchanged, changed, new]) == 2
+    (rows,), _ = query.upsert.call_args
+    assert [r["source_id"] for r in rows] == ["2", "3"]
+    assert all(r["content_hash"] for r in rows)
+
+
+@patch("src.db.get_client")
+def test_upsert_raw_events_all_unchanged_skips_write(mock_get_client):
+    ev = _scraped("1")
+    query = MagicMock()
+    for name in ("table", "select", "eq", "in_"):
+        getattr(query, name).return_value = query
+    query.execute.return_value = MagicMock(
+        data=[{"source_id": "1", "content_hash": ev.content_hash()}]
+    )
+    mock_get_client.return_value = query
+
+    assert db.upsert_raw_events([ev]) == 0
+    query.upsert.assert_not_called()
+
+
+@patch("src.db.get_client")
+def test_get_events_changed_since_keyset_pages(mock_get_client, monkeypatch):
+    monkeypatch.setattr(db, "PAGE_SIZE", 2)
+    query = MagicMock()
+    for name in ("table", "select", "gt", "or_", "order", "limit"):
+        getattr(query, name).return_value = query
+    ts = "2026-03-01T12:00:00+00:00"
+    query.execute.side_effect = [
+        MagicMock(data=[{**_row(1, "2026-03-14"), "updated_at": ts},
+                        {**_row(2, "2026-03-14"), "updated_at": ts}]),
+        MagicMock(data=[{**_row(3, "2026-03-15"), "updated_at": ts}]),
+    ]
+    mock_get_client.return_value = query
+
+    since = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    events = db.get_events_changed_since(since)
+
+    assert [e.id for e in events] == ["id-1", "id-2", "id-3"]
+    query.gt.assert_called_once_with("updated_at", since.isoformat())
+    # Rows sharing one updated_at are paged by id, not skipped
+    query.or_.assert_called_once_with(
+        f'updated_at.gt."{ts}",and(updated_at.eq."{ts}",id.gt.id-2)'
+    )
+
+
+class _FakeTable:
+    """PostgREST select stand-in serving `rows`, capped at `max_rows` per request."""
+
+    def __init__(self, n: int, max_rows: int = 1000, count: bool = True) -> None:
+        self.rows = [{"id": f"{i:05d}"} for i in range(n)]
+        self.max_rows = max_rows
+        self.count = count
+        self.ranges: list[tuple[int, int]] = []
+        self.counted: list[str | None] = []
+        self.in_flight = self.peak = 0
+        self._lock = threading.Lock()
+
+    def build(self, count: str | None = None):
+        self.counted.append(count)
+        return _FakeQuery(self, count)
+
+
+class _FakeQuery:
+    def __init__(self, table: _FakeTable, count: str | None) -> None:
+        self.table, self.count = table, count
+
+    def order(self, *args, **kwargs):
+        return self
+
+    gte = lte = order
+
+    def range(self, start: int, end: int):
+        self.start, self.end = start, end
+        return self
+
+    def execute(self):
+        t = self.table
+        with t._lock:
+            t.ranges.append((self.start, self.end))
+            t.in_flight += 1
+            t.peak = max(t.peak, t.in_flight)
+        time.sleep(0.01)
+        with t._lock:
+            t.in_flight -= 1
+        end = min(self.end + 1, self.start + t.max_rows)
+        count = len(t.rows) if self.count and t.count else None
+        return MagicMock(data=t.rows[self.start : end], count=count)
+
+
+async def test_iter_rows_fetches_pages_concurrently_in_order():
+    table = _FakeTable(95)
+    rows = [r["id"] async for r in db.iter_rows(table.build, page_size=10, concurrency=3)]
+
+    assert rows == [r["id"] for r in table.rows]
+    assert table.counted == ["exact"] + [None] * 9
+    assert sorted(table.ranges) == [(i, i + 9) for i in range(0, 95, 10)]
+    assert 1 < table.peak <= 3
+
+
+async def test_iter_rows_shrinks_to_server_cap():
+    table = _FakeTable(25, max_rows=4)
+    rows = [r async for r in db.iter_rows(table.build, page_size=10)]
+    assert len(rows) == 25
+    assert (4, 7) in table.ranges
+
+
+def test_read_rows_without_count_walks_sequentially():
+    table = _FakeTable(25, count=False)
+    assert len(db.read_rows(table.build, page_size=10)) == 25
+    assert table.ranges == [(0, 9), (10, 19), (20, 29)]
+
+
+@patch("src.db.get_client")
+async def test_get_taste_profile_reads_every_page_inside_a_running_loop(
+    mock_get_client, monkeypatch
+):
+    monkeypatch.setattr(db, "PAGE_SIZE", 2)
+    table = _FakeTable(5)
+    for row in table.rows:
+        row.update(category="artist", name=f"a{row['id']}", weight=1.0)
+    client = MagicMock()
+    client.table.return_value.select.side_effect = lambda *a, count=None: table.build(count)
+    mock_get_client.return_value = client
+
+    # Blocking on every page inside the loop is refused; a thread is fine
+    with pytest.raises(RuntimeError, match="iter_rows"):
+        db.get_taste_profile()
+    entries = await asyncio.to_thread(db.get_taste_profile)
+    assert len(entries) == 5
+
+
+@patch("src.db.get_client")
+def test_get_canonical_events_in_range_survives_a_small_server_cap(
+    mock_get_client, monkeypatch
+):
+    monkeypatch.setattr(db.settings, "event_cache_enabled", False)
+    table = _FakeTable(7, max_rows=3)
+    for i, row in enumerate(table.rows):
+        row.update(title=f"Event {i}", event_date=f"2026-03-{14 + i % 2}")
+    client = MagicMock()
+    client.table.return_value.select.side_effect = lambda *a, count=None: table.build(count)
+    mock_get_client.return_value = client
+
+    by_date = db.get_canonical_events_in_range(date(2026, 3, 14), date(2026, 3, 15))
+    assert sum(len(v) for v in by_date.values()) == 7
+
+
+@patch("src.db.get_client")
+def test_week_recommendations_embed_only_id_columns(mock_get_client):
+    query = MagicMock()
+    for name in ("table", "select", "order", "limit"):
+        getattr(query, name).return_value = query
+    query.execute.return_value = MagicMock(data=[])
+    mock_get_client.return_value = query
+
+    db.get_week_recommendations()
+    query.select.assert_called_once_with("*, events(id,title,event_date)")
+
+    with pytest.raises(ValueError, match="unknown projection profile"):
+        db.get_week_recommendations(profile="everything")
+
+
+def test_row_decoder_matches_validation_on_trusted_rows():
+    row = {
+        "id": "e1", "title": "Honey Dijon", "event_date": "2026-03-07",
+        "start_time": "22:00:00", "end_time": None, "venue_name": "Nowadays",
+        "artists": ["Honey Dijon"], "source_urls": '{"ra": "https://ra.co/events/1"}',
+        "sources": None, "created_at": "2026-03-01T12:00:00.123456+00:00",
+        "updated_at": "2026-03-01T12:00:00Z", "fts": "'dijon' 'honey'",
+    }
+    event = db.decode_event(row)
+    expected = Event(**{**row, "source_urls": {"ra": "https://ra.co/events/1"}, "sources": []})
+    assert event == expected
+    assert event.model_dump() == expected.model_dump()
+    assert "fts" not in event.__dict__
+    assert event.updated_at == datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+
+    # A narrow projection leaves the rest at their defaults, lists not shared
+    a, b = db.decode_event.many([{"id": "a", "title": "A", "event_date": "2026-03-07"}] * 2)
+    assert a.artists == [] and a.artists is not b.artists
+    assert a.model_fields_set == {"id", "title", "event_date"}
+
+    script = db.decode_weekly_script(
+        {"id": "s1", "week_start": "2026-03-02", "status": "approved", "script_text": "hi",
+         "source_event_ids": '["e1"]', "telegram_message_id": 7, "created_at": None,
+         "approved_at": "2026-03-03T09:00:00+00:00"}
+    )
+    assert script.week_start == date(2026, 3, 2)
+    assert script.source_event_ids == ["e1"]
+    assert script.approved_at.tzinfo is not None
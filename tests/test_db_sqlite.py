@@ -0,0 +1,225 @@
+"""The SQLite backend behind the src.db functions."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from src import db
+from src.config import settings
+from src.db_sqlite import close_sqlite_storage
+from src.event_cache import get_event_cache, reset_event_cache
+from src.models import Event, Recommendation, ScrapedEvent, Source, TasteEntry, WeeklyScript
+from src.scrapers.runner import deduplicate_and_store
+
+
+@pytest.fixture(autouse=True)
+def sqlite_backend(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "storage_backend", "sqlite")
+    monkeypatch.setattr(settings, "sqlite_path", str(tmp_path / "test.db"))
+    close_sqlite_storage()
+    reset_event_cache()
+    yield
+    close_sqlite_storage()
+    reset_event_cache()
+
+
+def test_wal_mode():
+    from src.db_sqlite import get_sqlite_storage
+
+    (mode,) = get_sqlite_storage()._query("pragma journal_mode")[0]
+    assert mode == "wal"
+
+
+def test_raw_events_skip_unchanged():
+    day = date.today()
+    e = ScrapedEvent(source=Source.RA, source_id="1", title="A", event_date=day, artists=["X"])
+    assert db.upsert_raw_events([e, e]) == 1
+    assert db.upsert_raw_events([e]) == 0
+    changed = e.model_copy(update={"title": "A (updated)"})
+    assert db.upsert_raw_events([changed]) == 1
+
+
+def test_raw_event_hash_lookup_is_per_source_and_chunked(monkeypatch):
+    from src.db_sqlite import get_sqlite_storage
+
+    monkeypatch.setattr(db, "HASH_LOOKUP_CHUNK", 2)
+    day = date.today()
+    events = [
+        ScrapedEvent(source=source, source_id=str(i), title=f"E{i}", event_date=day)
+        for source in (Source.RA, Source.DICE)
+        for i in range(5)
+    ]
+    assert db.upsert_raw_events(events) == 10
+
+    storage = get_sqlite_storage()
+    queries = []
+    query = storage._query
+    monkeypatch.setattr(
+        storage, "_query", lambda sql, params=(): queries.append(params) or query(sql, params)
+    )
+    changed = events[0].model_copy(update={"title": "E0 (updated)"})
+    assert db.upsert_raw_events([changed, *events[1:]]) == 1
+    # Three chunks of at most two ids for each source, never the whole table
+    assert [p[0] for p in queries] == ["ra"] * 3 + ["dice"] * 3
+    assert all(len(p) <= 3 for p in queries)
+
+
+def test_canonical_round_trip():
+    day = date.today() + timedelta(days=1)
+    event_id = db.upsert_canonical_event(
+        Event(
+            title="Honey Dijon",
+            event_date=day,
+            venue_name="Nowadays",
+            artists=["Honey Dijon"],
+            sources=["ra"],
+            source_urls={"ra": "https://ra.co/events/1"},
+        )
+    )
+    [event] = db.get_upcoming_events()
+    assert event.id == event_id
+    assert event.artists == ["Honey Dijon"]
+    assert event.source_urls == {"ra": "https://ra.co/events/1"}
+    assert event.created_at is not None
+
+    event.title = "Honey Dijon All Night"
+    assert db.upsert_canonical_events([event]) == 1
+    assert db.get_canonical_events_in_range(day, day)[day][0].title == "Honey Dijon All Night"
+    assert db.get_canonical_events_by_date_venue(day, "Nowadays")[0].id == event_id
+    assert db.get_canonical_events_by_date_venue(day, "Basement") == []
+
+
+def test_deduplicate_and_store_against_sqlite(monkeypatch):
+    day = date.today() + timedelta(days=2)
+    scraped = {
+        "ra": [ScrapedEvent(source=Source.RA, source_id="1", title="Honey Dijon",
+                            event_date=day, venue_name="Nowadays", artists=["Honey Dijon"])],
+        "dice": [ScrapedEvent(source=Source.DICE, source_id="9", title="Honey Dijon",
+                              event_date=day, venue_name="Nowadays",
+                              venue_address="56-06 Cooper Ave")],
+    }
+    assert deduplicate_and_store(scraped) == 1
+    assert deduplicate_and_store(scraped) == 0
+    [event] = db.get_upcoming_events()
+    assert sorted(event.sources) == ["dice", "ra"]
+    assert event.venue_address == "56-06 Cooper Ave"
+
+
+def test_taste_profile_upsert_and_clamp():
+    db.upsert_taste_entry(TasteEntry(category="venue", name="Nowadays", weight=2.0))
+    db.update_taste_weight("venue", "Nowadays", 5.0)
+    db.update_taste_weight("artist", "DJ A", -0.5)
+    weights = {(t.category, t.name): t.weight for t in db.get_taste_profile()}
+    assert len(weights) == 2
+    assert 3.0 in weights.values()
+    assert -0.5 in weights.values()
+
+
+def test_recommendations_embed_event():
+    day = date.today() + timedelta(days=1)
+    event_id = db.upsert_canonical_event(Event(title="A", event_date=day))
+    rec_id = db.save_recommendation(Recommendation(event_id=event_id, score=80.0))
+    db.update_recommendation_message_id(rec_id, 42)
+    db.update_recommendation_feedback(rec_id, "up")
+
+    rec = db.get_recommendation_by_message_id(42)
+    assert rec["feedback"] == "up"
+    assert rec["events"]["event_date"] == day.isoformat()
+    assert db.get_recommended_event_ids() == {event_id}
+    assert [r["id"] for r in db.get_week_recommendations()] == [rec_id]
+
+    # Deleting the event cascades to its recommendations
+    assert db.delete_past_events(day + timedelta(days=1)) == 1
+    assert db.get_recent_recommendations() == []
+
+
+def test_weekly_script_flow():
+    week = date(2026, 3, 2)
+    first = db.save_weekly_script(WeeklyScript(week_start=week, script_text="one"))
+    second = db.save_weekly_script(WeeklyScript(week_start=week, script_text="two"))
+    db.update_weekly_script_message_id(second, 7)
+    db.update_weekly_script_text(second, "two, edited")
+    assert db.get_draft_script_by_message_id(7).script_text == "two, edited"
+
+    db.approve_weekly_script(first)
+    db.approve_weekly_script(second)
+    assert db.get_latest_approved_script(week).id == second
+
+    db.publish_weekly_script(second)
+    published = db.get_published_script(week)
+    assert published.id == second
+    assert published.approved_at is not None
+    assert db.get_latest_approved_script(week) is None
+
+
+def test_scrape_and_alert_logs():
+    db.log_scrape("ra", "success", 10, 1.5, cache_hits=3)
+    db.log_scrape("dice", "error", 0, 0.2, error="boom")
+    assert [r["source"] for r in db.get_recent_scrape_logs()] == ["dice", "ra"]
+
+    assert db.should_alert("ra") is True
+    db.log_alert("ra", "down")
+    assert db.should_alert("ra") is False
+    assert db.delete_old_logs(days=0) == 3
+
+
+def test_event_cache_follows_writes_and_cleanup():
+    today = date.today()
+    db.upsert_canonical_events([Event(id="a", title="A", event_date=today + timedelta(days=1))])
+    assert [e.id for e in db.get_upcoming_events()] == ["a"]
+
+    db.upsert_canonical_events([Event(id="b", title="B", event_date=today)])
+    db.upsert_canonical_event(Event(id="a", title="A moved", event_date=today + timedelta(days=3)))
+    assert [(e.id, e.title) for e in db.get_upcoming_events()] == [("b", "B"), ("a", "A moved")]
+
+    db.delete_past_events(today + timedelta(days=1))
+    assert [e.id for e in db.get_upcoming_events()] == ["a"]
+    stats = get_event_cache().stats()
+    assert (stats["full_loads"], stats["hits"], stats["evictions"]) == (1, 2, 1)
+
+    # The cache never diverged from what's stored
+    reset_event_cache()
+    assert [e.id for e in db.get_upcoming_events()] == ["a"]
+
+
+def test_event_cache_delta_sees_other_writers(monkeypatch):
+    from src.db_sqlite import get_sqlite_storage
+
+    monkeypatch.setattr(settings, "event_cache_sync_seconds", 0)
+    monkeypatch.setattr("src.event_cache.SETTLE", timedelta(0))
+    today = date.today()
+    db.upsert_canonical_events(
+        [Event(id=f"e{i}", title=f"E{i}", event_date=today + timedelta(days=i % 7))
+         for i in range(50)]
+    )
+    assert len(db.get_upcoming_events()) == 50
+
+    # Another process writes and deletes, bypassing this process's hooks
+    other = get_sqlite_storage()
+    other.upsert_canonical_events([Event(id="e1", title="E1 edited", event_date=today)])
+    other.delete_past_events(today + timedelta(days=1))
+
+    upcoming = {e.id: e for e in db.get_upcoming_events()}
+    assert "e1" not in upcoming and "e7" not in upcoming
+    assert len(upcoming) == 50 - 9  # e0, e7, ... e49, plus e1 moved to today
+    # Only the nine tombstones came over, not the whole table
+    assert get_event_cache().stats()["last_delta_rows"] == 9
+    assert len(db.get_canonical_events_in_range(today, today)) == 0
+    assert get_event_cache().stats()["last_delta_rows"] == 0
+    assert db.delete_old_tombstones(days=0) == 9
+
+
+def test_projection_profiles_skip_heavy_columns(monkeypatch):
+    monkeypatch.setattr(settings, "event_cache_enabled", False)
+    day = date.today() + timedelta(days=1)
+    db.upsert_canonical_event(
+        Event(title="A", event_date=day, artists=["X"], description="long " * 200,
+              image_url="https://img.example/a.jpg")
+    )
+    [card] = db.get_upcoming_events(profile="card")
+    assert card.artists == ["X"] and card.description is None and card.image_url is None
+    [scoring] = db.get_upcoming_events(profile="scoring")
+    assert scoring.description and scoring.image_url is None
+    [full] = db.get_upcoming_events()
+    assert full.image_url == "https://img.example/a.jpg"
@@ -1,11 +1,22 @@
+import asyncio
 from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+from structlog.testing import capture_logs
 
 from src.models import Event, ScrapedEvent, Source
 from src.normalize import normalize
 from src.scrapers.runner import (
+    CanonicalWriteBuffer,
+    _store_raw,
     artist_jaccard,
+    deduplicate_and_store,
+    deduplicate_and_store_async,
     is_fuzzy_match,
     merge_into_canonical,
+    run_scrape_pipeline,
+    shutdown_dedup_executor,
 )
 
 
@@ -147,3 +158,230 @@ def test_merge_enriches_existing():
     assert "dice" in result.sources
     assert "ra" in result.sources
     assert result.source_urls["dice"] == "https://dice.fm/events/200"
+
+
+@patch("src.scrapers.runner.db")
+def test_deduplicate_and_store_prefetches_once(mock_db: MagicMock):
+    existing = Event(
+        id="ex-1",
+        title="Honey Dijon",
+        event_date=date(2025, 4, 1),
+        venue_name="Nowadays",
+        artists=["Honey Dijon"],
+    )
+    mock_db.get_canonical_events_in_range.return_value = {date(2025, 4, 1): [existing]}
+    mock_db.upsert_canonical_events.side_effect = len
+    scraped = [
+        ScrapedEvent(source=Source.RA, source_id="1", title="Honey Dijon",
+                     event_date=date(2025, 4, 1), venue_name="Nowadays"),
+        ScrapedEvent(source=Source.DICE, source_id="2", title="Other Party",
+                     event_date=date(2025, 4, 3), venue_name="Basement"),
+    ]
+
+    new_count = deduplicate_and_store({"ra": scraped[:1], "dice": scraped[1:]})
+
+    mock_db.get_canonical_events_in_range.assert_called_once_with(
+        date(2025, 4, 1), date(2025, 4, 3)
+    )
+    mock_db.get_canonical_events_by_date_venue.assert_not_called()
+    assert new_count == 1
+    # One bulk write: the merged existing event plus the new one
+    mock_db.upsert_canonical_event.assert_not_called()
+    (written,), _ = mock_db.upsert_canonical_events.call_args
+    assert {e.title for e in written} == {"Honey Dijon", "Other Party"}
+    assert all(e.id for e in written)
+
+
+@patch("src.scrapers.runner.db")
+def test_write_buffer_chunks_and_keeps_latest_version(mock_db: MagicMock):
+    mock_db.upsert_canonical_events.side_effect = len
+    buf = CanonicalWriteBuffer()
+    for i in range(5):
+        buf.add(Event(id=f"id-{i}", title="v1", event_date=date(2025, 4, 1)))
+    buf.add(Event(id="id-0", title="v2", event_date=date(2025, 4, 1)))
+
+    assert buf.flush(chunk_size=2) == 5
+    chunks = [c.args[0] for c in mock_db.upsert_canonical_events.call_args_list]
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert chunks[0][0].title == "v2"
+    assert len(buf) == 0
+
+
+def test_merge_into_canonical_new_source_does_not_mutate_existing():
+    existing = Event(
+        id="ev-1",
+        title="Test Event",
+        event_date=date(2025, 4, 1),
+        sources=["ra"],
+        source_urls={"ra": "https://ra.co/events/100"},
+    )
+    scraped = ScrapedEvent(
+        source=Source.DICE,
+        source_id="200",
+        title="Test Event",
+        event_date=date(2025, 4, 1),
+        source_url="https://dice.fm/events/200",
+    )
+    merged = merge_into_canonical(scraped, existing)
+    assert merged != existing
+    assert merged.id == "ev-1"
+    assert existing.sources == ["ra"]
+    assert existing.source_urls == {"ra": "https://ra.co/events/100"}
+
+
+@patch("src.scrapers.runner.db")
+def test_deduplicate_and_store_skips_unchanged_writes(mock_db: MagicMock):
+    scraped = ScrapedEvent(
+        source=Source.RA, source_id="1", title="Honey Dijon",
+        event_date=date(2025, 4, 1), venue_name="Nowadays",
+    )
+    existing = merge_into_canonical(scraped, None)
+    existing.id = "ex-1"
+    mock_db.get_canonical_events_in_range.return_value = {date(2025, 4, 1): [existing]}
+
+    assert deduplicate_and_store({"ra": [scraped]}) == 0
+    mock_db.upsert_canonical_events.assert_not_called()
+
+
+class _FakeScraper:
+    """Scraper stand-in: returns `events` once `gate` is set."""
+
+    def __init__(self, name, events, gate):
+        self.name = name
+        self.cache_stats = {"hits": 0, "misses": 0}
+        self._events = events
+        self._gate = gate
+
+    async def run(self):
+        await self._gate.wait()
+        return self._events, 0.0, None
+
+
+async def test_pipeline_stores_each_source_as_it_finishes():
+    fast_gate, slow_gate = asyncio.Event(), asyncio.Event()
+    day = date.today()
+    fast = _FakeScraper(
+        "ra", [ScrapedEvent(source=Source.RA, source_id="1", title="A", event_date=day)], fast_gate
+    )
+    slow = _FakeScraper(
+        "lightandsound",
+        [ScrapedEvent(source=Source.LIGHT_AND_SOUND, source_id="2", title="B", event_date=day)],
+        slow_gate,
+    )
+    stored: list[str] = []
+
+    async def fake_dedup(all_events):
+        stored.extend(all_events)
+        if list(all_events) == ["ra"]:
+            # The slow source is still running when the fast one is stored
+            slow_gate.set()
+        return 1
+
+    fast_gate.set()
+    with (
+        patch("src.scrapers.runner._build_scrapers", return_value=[slow, fast]),
+        patch("src.scrapers.runner.deduplicate_and_store_async", side_effect=fake_dedup),
+        patch("src.scrapers.runner.db"),
+    ):
+        new_count = await run_scrape_pipeline()
+
+    assert stored == ["ra", "lightandsound"]
+    assert new_count == 2
+
+
+def test_pipeline_isolates_a_failing_store_across_runs():
+    day = date.today()
+
+    def scrapers():
+        gate = asyncio.Event()
+        gate.set()
+        return [
+            _FakeScraper(name, [ScrapedEvent(source=source, source_id="1", title="A",
+                                             event_date=day)], gate)
+            for name, source in (("ra", Source.RA), ("dice", Source.DICE))
+        ]
+
+    async def fake_dedup(all_events):
+        if "ra" in all_events:
+            raise RuntimeError("supabase down")
+        return 1
+
+    with (
+        patch("src.scrapers.runner.deduplicate_and_store_async", side_effect=fake_dedup),
+        patch("src.scrapers.runner.db") as mock_db,
+    ):
+        # Two event loops in one process must not trip over a shared lock
+        for _ in range(2):
+            with patch("src.scrapers.runner._build_scrapers", return_value=scrapers()):
+                assert asyncio.run(run_scrape_pipeline()) == 1
+
+    failed = [c.args for c in mock_db.log_scrape.call_args_list if c.args[1] == "error"]
+    assert [(name, count) for name, _, count, *_ in failed] == [("ra", 1), ("ra", 1)]
+
+
+async def test_pipeline_does_not_report_a_failed_scrape_log_as_a_store_failure():
+    day = date.today()
+    gate = asyncio.Event()
+    gate.set()
+    scraper = _FakeScraper(
+        "ra", [ScrapedEvent(source=Source.RA, source_id="1", title="A", event_date=day)], gate
+    )
+    stored: list[str] = []
+
+    async def fake_dedup(all_events):
+        stored.extend(all_events)
+        return 1
+
+    with (
+        patch("src.scrapers.runner._build_scrapers", return_value=[scraper]),
+        patch("src.scrapers.runner.deduplicate_and_store_async", side_effect=fake_dedup),
+        patch("src.scrapers.runner.db") as mock_db,
+    ):
+        mock_db.log_scrape.side_effect = RuntimeError("supabase down")
+        assert await run_scrape_pipeline() == 1
+
+    assert stored == ["ra"]
+    # Only the scrape's own row was attempted, no "store failed" row on top
+    [call] = mock_db.log_scrape.call_args_list
+    assert call.args[:3] == ("ra", "success", 1)
+
+
+@pytest.mark.parametrize("worker", ["process", "thread", "inline"])
+async def test_deduplicate_and_store_async_matches_sync(monkeypatch, worker):
+    from src.config import settings
+
+    monkeypatch.setattr(settings, "dedup_worker", worker)
+    existing = Event(
+        id="ex-1", title="Honey Dijon", event_date=date(2025, 4, 1),
+        venue_name="Nowadays", artists=["Honey Dijon"],
+    )
+    scraped = [
+        ScrapedEvent(source=Source.RA, source_id="1", title="Honey Dijon",
+                     event_date=date(2025, 4, 1), venue_name="Nowadays",
+                     description="Long night"),
+        ScrapedEvent(source=Source.DICE, source_id="2", title="Other Party",
+                     event_date=date(2025, 4, 3), venue_name="Basement"),
+    ]
+    with patch("src.scrapers.runner.db") as mock_db:
+        mock_db.get_canonical_events_in_range.return_value = {date(2025, 4, 1): [existing]}
+        mock_db.upsert_canonical_events.side_effect = len
+        try:
+            new_count = await deduplicate_and_store_async({"ra": scraped[:1], "dice": scraped[1:]})
+        finally:
+            shutdown_dedup_executor()
+
+    assert new_count == 1
+    (written,), _ = mock_db.upsert_canonical_events.call_args
+    merged = next(e for e in written if e.id == "ex-1")
+    assert merged.description == "Long night"
+    assert {e.title for e in written} == {"Honey Dijon", "Other Party"}
+
+
+@patch("src.scrapers.runner.db")
+def test_store_raw_does_not_count_batch_repeats_as_unchanged(mock_db: MagicMock):
+    e = ScrapedEvent(source=Source.RA, source_id="1", title="A", event_date=date(2025, 4, 1))
+    mock_db.upsert_raw_events.return_value = 1
+    with capture_logs() as logs:
+        _store_raw({"ra": [e, e, e]})
+    [entry] = [log for log in logs if log["event"] == "raw_events_stored"]
+    assert (entry["count"], entry["unchanged"]) == (1, 0)
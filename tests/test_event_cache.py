@@ -0,0 +1,131 @@
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from src.event_cache import EventCache
+from src.models import Event
+
+DAY = date(2026, 3, 6)
+T0 = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+
+
+def _event(event_id: str, days: int = 0, title: str = "Party", at: int = 0) -> Event:
+    return Event(
+        id=event_id,
+        title=title,
+        event_date=DAY + timedelta(days=days),
+        updated_at=T0 + timedelta(minutes=at),
+    )
+
+
+class _Source:
+    """Stand-in for db.get_events_changed_since / get_event_tombstones_since."""
+
+    def __init__(self, rows: list[Event]) -> None:
+        self.rows = {e.id: e for e in rows}
+        self.tombstones: list[dict] = []
+        self.calls: list[datetime | None] = []
+
+    def changes(self, since):
+        self.calls.append(since)
+        return [e for e in self.rows.values() if since is None or e.updated_at > since]
+
+    def dead(self, since):
+        return [t for t in self.tombstones if t["deleted_at"] > since]
+
+    def sync(self, cache: EventCache, force: bool = True) -> None:
+        cache.sync(self.changes, self.dead, force=force)
+
+
+def test_full_load_then_reads_by_window():
+    src = _Source([_event("a"), _event("b", 2), _event("c", -3)])
+    cache = EventCache()
+    src.sync(cache)
+
+    assert [e.id for e in cache.upcoming(DAY)] == ["a", "b"]
+    assert [e.id for e in cache.upcoming(DAY + timedelta(days=1))] == ["b"]
+    assert [e.id for e in cache.past(DAY, DAY - timedelta(days=7))] == ["c"]
+    assert list(cache.in_range(DAY, DAY + timedelta(days=2))) == [DAY, DAY + timedelta(days=2)]
+    assert src.calls == [None]
+
+
+def test_delta_fetches_only_changes_and_applies_tombstones():
+    src = _Source([_event(str(i), i % 5) for i in range(300)])
+    cache = EventCache()
+    src.sync(cache)
+
+    src.rows["7"] = _event("7", 4, "Moved", at=5)
+    src.rows["new"] = _event("new", 1, at=6)
+    del src.rows["8"]
+    src.tombstones.append({"id": "8", "deleted_at": datetime.now(timezone.utc)})
+    src.sync(cache)
+
+    stats = cache.stats()
+    assert stats["last_delta_rows"] == 3  # not 300
+    assert stats["tombstones_applied"] == 1
+    assert stats["size"] == 300
+    by_id = {e.id: e for e in cache.upcoming(DAY)}
+    assert "8" not in by_id
+    assert by_id["7"].title == "Moved" and by_id["7"].event_date == DAY + timedelta(days=4)
+    assert stats["watermark"] == (T0 + timedelta(minutes=6)).isoformat()
+
+
+def test_tombstone_older_than_recreated_row_is_ignored():
+    src = _Source([_event("a", at=10)])
+    cache = EventCache()
+    src.sync(cache)
+    src.tombstones.append({"id": "a", "deleted_at": T0 + timedelta(minutes=5)})
+    cache._tombstones_mark = T0  # the tombstone falls inside the sync window
+    src.sync(cache)
+    assert [e.id for e in cache.upcoming(DAY)] == ["a"]
+
+
+def test_local_writes_apply_without_a_sync():
+    src = _Source([_event("a"), _event("b", 1)])
+    cache = EventCache()
+    cache.put([_event("ignored")])  # nothing loaded yet: no-op
+    src.sync(cache)
+
+    cache.put([_event("a", 3, "Moved"), _event("new", 1)])
+    cache.evict_before(DAY + timedelta(days=1))
+    assert [(e.id, e.title) for e in cache.upcoming(DAY)] == [
+        ("b", "Party"), ("new", "Party"), ("a", "Moved"),
+    ]
+    assert cache.stats()["evictions"] == 0  # "a" had already moved out of DAY
+
+    cache.invalidate()
+    src.sync(cache)
+    assert cache.stats()["full_loads"] == 2
+
+
+def test_sync_interval():
+    src = _Source([_event("a")])
+    cache = EventCache(sync_seconds=30)
+    clock = MagicMock(return_value=0.0)
+    with patch("src.event_cache.time.monotonic", clock):
+        src.sync(cache, force=False)
+        clock.return_value = 10.0
+        src.sync(cache, force=False)
+        clock.return_value = 31.0
+        src.sync(cache, force=False)
+        stats = cache.stats()
+    assert (stats["full_loads"], stats["hits"], stats["syncs"]) == (1, 1, 1)
+    assert len(src.calls) == 2
+    # The full load and the delta both went to the database
+    assert (stats["misses"], stats["hit_rate"]) == (2, 0.333)
+
+
+def test_new_database_target_gets_a_new_replica(monkeypatch):
+    from src.config import settings
+    from src.event_cache import get_event_cache, reset_event_cache
+
+    monkeypatch.setattr(settings, "event_cache_enabled", True)
+    monkeypatch.setattr(settings, "storage_backend", "sqlite")
+    monkeypatch.setattr(settings, "sqlite_path", "a.db")
+    reset_event_cache()
+    try:
+        first = get_event_cache()
+        assert get_event_cache() is first
+        monkeypatch.setattr(settings, "sqlite_path", "b.db")
+        assert get_event_cache() is not first
+    finally:
+        reset_event_cache()
@@ -0,0 +1,23 @@
+import asyncio
+import time
+
+from src.loop_lag import LoopLagMonitor
+
+
+async def test_monitor_sees_blocking_call():
+    lag = LoopLagMonitor(interval=0.01)
+    lag.start()
+    await asyncio.sleep(0.05)
+    time.sleep(0.2)  # blocks the loop
+    await asyncio.sleep(0.05)
+    stats = await lag.stop()
+    assert stats["samples"] > 0
+    assert stats["max_ms"] >= 150
+
+
+async def test_monitor_quiet_loop():
+    lag = LoopLagMonitor(interval=0.01)
+    lag.start()
+    await asyncio.to_thread(time.sleep, 0.1)  # off-loop work doesn't count
+    stats = await lag.stop()
+    assert stats["max_ms"] < 100
@@ -1,6 +1,11 @@
 """Tests for the proposed improved normalization functions."""
 
+import re
+import unicodedata
+
 from src.normalize import (
+    cache_stats,
+    clear_caches,
     normalize,
     normalize_artist,
     normalize_artist_list,
@@ -144,3 +149,36 @@ class TestArtistList:
         union = set_a | set_b
         jaccard = len(intersection) / len(union)
         assert jaccard == 1.0
+
+
+# ── Translate table + memoization ───────────────────────────────────
+
+
+class TestNormalizeEngine:
+    def test_matches_regex_over_latin1_and_punctuation(self):
+        def legacy(s: str) -> str:
+            s = unicodedata.normalize("NFKD", s.lower())
+            s = re.sub(r"[^\w\s]", "", s)
+            return re.sub(r"\s+", " ", s).strip()
+
+        sample = "".join(chr(c) for c in range(0x2100)) + "　   Ω ß ﬁ ①"
+        for i in range(0, len(sample), 37):
+            chunk = f" {sample[i:i + 37]}  x "
+            assert normalize(chunk) == legacy(chunk)
+
+    def test_cache_stats_and_clear(self):
+        clear_caches()
+        normalize_venue("Nowadays")
+        normalize_venue("Nowadays")
+        stats = cache_stats()["normalize_venue"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+        clear_caches()
+        assert cache_stats()["normalize_venue"]["hits"] == 0
+
+    def test_split_artist_entry_returns_fresh_list(self):
+        first = split_artist_entry("A b2b B")
+        first.append("mutated")
+        assert split_artist_entry("A b2b B") == ["a", "b"]
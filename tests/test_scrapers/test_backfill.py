@@ -0,0 +1,101 @@
+from datetime import date
+
+import pytest
+
+from src.models import ScrapedEvent, Source
+from src.scrapers import backfill
+from src.scrapers.backfill import Checkpoint, backfill_ra, make_shards
+from src.scrapers.ra import RAScraper
+
+
+def test_make_shards_weekly():
+    shards = make_shards(date(2026, 1, 1), date(2026, 1, 17), shard_days=7)
+    assert shards == [
+        (date(2026, 1, 1), date(2026, 1, 7)),
+        (date(2026, 1, 8), date(2026, 1, 14)),
+        (date(2026, 1, 15), date(2026, 1, 17)),
+    ]
+
+
+def test_make_shards_daily():
+    shards = make_shards(date(2026, 1, 1), date(2026, 1, 3), shard_days=1)
+    assert [s[0] for s in shards] == [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3)]
+
+
+def test_checkpoint_roundtrip_and_param_mismatch(tmp_path):
+    path = tmp_path / "ckpt.json"
+    ckpt = Checkpoint(path, date(2026, 1, 1), date(2026, 1, 14), 7)
+    ckpt.mark_done((date(2026, 1, 1), date(2026, 1, 7)), stored=12)
+
+    resumed = Checkpoint(path, date(2026, 1, 1), date(2026, 1, 14), 7)
+    assert resumed.has_progress()
+    assert resumed.is_done((date(2026, 1, 1), date(2026, 1, 7)))
+    assert resumed.stored == 12
+
+    other = Checkpoint(path, date(2026, 1, 1), date(2026, 1, 14), 1)
+    assert not other.has_progress()
+    assert other.mismatched and not resumed.mismatched
+
+
+def test_checkpoint_keeps_its_range_for_later_resumes(tmp_path):
+    path = tmp_path / "ckpt.json"
+    assert Checkpoint.saved_range(path) is None
+    Checkpoint(path, date(2026, 1, 1), date(2026, 3, 15), 7).mark_done(
+        (date(2026, 1, 1), date(2026, 1, 7)), stored=3
+    )
+    # A rerun days later resumes the saved range, not one based on today
+    from_date, to_date = Checkpoint.saved_range(path)
+    assert (from_date, to_date) == (date(2026, 1, 1), date(2026, 3, 15))
+    assert Checkpoint(path, from_date, to_date, 7).has_progress()
+
+    path.write_text("{not json")
+    assert Checkpoint.saved_range(path) is None
+    assert Checkpoint(path, from_date, to_date, 7).mismatched
+
+
+@pytest.fixture
+def fake_ra(monkeypatch):
+    """Stub RA scraping + storage; records which shards were scraped/stored."""
+    scraped: list[date] = []
+    stored: list[list[ScrapedEvent]] = []
+
+    async def scrape(self, from_date=None, max_pages=None, to_date=None):
+        scraped.append(from_date)
+        return [
+            ScrapedEvent(
+                source=Source.RA,
+                source_id=from_date.isoformat(),
+                title="Event",
+                event_date=from_date,
+            )
+        ]
+
+    async def store(all_events):
+        stored.append(all_events["ra"])
+        return len(all_events["ra"])
+
+    monkeypatch.setattr(RAScraper, "scrape", scrape)
+    monkeypatch.setattr(backfill, "deduplicate_and_store_async", store)
+    return scraped, stored
+
+
+async def test_backfill_streams_each_shard(tmp_path, fake_ra):
+    scraped, stored = fake_ra
+    ckpt = Checkpoint(tmp_path / "c.json", date(2026, 1, 1), date(2026, 1, 21), 7)
+    new = await backfill_ra(date(2026, 1, 1), date(2026, 1, 21), checkpoint=ckpt)
+    assert new == 3
+    assert sorted(scraped) == [date(2026, 1, 1), date(2026, 1, 8), date(2026, 1, 15)]
+    assert len(stored) == 3  # one dedup call per shard, not one big batch
+    assert len(ckpt.completed) == 3
+
+
+async def test_backfill_resumes_from_checkpoint(tmp_path, fake_ra):
+    scraped, _ = fake_ra
+    path = tmp_path / "c.json"
+    ckpt = Checkpoint(path, date(2026, 1, 1), date(2026, 1, 21), 7)
+    ckpt.mark_done((date(2026, 1, 1), date(2026, 1, 7)), stored=1)
+
+    resumed = Checkpoint(path, date(2026, 1, 1), date(2026, 1, 21), 7)
+    await backfill_ra(date(2026, 1, 1), date(2026, 1, 21), checkpoint=resumed)
+    assert sorted(scraped) == [date(2026, 1, 8), date(2026, 1, 15)]
+    assert resumed.stored == 3
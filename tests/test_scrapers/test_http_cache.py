@@ -0,0 +1,130 @@
+import os
+
+import httpx
+import pytest
+
+from src.scrapers.http_cache import HTTPCache
+from src.scrapers.partiful import PartifulScraper
+
+
+def _server(etag: str = '"v1"'):
+    """Mock origin that honours If-None-Match and records request headers."""
+    seen: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers)
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(
+            200,
+            headers={"ETag": etag, "Content-Type": "text/html"},
+            text="<html>events</html>",
+        )
+
+    return handler, seen
+
+
+@pytest.mark.asyncio
+async def test_second_fetch_served_from_cache_on_304(tmp_path):
+    handler, seen = _server()
+    cache = HTTPCache(tmp_path)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    first = PartifulScraper(client=client, http_cache=cache)
+    resp = await first.fetch("https://partiful.com/discover/nyc")
+    assert resp.text == "<html>events</html>"
+    assert first.cache_stats == {"hits": 0, "misses": 1}
+    assert "if-none-match" not in seen[0]
+
+    # A later run (new scraper instance) revalidates instead of re-downloading
+    second = PartifulScraper(client=client, http_cache=cache)
+    resp = await second.fetch("https://partiful.com/discover/nyc")
+    assert seen[1]["if-none-match"] == '"v1"'
+    assert resp.status_code == 200
+    assert resp.text == "<html>events</html>"
+    assert second.cache_stats == {"hits": 1, "misses": 0}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_changed_etag_refreshes_body(tmp_path):
+    cache = HTTPCache(tmp_path)
+    handler, _ = _server('"v1"')
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    await PartifulScraper(client=client, http_cache=cache).fetch("https://partiful.com/x")
+
+    def changed(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"ETag": '"v2"'}, text="new")
+
+    client2 = httpx.AsyncClient(transport=httpx.MockTransport(changed))
+    scraper = PartifulScraper(client=client2, http_cache=cache)
+    resp = await scraper.fetch("https://partiful.com/x")
+    assert resp.text == "new"
+    assert scraper.cache_stats["misses"] == 1
+    key = HTTPCache.key(client2.build_request("GET", "https://partiful.com/x"))
+    assert cache.validators(key) == {"If-None-Match": '"v2"'}
+    await client.aclose()
+    await client2.aclose()
+
+
+def test_response_without_validators_not_stored(tmp_path):
+    cache = HTTPCache(tmp_path)
+    request = httpx.Request("GET", "https://nyc-noise.com")
+    resp = httpx.Response(200, text="hi", request=request)
+    assert cache.store(HTTPCache.key(request), resp) is False
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_post_body_is_part_of_key():
+    a = httpx.Request("POST", "https://ra.co/graphql", json={"page": 1})
+    b = httpx.Request("POST", "https://ra.co/graphql", json={"page": 2})
+    assert HTTPCache.key(a) != HTTPCache.key(b)
+
+
+@pytest.mark.asyncio
+async def test_post_is_sent_unconditionally_and_not_stored(tmp_path):
+    handler, seen = _server()
+    cache = HTTPCache(tmp_path)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    scraper = PartifulScraper(client=client, http_cache=cache)
+    for _ in range(2):
+        await scraper.post("https://ra.co/graphql", json={"page": 1})
+    assert all("if-none-match" not in h for h in seen)
+    assert list(tmp_path.iterdir()) == []
+    await client.aclose()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = HTTPCache(tmp_path, max_entries=2)
+    keys = []
+    for i in range(3):
+        request = httpx.Request("GET", f"https://dice.fm/{i}")
+        key = HTTPCache.key(request)
+        keys.append(key)
+        cache.store(key, httpx.Response(200, headers={"ETag": f'"{i}"'}, request=request))
+        os.utime(tmp_path / f"{key}.json", (i, i))
+        if i == 1:
+            cache.validators(keys[0])  # revalidating keeps entry 0 fresh
+    assert cache.validators(keys[0]) and cache.validators(keys[2])
+    assert cache.validators(keys[1]) == {}
+    assert len(list(tmp_path.iterdir())) == 4
+
+
+def test_directory_is_only_listed_when_the_cache_overflows(tmp_path, monkeypatch):
+    cache = HTTPCache(tmp_path, max_entries=10)
+    listings = []
+    real_evict = cache._evict
+    monkeypatch.setattr(cache, "_evict", lambda: listings.append(1) or real_evict())
+
+    def store(i: int) -> None:
+        request = httpx.Request("GET", f"https://dice.fm/{i}")
+        response = httpx.Response(200, headers={"ETag": "x"}, request=request)
+        cache.store(HTTPCache.key(request), response)
+
+    for i in range(10):
+        store(i)
+    store(0)  # refreshing an entry doesn't grow the cache
+    assert listings == []
+    store(10)
+    assert listings == [1]
+    assert len(list(tmp_path.glob("*.json"))) == 9
@@ -1,6 +1,12 @@
-from datetime import date
+import asyncio
+import json
+from datetime import date, timedelta
 
-from src.scrapers.lightandsound import LightAndSoundScraper
+import httpx
+
+from src.config import settings
+from src.models import ScrapedEvent, Source
+from src.scrapers.lightandsound import DetailCache, LightAndSoundScraper, detail_ttl
 
 
 def test_parse_listing_basic():
@@ -96,3 +102,140 @@ def test_parse_date_empty():
 def test_parse_date_invalid():
     scraper = LightAndSoundScraper()
     assert scraper._parse_date_text("not a date") is None
+
+
+def _detail_html(name: str) -> str:
+    ld = {
+        "@type": "Event",
+        "startDate": "2026-03-15T22:00:00",
+        "location": {"name": name},
+    }
+    return f'<script type="application/ld+json">{json.dumps(ld)}</script>'
+
+
+def _stub(slug: str, host: str = "eventcreate.com") -> ScrapedEvent:
+    return ScrapedEvent(
+        source=Source.LIGHT_AND_SOUND,
+        source_id=slug,
+        title=slug,
+        event_date=date.today() + timedelta(days=7),
+        source_url=f"https://{host}/e/{slug}",
+    )
+
+
+async def test_enrich_all_respects_per_host_limit(monkeypatch):
+    monkeypatch.setattr(settings, "lightandsound_per_host_limit", 2)
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return httpx.Response(200, text=_detail_html("Venue"))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    scraper = LightAndSoundScraper(client=client)
+    stubs = [_stub(f"ev{i}") for i in range(6)]
+    events = await scraper._enrich_all(stubs)
+    assert in_flight["max"] == 2
+    assert [e.source_id for e in events] == [f"ev{i}" for i in range(6)]
+    assert all(e.venue_name == "Venue" for e in events)
+    await client.aclose()
+
+
+async def test_enrich_all_keeps_partial_results_at_deadline(monkeypatch):
+    monkeypatch.setattr(settings, "lightandsound_enrich_deadline", 0.1)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if "slow" in request.url.path:
+            await asyncio.sleep(5)
+        return httpx.Response(200, text=_detail_html("Fast Venue"))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    scraper = LightAndSoundScraper(client=client)
+    events = await scraper._enrich_all([_stub("fast"), _stub("slow")])
+    assert [e.source_id for e in events] == ["fast", "slow"]
+    assert events[0].venue_name == "Fast Venue"
+    assert events[1].venue_name is None  # stub kept, just not enriched
+    await client.aclose()
+
+
+def test_detail_ttl_shrinks_as_event_approaches():
+    today = date(2026, 3, 1)
+    far = detail_ttl(date(2026, 4, 1), today)
+    week = detail_ttl(date(2026, 3, 8), today)
+    soon = detail_ttl(date(2026, 3, 2), today)
+    tonight = detail_ttl(date(2026, 3, 1), today)
+    assert far > week > soon > tonight
+
+
+async def test_detail_cache_hit_skips_fetch(tmp_path):
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url)
+        return httpx.Response(200, text=_detail_html("Cached Venue"))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    path = tmp_path / "details.json"
+
+    first = LightAndSoundScraper(client=client, detail_cache=DetailCache(path))
+    await first._enrich_event(_stub("abc"))
+    first.detail_cache.save()
+
+    # New run, new scraper: fields come from disk, no network
+    second = LightAndSoundScraper(client=client, detail_cache=DetailCache(path))
+    enriched = await second._enrich_event(_stub("abc"))
+    assert len(requests) == 1
+    assert enriched.venue_name == "Cached Venue"
+    assert enriched.start_time is not None
+    await client.aclose()
+
+
+def test_detail_cache_expired_entry_is_miss(tmp_path):
+    cache = DetailCache(tmp_path / "details.json")
+    cache.put("https://eventcreate.com/e/x", {"venue_name": "V"})
+    cache._entries["https://eventcreate.com/e/x"]["fetched_at"] = "2000-01-01T00:00:00+00:00"
+    assert cache.get("https://eventcreate.com/e/x", date.today()) is None
+
+
+def test_extract_and_apply_enrichment_roundtrip():
+    html = """
+    <script type="application/ld+json">
+    {"@type": "Event", "startDate": "2026-03-15T22:00:00Z",
+     "location": {"name": "Nowadays", "address": {"streetAddress": "56-06 Cooper Ave"}},
+     "performer": [{"name": "DJ A"}, {"name": "DJ B"}],
+     "offers": {"price": "25"}}
+    </script>
+    """
+    fields = LightAndSoundScraper._extract_enrichment(html)
+    # Cached fields must survive a JSON round trip
+    fields = json.loads(json.dumps(fields))
+    stub = _stub("rt")
+    LightAndSoundScraper._apply_enrichment(stub, fields)
+    assert stub.venue_name == "Nowadays"
+    assert stub.venue_address == "56-06 Cooper Ave"
+    assert stub.artists == ["DJ A", "DJ B"]
+    assert stub.price_min_cents == 2500
+    assert stub.cost_display == "$25"
+
+
+def test_detail_cache_drops_past_events_on_load_and_save(tmp_path):
+    path = tmp_path / "details.json"
+    cache = DetailCache(path)
+    cache.put("https://eventcreate.com/e/past", {}, date.today() - timedelta(days=1))
+    cache.put("https://eventcreate.com/e/soon", {}, date.today())
+    cache.put("https://eventcreate.com/e/undated", {})
+    cache.save()
+    assert set(json.loads(path.read_text())) == {
+        "https://eventcreate.com/e/soon",
+        "https://eventcreate.com/e/undated",
+    }
+
+    # A day later the night has passed; old undated entries go too
+    entries = json.loads(path.read_text())
+    entries["https://eventcreate.com/e/soon"]["event_date"] = "2000-01-01"
+    entries["https://eventcreate.com/e/undated"]["fetched_at"] = "2000-01-01T00:00:00+00:00"
+    path.write_text(json.dumps(entries))
+    assert DetailCache(path)._entries == {}
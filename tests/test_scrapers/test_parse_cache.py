@@ -0,0 +1,79 @@
+import os
+from datetime import date
+
+import httpx
+
+from src.models import ScrapedEvent, Source
+from src.scrapers.parse_cache import ParseCache
+from src.scrapers.partiful import PartifulScraper
+
+
+def _event(source_id: str = "1") -> ScrapedEvent:
+    return ScrapedEvent(
+        source=Source.PARTIFUL,
+        source_id=source_id,
+        title="Rooftop Party",
+        event_date=date(2026, 3, 15),
+        artists=["DJ A"],
+    )
+
+
+def test_identical_body_skips_parser(tmp_path):
+    scraper = PartifulScraper(parse_cache=ParseCache(tmp_path))
+    resp = httpx.Response(200, text="<html>same</html>")
+    calls = []
+
+    def parse(html: str) -> list[ScrapedEvent]:
+        calls.append(html)
+        return [_event()]
+
+    first = scraper.parse_cached(resp, parse)
+    second = scraper.parse_cached(resp, parse)
+    assert len(calls) == 1
+    assert second == first
+    assert second[0] is not first[0]  # callers may mutate their copy
+    assert scraper.parse_stats == {"hits": 1, "misses": 1}
+
+
+def test_changed_body_reparses(tmp_path):
+    scraper = PartifulScraper(parse_cache=ParseCache(tmp_path))
+    calls = []
+
+    def parse(html: str) -> list[ScrapedEvent]:
+        calls.append(html)
+        return []
+
+    scraper.parse_cached(httpx.Response(200, text="a"), parse)
+    scraper.parse_cached(httpx.Response(200, text="b"), parse)
+    assert calls == ["a", "b"]
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    cache = ParseCache(tmp_path, max_entries=2)
+    cache.put("old", [_event("1")])
+    cache.put("used", [_event("2")])
+    # Age both entries, then touch "used" so "old" is least recently used
+    for name in ("old", "used"):
+        os.utime(tmp_path / f"{name}.json", (1, 1))
+    assert cache.get("used") is not None
+    cache.put("new", [_event("3")])
+    assert cache.get("old") is None
+    assert cache.get("used") is not None
+    assert cache.get("new") is not None
+
+
+def test_no_cache_parses_directly():
+    scraper = PartifulScraper()
+    result = scraper.parse_cached(httpx.Response(200, text="x"), lambda html: [_event()])
+    assert len(result) == 1
+    assert scraper.parse_stats == {"hits": 0, "misses": 0}
+
+
+def test_key_changes_with_the_year():
+    body = b"<li>Mar 15 - Nowadays</li>"
+    assert ParseCache.key("lightandsound", "listing", body, year=2026) != ParseCache.key(
+        "lightandsound", "listing", body, year=2027
+    )
+    assert ParseCache.key("lightandsound", "listing", body) == ParseCache.key(
+        "lightandsound", "listing", body, year=date.today().year
+    )
@@ -1,5 +1,9 @@
+import asyncio
+import json
 from datetime import date, time
 
+import httpx
+
 from src.scrapers.ra import RAScraper
 
 
@@ -53,3 +57,51 @@ def test_parse_event_minimal():
     assert result.title == "Minimal Event"
     assert result.artists == []
     assert result.venue_name is None
+
+
+def _graphql_server(total: int, delays: dict[int, float] | None = None):
+    """Mock RA GraphQL endpoint returning `total` results, 100 per page."""
+    requested: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = json.loads(request.content)["variables"]["page"]
+        requested.append(page)
+        await asyncio.sleep((delays or {}).get(page, 0))
+        start = (page - 1) * 100
+        items = [
+            {"event": {"id": i, "title": f"Event {i}", "date": "2025-03-15"}}
+            for i in range(start, min(start + 100, total))
+        ]
+        return httpx.Response(
+            200, json={"data": {"eventListings": {"data": items, "totalResults": total}}}
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requested
+
+
+async def test_scrape_fans_out_pages_in_order():
+    # Page 2 finishes last, but results must still come back in page order
+    client, requested = _graphql_server(total=350, delays={2: 0.05})
+    scraper = RAScraper(client=client)
+    events = await scraper.scrape()
+    assert requested[0] == 1
+    assert sorted(requested) == [1, 2, 3, 4]
+    assert [int(e.source_id) for e in events] == list(range(350))
+    await client.aclose()
+
+
+async def test_scrape_respects_max_pages():
+    client, requested = _graphql_server(total=900)
+    scraper = RAScraper(client=client)
+    events = await scraper.scrape(max_pages=3)
+    assert sorted(requested) == [1, 2, 3]
+    assert len(events) == 300
+    await client.aclose()
+
+
+async def test_scrape_empty_first_page():
+    client, requested = _graphql_server(total=0)
+    scraper = RAScraper(client=client)
+    assert await scraper.scrape() == []
+    assert requested == [1]
+    await client.aclose()
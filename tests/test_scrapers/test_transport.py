@@ -0,0 +1,47 @@
+import httpx
+import pytest
+
+from src.scrapers.ra import RAScraper
+from src.scrapers.transport import TransportManager, _HostLimitedTransport
+
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"ok": True})
+
+
+@pytest.mark.asyncio
+async def test_host_limited_transport_counts_requests_per_host():
+    transport = _HostLimitedTransport(httpx.MockTransport(_ok), per_host=2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get("https://ra.co/graphql")
+        await client.get("https://ra.co/graphql")
+        await client.get("https://dice.fm/browse")
+
+    assert transport.requests == 3
+    assert transport.by_host["ra.co"]["requests"] == 2
+    assert transport.by_host["dice.fm"]["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_client_survives_scraper_close():
+    manager = TransportManager()
+    client = manager.client
+    scraper = RAScraper(client=client)
+    await scraper.close()
+    assert not client.is_closed
+    assert manager.client is client
+    await manager.close()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_owned_client_closed_with_scraper():
+    scraper = RAScraper()
+    await scraper.close()
+    assert scraper.client.is_closed
+
+
+def test_stats_before_first_request():
+    stats = TransportManager().stats()
+    assert stats["requests"] == 0
+    assert stats["reused"] == 0